@@ -0,0 +1,40 @@
+"""query indexes
+
+Revision ID: 3427ebe8c0d8
+Revises: 9dd10255cff0
+Create Date: 2026-10-18 03:20:30.689791
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.migration_utils import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "3427ebe8c0d8"
+down_revision: Union[str, None] = "9dd10255cff0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    create_index_concurrently(
+        "ix_topic_word_association_word_id", "topic_word_association", ["word_id"]
+    )
+    create_index_concurrently("ix_topics_language_id", "topics", ["language_id"])
+    create_index_concurrently("ix_topics_user_id_name", "topics", ["user_id", "name"])
+    create_index_concurrently(
+        "ix_words_grammar_element_id", "words", ["grammar_element_id"]
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_words_grammar_element_id", "words")
+    drop_index_concurrently("ix_topics_user_id_name", "topics")
+    drop_index_concurrently("ix_topics_language_id", "topics")
+    drop_index_concurrently(
+        "ix_topic_word_association_word_id", "topic_word_association"
+    )
@@ -1,15 +1,34 @@
-from fastapi import APIRouter
+def _build_main_api_router():
+    # Routers (and everything they pull in) are only imported when the app
+    # is assembled, not whenever some api.* module is imported.
+    from fastapi import APIRouter
 
-from api.router.grammar_element_router import router as grammar_element_router
-from auth.router import router as auth_router
-from api.router.language_router import router as language_router
-from api.router.topic_router import router as topic_router
-from api.router.word_router import router as word_router
+    from api.router.grammar_element_router import router as grammar_element_router
+    from api.router.health_router import router as health_router
+    from auth.router import router as auth_router
+    from api.router.language_router import router as language_router
+    from api.router.quiz_router import router as quiz_router
+    from api.router.review_router import router as review_router
+    from api.router.stats_router import router as stats_router
+    from api.router.topic_router import router as topic_router
+    from api.router.word_router import router as word_router
 
-main_api_router = APIRouter()
+    main_api_router = APIRouter()
 
-main_api_router.include_router(grammar_element_router)
-main_api_router.include_router(auth_router)
-main_api_router.include_router(language_router)
-main_api_router.include_router(topic_router)
-main_api_router.include_router(word_router)
+    main_api_router.include_router(grammar_element_router)
+    main_api_router.include_router(auth_router)
+    main_api_router.include_router(health_router)
+    main_api_router.include_router(language_router)
+    main_api_router.include_router(quiz_router)
+    main_api_router.include_router(review_router)
+    main_api_router.include_router(stats_router)
+    main_api_router.include_router(topic_router)
+    main_api_router.include_router(word_router)
+    return main_api_router
+
+
+def __getattr__(name: str):
+    if name == "main_api_router":
+        globals()[name] = _build_main_api_router()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
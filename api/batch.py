@@ -0,0 +1,28 @@
+from sqlalchemy import Integer, String, any_, literal
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def any_id(ids: list[int]) -> ColumnElement:
+    # Binds the whole list as one array parameter: ``= ANY($1::INTEGER[])``
+    # keeps a single statement (and plan) for any number of ids, where IN
+    # would expand to one parameter per id.
+    return any_(literal(ids, ARRAY(Integer)))
+
+
+def any_text(values: list[str]) -> ColumnElement:
+    # The same single array parameter for string keys.
+    return any_(literal(values, ARRAY(String)))
+
+
+def in_request_order(rows: list[dict], ids: list[int]) -> dict:
+    """Order rows by ``ids``; ids without a row are reported as missing.
+
+    A repeated id is returned once, at its first position.
+    """
+    by_id = {row["id"]: row for row in rows}
+    requested = dict.fromkeys(ids)
+    return {
+        "items": [by_id[id_] for id_ in requested if id_ in by_id],
+        "missing": [id_ for id_ in requested if id_ not in by_id],
+    }
@@ -1,6 +1,7 @@
-from sqlalchemy import select, Result
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.reference_cache import reference_cache
+from src.pagination import PageParams
 from api.schemas.grammar_element_schemas import (
     GrammarElementCreate,
     GrammarElementUpdatePartial,
@@ -23,6 +24,7 @@ async def create_grammar_element(
     new_grammar_element = GrammarElement(**grammar_element.model_dump())
     session.add(new_grammar_element)
     await session.commit()
+    await reference_cache.changed("grammar_elements")
 
     return new_grammar_element
 
@@ -40,11 +42,20 @@ async def update_grammar_element(
             value,
         )
     await session.commit()
+    await reference_cache.changed("grammar_elements")
     return grammar_element
 
 
-async def get_all_speech_parts(session: AsyncSession) -> list[GrammarElement]:
-    stmt = select(GrammarElement).order_by(GrammarElement.id)
-    result: Result = await session.execute(stmt)
-    speech_parts = result.scalars().all()
-    return list(speech_parts)
+async def get_all_speech_parts(
+    page: PageParams,
+) -> dict:
+    return await reference_cache.grammar_elements.page(page)
+
+
+async def delete_the_grammar_element(
+    grammar_element: GrammarElement,
+    session: AsyncSession,
+) -> None:
+    await session.delete(grammar_element)
+    await session.commit()
+    await reference_cache.changed("grammar_elements")
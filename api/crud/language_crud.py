@@ -1,6 +1,7 @@
-from sqlalchemy import select, Result
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.reference_cache import reference_cache
+from src.pagination import PageParams
 from api.schemas.language_schemas import (
     LanguageCreate,
     LanguageUpdatePartial,
@@ -24,6 +25,7 @@ async def create_language(
     new_language = Language(**language.model_dump())
     session.add(new_language)
     await session.commit()
+    await reference_cache.changed("languages")
 
     return new_language
 
@@ -41,13 +43,20 @@ async def update_language(
             value,
         )
     await session.commit()
+    await reference_cache.changed("languages")
     return language
 
 
 async def get_all_languages(
+    page: PageParams,
+) -> dict:
+    return await reference_cache.languages.page(page)
+
+
+async def delete_language(
+    language: Language,
     session: AsyncSession,
-) -> list[Language]:
-    stmt = select(Language).order_by(Language.id)
-    result: Result = await session.execute(stmt)
-    languages = result.scalars().all()
-    return list(languages)
+) -> None:
+    await session.delete(language)
+    await session.commit()
+    await reference_cache.changed("languages")
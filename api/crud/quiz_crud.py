@@ -0,0 +1,203 @@
+import base64
+import hashlib
+import hmac
+import random
+import secrets
+import time
+from collections import defaultdict
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.sampling_cache import distractor_word_ids, sample_ids, topic_word_ids
+from api.schemas.quiz_schemas import MAX_QUIZ_CHOICES, QuizAnswer
+from src.config import settings
+from src.models import Topic, TopicWordAssociation, User, Word
+
+QUIZ_KEY = hashlib.sha256(b"quiz:" + settings.jwt.secret_key.encode()).digest()
+
+
+async def _load_topic_word_ids(topic_id: int, session: AsyncSession) -> tuple[int, ...]:
+    return tuple(
+        await session.scalars(
+            select(TopicWordAssociation.word_id).where(
+                TopicWordAssociation.topic_id == topic_id
+            )
+        )
+    )
+
+
+async def _load_distractor_word_ids(
+    user_id: int,
+    language_id: int,
+    session: AsyncSession,
+) -> dict[int | None, tuple[int, ...]]:
+    # Every word the user has in this language, grouped by grammar element;
+    # None holds them all as the fallback pool.
+    rows = await session.execute(
+        select(Word.grammar_element_id, Word.id)
+        .join(TopicWordAssociation, TopicWordAssociation.word_id == Word.id)
+        .join(Topic, Topic.id == TopicWordAssociation.topic_id)
+        .where(Topic.user_id == user_id, Topic.language_id == language_id)
+        .distinct()
+    )
+    pools = defaultdict(list)
+    for grammar_element_id, word_id in rows:
+        pools[grammar_element_id].append(word_id)
+        pools[None].append(word_id)
+    return {key: tuple(ids) for key, ids in pools.items()}
+
+
+def _answer_mac(user_id: int, nonce: str, issued_at: str, choice_id: int) -> str:
+    message = f"{user_id}.{nonce}.{issued_at}.{choice_id}".encode()
+    digest = hmac.new(QUIZ_KEY, message, hashlib.sha256).digest()[:16]
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+def _question_id(user_id: int, answer_choice_id: int) -> str:
+    # The id commits to the right choice without revealing it, so answers
+    # are checked without keeping quizzes anywhere on the server. The signed
+    # issue time lets old ids expire.
+    nonce = secrets.token_urlsafe(9)
+    issued_at = str(int(time.time()))
+    mac = _answer_mac(user_id, nonce, issued_at, answer_choice_id)
+    return f"{nonce}.{issued_at}.{mac}"
+
+
+def quiz_question_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        detail=[
+            {
+                "type": "quiz_question_unknown",
+                "loc": ["body"],
+                "msg": "This question was not issued to you.",
+            }
+        ],
+    )
+
+
+def quiz_question_expired_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        detail=[
+            {
+                "type": "quiz_question_expired",
+                "loc": ["body"],
+                "msg": "This question has expired, start a new quiz.",
+            }
+        ],
+    )
+
+
+def check_quiz_answer(user_id: int, answer: QuizAnswer) -> dict:
+    nonce, _, rest = answer.question_id.partition(".")
+    issued_at, _, mac = rest.partition(".")
+    # issued_at is only trusted (and parsed) once the mac has matched.
+    for choice_id in range(MAX_QUIZ_CHOICES):
+        if hmac.compare_digest(_answer_mac(user_id, nonce, issued_at, choice_id), mac):
+            if time.time() - int(issued_at) > settings.quiz_question_ttl_seconds:
+                raise quiz_question_expired_error()
+            return {
+                "correct": answer.choice_id == choice_id,
+                "answer_choice_id": choice_id,
+            }
+    raise quiz_question_error()
+
+
+def _pick_distractors(
+    word_id: int,
+    grammar_element_id: int,
+    pools: dict[int | None, tuple[int, ...]],
+    count: int,
+) -> list[int]:
+    picked = sample_ids(pools.get(grammar_element_id, ()), count, exclude=word_id)
+    if len(picked) < count:
+        # Not enough words of this grammar element, top up from the language.
+        extra = sample_ids(pools.get(None, ()), count * 2, exclude=word_id)
+        picked += [item for item in extra if item not in picked][: count - len(picked)]
+    return picked
+
+
+async def build_quiz(
+    topic_id: int,
+    user_id: int,
+    size: int,
+    choices: int,
+    session: AsyncSession,
+) -> dict:
+    result = await session.execute(
+        select(Topic.revision, Topic.language_id, User.vocabulary_revision)
+        .join(User, User.id == Topic.user_id)
+        .where(Topic.id == topic_id, Topic.user_id == user_id)
+    )
+    topic = result.one_or_none()
+    if topic is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Topic not found or does not belong to the authenticated user",
+        )
+    revision, language_id, vocabulary_revision = topic
+
+    # Both id arrays are cached under the revision they were read at, so a
+    # quiz is two primary-key lookups of size * choices rows once warm.
+    topic_ids = await topic_word_ids.get(
+        (topic_id, revision),
+        lambda: _load_topic_word_ids(topic_id, session),
+    )
+    pools = await distractor_word_ids.get(
+        (user_id, language_id, vocabulary_revision),
+        lambda: _load_distractor_word_ids(user_id, language_id, session),
+    )
+
+    target_ids = sample_ids(topic_ids, size)
+    targets = (
+        await session.execute(
+            select(
+                Word.id,
+                Word.learnt_word,
+                Word.definition,
+                Word.grammar_element_id,
+            ).where(Word.id.in_(target_ids))
+        )
+    ).all()
+    distractors = {
+        target.id: _pick_distractors(
+            target.id,
+            target.grammar_element_id,
+            pools,
+            choices - 1,
+        )
+        for target in targets
+    }
+    distractor_ids = {word_id for ids in distractors.values() for word_id in ids}
+    definitions = dict(
+        (
+            await session.execute(
+                select(Word.id, Word.definition).where(Word.id.in_(distractor_ids))
+            )
+        ).all()
+    )
+
+    questions = []
+    for target in targets:
+        options = [target.id] + [
+            word_id for word_id in distractors[target.id] if word_id in definitions
+        ]
+        definitions[target.id] = target.definition
+        random.shuffle(options)
+        # Choices are numbered by position; word ids would give the answer away.
+        questions.append(
+            {
+                "id": _question_id(user_id, options.index(target.id)),
+                "learnt_word": target.learnt_word,
+                "grammar_element_id": target.grammar_element_id,
+                "choices": [
+                    {"id": choice_id, "definition": definitions[word_id]}
+                    for choice_id, word_id in enumerate(options)
+                ],
+            }
+        )
+    random.shuffle(questions)
+    return {"topic_id": topic_id, "questions": questions}
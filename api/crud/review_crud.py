@@ -0,0 +1,162 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    select,
+    case,
+    column,
+    func,
+    values,
+    Insert,
+    Integer,
+    Select,
+    SmallInteger,
+    TIMESTAMP,
+    Update,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from api.schemas.review_schemas import ReviewAnswer
+from src.models import ReviewCard
+
+PASSING_QUALITY = 3
+MIN_EASE = 1300
+MAX_EASE = 10000
+MAX_INTERVAL_DAYS = 36500
+
+CARD_COLUMNS = (
+    ReviewCard.word_id,
+    ReviewCard.due_at,
+    ReviewCard.interval_days,
+    ReviewCard.ease,
+    ReviewCard.repetitions,
+    ReviewCard.lapses,
+    ReviewCard.last_reviewed_at,
+)
+
+
+def create_review_cards(rows: Select | list[dict]) -> Insert:
+    # rows are (user_id, word_id); a word the user already has a card for
+    # keeps its schedule.
+    stmt = pg_insert(ReviewCard)
+    if isinstance(rows, Select):
+        stmt = stmt.from_select(["user_id", "word_id"], rows)
+    else:
+        stmt = stmt.values(rows)
+    return stmt.on_conflict_do_nothing(constraint="idx_unique_user_word_card")
+
+
+def due_cards_stmt(user_id: int, now: datetime, limit: int) -> Select:
+    # ORDER BY due_at LIMIT n walks ix_review_cards_user_id_due_at and stops
+    # after n entries, however many cards the user has.
+    return (
+        select(ReviewCard)
+        .options(joinedload(ReviewCard.word))
+        .where(ReviewCard.user_id == user_id, ReviewCard.due_at <= now)
+        .order_by(ReviewCard.due_at)
+        .limit(limit)
+    )
+
+
+async def get_due_cards(
+    user_id: int,
+    limit: int,
+    session: AsyncSession,
+) -> list[ReviewCard]:
+    result = await session.scalars(due_cards_stmt(user_id, datetime.utcnow(), limit))
+    return list(result)
+
+
+def review_answers_update(answers: list[dict]) -> Update:
+    """One UPDATE ... FROM (VALUES ...) applying SM-2 to every answered card.
+
+    ``answers`` hold user_id, word_id, quality (0-5) and reviewed_at, at most
+    one per card. SET expressions see the card as it was before the update.
+    """
+    rows = values(
+        column("user_id", Integer),
+        column("word_id", Integer),
+        column("quality", SmallInteger),
+        column("reviewed_at", TIMESTAMP),
+        name="answers",
+    ).data(
+        [
+            (
+                answer["user_id"],
+                answer["word_id"],
+                answer["quality"],
+                answer["reviewed_at"],
+            )
+            for answer in answers
+        ]
+    )
+
+    failed = rows.c.quality < PASSING_QUALITY
+    penalty = 5 - rows.c.quality
+    interval_days = case(
+        (failed, 1),
+        (ReviewCard.repetitions == 0, 1),
+        (ReviewCard.repetitions == 1, 6),
+        else_=func.least(
+            MAX_INTERVAL_DAYS,
+            func.ceil(ReviewCard.interval_days * ReviewCard.ease / 1000.0),
+        ).cast(Integer),
+    )
+    ease = case(
+        (failed, ReviewCard.ease),
+        else_=func.least(
+            MAX_EASE,
+            func.greatest(
+                MIN_EASE,
+                ReviewCard.ease + 100 - penalty * (80 + penalty * 20),
+            ),
+        ),
+    )
+
+    return (
+        update(ReviewCard)
+        .where(
+            ReviewCard.user_id == rows.c.user_id,
+            ReviewCard.word_id == rows.c.word_id,
+        )
+        .values(
+            due_at=rows.c.reviewed_at + func.make_interval(0, 0, 0, interval_days),
+            interval_days=interval_days,
+            ease=ease,
+            repetitions=case((failed, 0), else_=ReviewCard.repetitions + 1),
+            lapses=ReviewCard.lapses + case((failed, 1), else_=0),
+            last_reviewed_at=rows.c.reviewed_at,
+        )
+        .returning(ReviewCard.user_id, *CARD_COLUMNS)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def answer_reviews(
+    user_id: int,
+    answers: list[ReviewAnswer],
+    session: AsyncSession,
+) -> dict:
+    reviewed_at = datetime.utcnow()
+    # A card answered twice in one batch keeps the last answer.
+    latest = {answer.word_id: answer.quality for answer in answers}
+    rows = [
+        {
+            "user_id": user_id,
+            "word_id": word_id,
+            "quality": quality,
+            "reviewed_at": reviewed_at,
+        }
+        for word_id, quality in latest.items()
+    ]
+
+    cards = (await session.execute(review_answers_update(rows))).mappings().all()
+    await session.commit()
+
+    updated = {card["word_id"] for card in cards}
+    return {
+        "cards": cards,
+        "missing": [word_id for word_id in latest if word_id not in updated],
+    }
@@ -0,0 +1,78 @@
+from datetime import datetime
+
+from sqlalchemy import select, update, ColumnElement, Select, Update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.etag import make_etag
+from src.models import Topic, User
+
+
+def bump_topic_revisions(
+    topic_ids: Select | list[int],
+    word_delta: int | ColumnElement[int] = 0,
+) -> Update:
+    return (
+        update(Topic)
+        .where(Topic.id.in_(topic_ids))
+        .values(
+            revision=Topic.revision + 1,
+            word_count=Topic.word_count + word_delta,
+            updated_at=datetime.utcnow(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def bump_vocabulary_revisions(user_ids: Select | list[int]) -> Update:
+    # updated_at is set explicitly so the revision bump does not count as a
+    # profile change through its onupdate default.
+    return (
+        update(User)
+        .where(User.id.in_(user_ids))
+        .values(
+            vocabulary_revision=User.vocabulary_revision + 1,
+            updated_at=User.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def topic_owners(topic_ids: Select | list[int]) -> Select:
+    return select(Topic.user_id).where(Topic.id.in_(topic_ids))
+
+
+async def touch_topics(
+    session: AsyncSession,
+    topic_ids: Select | list[int],
+    word_delta: int = 0,
+) -> None:
+    # Word counts show up in the owner's topic list, so its revision moves
+    # along with the topics' own.
+    await session.execute(bump_topic_revisions(topic_ids, word_delta))
+    await session.execute(bump_vocabulary_revisions(topic_owners(topic_ids)))
+
+
+async def get_vocabulary_etag(
+    kind: str,
+    user_id: int,
+    session: AsyncSession,
+) -> str | None:
+    revision = await session.scalar(
+        select(User.vocabulary_revision).where(User.id == user_id)
+    )
+    if revision is None:
+        return None
+    return make_etag(kind, user_id, revision)
+
+
+async def get_topic_words_etag(
+    topic_id: int,
+    user_id: int,
+    session: AsyncSession,
+) -> str | None:
+    revision = await session.scalar(
+        select(Topic.revision).where(Topic.id == topic_id, Topic.user_id == user_id)
+    )
+    if revision is None:
+        return None
+    return make_etag("words", topic_id, revision)
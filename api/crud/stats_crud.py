@@ -0,0 +1,57 @@
+from sqlalchemy import select, func, Insert, Select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models import Topic, UserGrammarElementStats
+
+STATS_COLUMNS = ["user_id", "grammar_element_id", "word_count"]
+
+
+def bump_grammar_element_stats(rows: Select | list[dict]) -> Insert:
+    # rows are (user_id, grammar_element_id, word_count delta); each pair may
+    # appear only once per statement.
+    stmt = pg_insert(UserGrammarElementStats)
+    if isinstance(rows, Select):
+        stmt = stmt.from_select(STATS_COLUMNS, rows)
+    else:
+        stmt = stmt.values(rows)
+    return stmt.on_conflict_do_update(
+        constraint="idx_unique_user_grammar_element",
+        set_={
+            "word_count": UserGrammarElementStats.word_count + stmt.excluded.word_count
+        },
+    )
+
+
+async def get_user_stats(user_id: int, session: AsyncSession) -> dict:
+    # Both queries read precomputed counters: one row per topic and one per
+    # grammar element the user has words in.
+    languages_stmt = (
+        select(
+            Topic.language_id,
+            func.count().label("topic_count"),
+            func.sum(Topic.word_count).label("word_count"),
+        )
+        .where(Topic.user_id == user_id)
+        .group_by(Topic.language_id)
+        .order_by(Topic.language_id)
+    )
+    grammar_elements_stmt = (
+        select(
+            UserGrammarElementStats.grammar_element_id,
+            UserGrammarElementStats.word_count,
+        )
+        .where(
+            UserGrammarElementStats.user_id == user_id,
+            UserGrammarElementStats.word_count > 0,
+        )
+        .order_by(UserGrammarElementStats.grammar_element_id)
+    )
+    languages = (await session.execute(languages_stmt)).mappings().all()
+    grammar_elements = (await session.execute(grammar_elements_stmt)).mappings().all()
+
+    return {
+        "total_words": sum(language["word_count"] for language in languages),
+        "languages": languages,
+        "grammar_elements": grammar_elements,
+    }
@@ -1,17 +1,50 @@
+import logging
+from datetime import datetime, timedelta
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
-from sqlalchemy import select, Result, delete
+from sqlalchemy import (
+    select,
+    exists,
+    func,
+    literal,
+    update,
+    ColumnElement,
+    Delete,
+    Exists,
+    Select,
+    Update,
+    delete,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
+from api.batch import any_id, in_request_order
+from api.crud.revision_crud import (
+    bump_vocabulary_revisions,
+    touch_topics,
+)
+from api.crud.stats_crud import bump_grammar_element_stats
+from api.fast_json import fetch_dicts, schema_columns
+from src.pagination import PageParams, paginate
 from api.schemas.topic_schemas import (
     TopicCreate,
     TopicUpdatePartial,
     Topic as PydanticTopic,
 )
-from src.models import Topic, User, TopicWordAssociation
-from auth.utils import get_current_user
+from src.config import settings
+from src.models import (
+    db_helper,
+    Topic,
+    TopicDeleteJob,
+    User,
+    TopicWordAssociation,
+    Word,
+)
+from src.models.topic_delete_job import ACTIVE_STATUSES
+from auth.utils import CurrentUser, get_current_user
+
+logger = logging.getLogger(__name__)
 
 
 async def get_topic_by_id(
@@ -33,14 +66,16 @@ async def get_topic_by_id(
 #
 #     return new_topic
 
+
 async def create_topic(
     topic: TopicCreate,
     session: AsyncSession,
-    user: Annotated[dict, Depends(get_current_user)],
+    user: Annotated[CurrentUser, Depends(get_current_user)],
 ) -> Topic:
 
-    new_topic = Topic(**topic.model_dump(), user_id=user["id"])
+    new_topic = Topic(**topic.model_dump(), user_id=user.id)
     session.add(new_topic)
+    await session.execute(bump_vocabulary_revisions([user.id]))
     await session.commit()
 
     return new_topic
@@ -58,73 +93,302 @@ async def update_topic(
             name,
             value,
         )
+    await touch_topics(session, [topic.id])
     await session.commit()
     return topic
 
 
 async def get_all_topics(
     session: AsyncSession,
-) -> list[Topic]:
-    stmt = select(Topic).order_by(Topic.id)
-    result: Result = await session.execute(stmt)
-    topics = result.scalars().all()
-    return list(topics)
+    page: PageParams,
+) -> dict:
+    return await paginate(session, select(Topic), Topic.id, page)
 
 
 async def get_all_topics_for_auth_user(
-    user: Annotated[dict, Depends(get_current_user)],
+    user: Annotated[CurrentUser, Depends(get_current_user)],
     session: AsyncSession,
-) -> list[Topic]:
-    stmt = select(Topic).where(Topic.user_id == user["id"]).order_by(Topic.id)
-    result: Result = await session.execute(stmt)
-    topics = result.scalars().all()
-    return list(topics)
+) -> list[dict]:
+    stmt = (
+        select(*schema_columns(Topic, PydanticTopic))
+        .where(Topic.user_id == user.id)
+        .order_by(Topic.id)
+    )
+    return await fetch_dicts(session, stmt)
+
+
+async def get_user_topics_by_ids(
+    ids: list[int],
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    session: AsyncSession,
+) -> dict:
+    stmt = select(*schema_columns(Topic, PydanticTopic)).where(
+        Topic.id == any_id(ids),
+        Topic.user_id == user.id,
+    )
+    return in_request_order(await fetch_dicts(session, stmt), ids)
+
+
+def topic_delete_forbidden_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=[
+            {
+                "type": "topic_id_taken",
+                "loc": ["body"],
+                "msg": f"You do not have permission to delete this topic.",
+            }
+        ],
+    )
+
+
+def topic_being_deleted_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=[
+            {
+                "type": "topic_being_deleted",
+                "loc": ["body"],
+                "msg": "This topic is being deleted.",
+            }
+        ],
+    )
+
+
+def topic_delete_job_not_found_error(job_id: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=[
+            {
+                "type": "job_id_taken",
+                "loc": ["path"],
+                "msg": f"Delete job {job_id} not found!",
+            }
+        ],
+    )
+
+
+def _is_active_job() -> ColumnElement[bool]:
+    # The statuses are rendered inline so the condition matches the partial
+    # index ix_topic_delete_jobs_active_topic_id in every plan.
+    return TopicDeleteJob.status.in_(
+        [literal(value, literal_execute=True) for value in ACTIVE_STATUSES]
+    )
+
+
+def topic_is_being_deleted(topic_id: int | ColumnElement[int]) -> Exists:
+    return exists().where(TopicDeleteJob.topic_id == topic_id, _is_active_job())
+
+
+def _topic_words(topic_id: int) -> Select:
+    return select(TopicWordAssociation.word_id).where(
+        TopicWordAssociation.topic_id == topic_id
+    )
+
+
+def _delete_topic_stmt(topic_id: int, user_id: int) -> Delete:
+    # WITH deleted_words AS (DELETE FROM words WHERE id IN (...)),
+    #      removed_stats AS (INSERT INTO user_grammar_element_stats ...)
+    # DELETE FROM topics WHERE id = :t AND user_id = :u RETURNING id
+    # Associations go with the ondelete="CASCADE" foreign keys; every CTE
+    # sees the words as they were before the statement.
+    owned_topic = select(Topic.id).where(Topic.id == topic_id, Topic.user_id == user_id)
+    deleted_words = (
+        delete(Word)
+        .where(
+            Word.id.in_(
+                select(TopicWordAssociation.word_id).where(
+                    TopicWordAssociation.topic_id.in_(owned_topic)
+                )
+            )
+        )
+        .cte("deleted_words")
+    )
+    removed_stats = bump_grammar_element_stats(
+        select(literal(user_id), Word.grammar_element_id, -func.count())
+        .join(TopicWordAssociation, TopicWordAssociation.word_id == Word.id)
+        .where(TopicWordAssociation.topic_id.in_(owned_topic))
+        .group_by(Word.grammar_element_id)
+    ).cte("removed_stats")
+    return (
+        delete(Topic)
+        .where(Topic.id == topic_id, Topic.user_id == user_id)
+        .returning(Topic.id)
+        .add_cte(deleted_words, removed_stats)
+        .execution_options(synchronize_session=False)
+    )
 
 
 async def delete_the_topic(
-    user: Annotated[dict, Depends(get_current_user)],
+    user: Annotated[CurrentUser, Depends(get_current_user)],
     topic_id: int,
     session: AsyncSession,
 ) -> None:
+    deleted_topic = await session.scalar(_delete_topic_stmt(topic_id, user.id))
 
-    topic = await get_topic_by_id(
-        session=session,
-        topic_id=topic_id,
-    )
+    if deleted_topic is None:
+        await session.rollback()
+        raise topic_delete_forbidden_error()
 
-    result = await session.execute(
-        select(Topic)
-        .where(
-            Topic.id == topic.id,
-            Topic.user_id == user["id"],
+    await session.execute(bump_vocabulary_revisions([user.id]))
+    await session.commit()
+
+
+TOPIC_DELETE_JOB_COLUMNS = (
+    TopicDeleteJob.id,
+    TopicDeleteJob.topic_id,
+    TopicDeleteJob.status,
+    TopicDeleteJob.total_words,
+    TopicDeleteJob.deleted_words,
+)
+
+
+async def start_topic_delete_job(
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    topic_id: int,
+    session: AsyncSession,
+) -> tuple[dict, bool]:
+    """Create the topic's delete job, or return the one already active.
+
+    The second value says whether the caller should run the job: true for a
+    new job and for an active one that no worker has moved on for
+    ``topic_delete_stale_seconds`` (its worker died), false otherwise.
+    """
+    # The word count is the topic's own counter, so starting a job reads no
+    # words; the partial unique index allows one active job per topic.
+    new_job = (
+        pg_insert(TopicDeleteJob)
+        .from_select(
+            ["user_id", "topic_id", "total_words"],
+            select(Topic.user_id, Topic.id, Topic.word_count).where(
+                Topic.id == topic_id, Topic.user_id == user.id
+            ),
+        )
+        .on_conflict_do_nothing(
+            index_elements=[TopicDeleteJob.topic_id],
+            index_where=_is_active_job(),
         )
+        .returning(*TOPIC_DELETE_JOB_COLUMNS)
     )
-    topic = result.scalars().first()
-
-    if topic is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=[
-                {
-                    "type": "topic_id_taken",
-                    "loc": ["body"],
-                    "msg": f"You do not have permission to delete this topic.",
-                }
-            ],
+    job = (await session.execute(new_job)).mappings().one_or_none()
+    run = job is not None
+
+    if job is None:
+        stale_before = datetime.utcnow() - timedelta(
+            seconds=settings.topic_delete_stale_seconds
+        )
+        claimed = (
+            update(TopicDeleteJob)
+            .where(
+                TopicDeleteJob.topic_id == topic_id,
+                TopicDeleteJob.user_id == user.id,
+                _is_active_job(),
+                TopicDeleteJob.updated_at < stale_before,
+            )
+            .values(updated_at=datetime.utcnow())
+            .returning(*TOPIC_DELETE_JOB_COLUMNS)
         )
+        job = (await session.execute(claimed)).mappings().one_or_none()
+        run = job is not None
 
-    result = await session.execute(
-        select(TopicWordAssociation)
-        .options(
-            joinedload(TopicWordAssociation.word))
-        .where(
-            TopicWordAssociation.topic_id == topic.id,
+    if job is None:
+        active = select(*TOPIC_DELETE_JOB_COLUMNS).where(
+            TopicDeleteJob.topic_id == topic_id,
+            TopicDeleteJob.user_id == user.id,
+            _is_active_job(),
         )
-    )
-    associations = result.scalars().all()
+        job = (await session.execute(active)).mappings().one_or_none()
 
-    for association in associations:
-        await session.delete(association.word)
+    if job is None:
+        await session.rollback()
+        raise topic_delete_forbidden_error()
 
-    await session.delete(topic)
+    job = dict(job)
     await session.commit()
+    return job, run
+
+
+def _update_job(job_id: int, **values) -> Update:
+    return (
+        update(TopicDeleteJob)
+        .where(TopicDeleteJob.id == job_id)
+        .values(**values, updated_at=datetime.utcnow())
+    )
+
+
+async def run_topic_delete_job(job_id: int) -> None:
+    # Deletes the words in batches, each in its own short transaction that
+    # also records the progress, so a huge topic never holds row locks for
+    # long; the topic row goes last.
+    batch_size = settings.topic_delete_batch_size
+    async with db_helper.session_factory() as session:
+        job = (
+            await session.execute(
+                _update_job(job_id, status="running").returning(
+                    TopicDeleteJob.topic_id, TopicDeleteJob.user_id
+                )
+            )
+        ).one()
+        await session.commit()
+        try:
+            while True:
+                deleted_words = (
+                    delete(Word)
+                    .where(Word.id.in_(_topic_words(job.topic_id).limit(batch_size)))
+                    .returning(Word.grammar_element_id)
+                    .cte("deleted_words")
+                )
+                removed_stats = bump_grammar_element_stats(
+                    select(
+                        literal(job.user_id),
+                        deleted_words.c.grammar_element_id,
+                        -func.count(),
+                    ).group_by(deleted_words.c.grammar_element_id)
+                ).cte("removed_stats")
+                deleted_count = select(func.count()).select_from(deleted_words)
+                progress = _update_job(
+                    job_id,
+                    deleted_words=TopicDeleteJob.deleted_words
+                    + deleted_count.scalar_subquery(),
+                ).cte("progress")
+                deleted = await session.scalar(
+                    deleted_count.add_cte(removed_stats, progress)
+                )
+                if not deleted:
+                    break
+                await touch_topics(session, [job.topic_id], word_delta=-deleted)
+                await session.commit()
+
+            # The same statement as DELETE /topic/{topic_id}/, so any word
+            # that got in after the last batch goes with the topic.
+            await session.execute(_delete_topic_stmt(job.topic_id, job.user_id))
+            await session.execute(bump_vocabulary_revisions([job.user_id]))
+            await session.execute(_update_job(job_id, status="done"))
+            await session.commit()
+        except Exception:
+            logger.exception("Deleting topic %s failed", job.topic_id)
+            await session.rollback()
+            await session.execute(_update_job(job_id, status="failed"))
+            await session.commit()
+
+
+async def get_topic_delete_job(
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    job_id: int,
+    session: AsyncSession,
+) -> dict:
+    job = (
+        (
+            await session.execute(
+                select(*TOPIC_DELETE_JOB_COLUMNS).where(
+                    TopicDeleteJob.id == job_id,
+                    TopicDeleteJob.user_id == user.id,
+                )
+            )
+        )
+        .mappings()
+        .one_or_none()
+    )
+    if job is None:
+        raise topic_delete_job_not_found_error(job_id)
+    return job
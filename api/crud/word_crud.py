@@ -1,17 +1,68 @@
-from typing import Annotated
+import csv
+import io
+import json
+import re
+import zlib
+from collections import Counter
+from typing import Annotated, AsyncIterator
 
-from fastapi import Depends, status, HTTPException
-from sqlalchemy import select, Result, delete
+from fastapi import Depends, status, HTTPException, Request
+from pydantic import ValidationError
+from sqlalchemy import (
+    select,
+    insert,
+    update,
+    exists,
+    literal,
+    true,
+    false,
+    func,
+    or_,
+    tuple_,
+    Float,
+    Result,
+    Select,
+    CTE,
+    delete,
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.crud.topic_crud import get_topic_by_id
+from api.batch import any_id, any_text, in_request_order
+from api.crud.revision_crud import (
+    bump_topic_revisions,
+    bump_vocabulary_revisions,
+    topic_owners,
+    touch_topics,
+)
+from api.crud.review_crud import create_review_cards
+from api.crud.stats_crud import bump_grammar_element_stats
+from api.crud.topic_crud import topic_being_deleted_error, topic_is_being_deleted
+from api.fast_json import fetch_dicts, schema_columns
+from src.pagination import PageParams, paginate, encode_cursor
 from api.schemas.word_schemas import (
     WordCreate,
     WordUpdatePartial,
     Word as PydanticWord,
 )
-from src.models import Word, TopicWordAssociation, Topic
-from auth.utils import get_current_user
+from src.config import settings
+from src.models import (
+    db_helper,
+    GrammarElement,
+    Word,
+    TopicWordAssociation,
+    Topic,
+)
+from auth.utils import CurrentUser, get_current_user
+
+EXPORT_BATCH_SIZE = 1000
+UNIQUE_VIOLATION = "23505"
+FOREIGN_KEY_VIOLATION = "23503"
+GRAMMAR_ELEMENT_FOREIGN_KEYS = {
+    "words_grammar_element_id_fkey",
+    "user_grammar_element_stats_grammar_element_id_fkey",
+}
+SEARCH_TERM = re.compile(r"\w+")
 
 
 async def get_word_by_id(
@@ -21,59 +72,578 @@ async def get_word_by_id(
     return await session.get(Word, word_id)
 
 
+async def get_user_words_by_ids(
+    ids: list[int],
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    session: AsyncSession,
+) -> dict:
+    stmt = select(*schema_columns(Word, PydanticWord)).where(
+        Word.id == any_id(ids),
+        exists().where(
+            TopicWordAssociation.word_id == Word.id,
+            TopicWordAssociation.topic_id == Topic.id,
+            Topic.user_id == user.id,
+        ),
+    )
+    return in_request_order(await fetch_dicts(session, stmt), ids)
+
+
+def word_duplicate_error(learnt_word: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        detail=[
+            {
+                "type": "word_duplicate",
+                "loc": ["body"],
+                "msg": f'This word "{learnt_word}" is created in this topic now',
+            }
+        ],
+    )
+
+
+def grammar_element_not_found_error(grammar_element_id: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=[
+            {
+                "type": "grammar_element_id_taken",
+                "loc": ["body"],
+                "msg": f"Speech part with id {grammar_element_id} not found!",
+            }
+        ],
+    )
+
+
+def _violated_constraint(exc: IntegrityError) -> tuple[str | None, str | None]:
+    # asyncpg's own exception, kept as the cause, carries the constraint name.
+    return (
+        getattr(exc.orig, "sqlstate", None),
+        getattr(exc.orig.__cause__, "constraint_name", None),
+    )
+
+
+def _is_duplicate_word(exc: IntegrityError) -> bool:
+    return _violated_constraint(exc) == (
+        UNIQUE_VIOLATION,
+        "idx_unique_topic_learnt_word",
+    )
+
+
+def _is_missing_grammar_element(exc: IntegrityError) -> bool:
+    sqlstate, constraint = _violated_constraint(exc)
+    return (
+        sqlstate == FOREIGN_KEY_VIOLATION and constraint in GRAMMAR_ELEMENT_FOREIGN_KEYS
+    )
+
+
 async def create_word(
     topic_id: int,
     word: WordCreate,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
     session: AsyncSession,
-    # user: Annotated[dict, Depends(get_current_user)],
-) -> Word:
+) -> dict:
+    # Ownership check, duplicate check and both inserts run as one statement:
+    #
+    #   WITH owned_topic AS (SELECT ... FROM topics WHERE id = :t AND user_id = :u),
+    #        duplicate AS (SELECT ... FROM topic_word_association WHERE ...),
+    #        new_word AS (INSERT INTO words SELECT ... WHERE EXISTS owned_topic
+    #                     AND NOT EXISTS duplicate AND NOT EXISTS (active
+    #                     topic_delete_jobs row) RETURNING ...),
+    #        new_association AS (INSERT INTO topic_word_association ...),
+    #        touched_topic AS (UPDATE topics SET word_count = word_count + 1 ...),
+    #        touched_user AS (UPDATE users SET vocabulary_revision = ...),
+    #        new_stats AS (INSERT INTO user_grammar_element_stats ... ON CONFLICT ...),
+    #        new_card AS (INSERT INTO review_cards ...)
+    #   SELECT owned, deleting, duplicate, new_word.* FROM flags LEFT JOIN new_word
+    #
+    # idx_unique_topic_learnt_word catches a concurrent insert of the same word.
+    owned_topic = (
+        select(Topic.id)
+        .where(Topic.id == topic_id, Topic.user_id == user.id)
+        .cte("owned_topic")
+    )
+    duplicate = (
+        select(TopicWordAssociation.id)
+        .where(
+            TopicWordAssociation.topic_id == topic_id,
+            TopicWordAssociation.learnt_word == word.learnt_word,
+        )
+        .cte("duplicate")
+    )
+    values = word.model_dump()
+    columns = Word.__table__.c
+    new_word = (
+        insert(Word)
+        .from_select(
+            list(values),
+            select(
+                *(literal(value, columns[name].type) for name, value in values.items())
+            ).where(
+                exists(owned_topic.select()),
+                ~exists(duplicate.select()),
+                ~topic_is_being_deleted(topic_id),
+            ),
+        )
+        .returning(columns.id, *(columns[name] for name in values))
+        .cte("new_word")
+    )
+    new_association = (
+        insert(TopicWordAssociation)
+        .from_select(
+            ["word_id", "topic_id", "learnt_word"],
+            select(new_word.c.id, literal(topic_id), new_word.c.learnt_word),
+        )
+        .returning(TopicWordAssociation.topic_id)
+        .cte("new_association")
+    )
+    touched_topic = bump_topic_revisions(
+        select(new_association.c.topic_id), word_delta=1
+    ).cte("touched_topic")
+    touched_user = (
+        bump_vocabulary_revisions([user.id])
+        .where(exists(new_association.select()))
+        .cte("touched_user")
+    )
+    new_stats = bump_grammar_element_stats(
+        select(literal(user.id), new_word.c.grammar_element_id, literal(1))
+    ).cte("new_stats")
+    new_card = create_review_cards(select(literal(user.id), new_word.c.id)).cte(
+        "new_card"
+    )
+    flags = select(
+        exists(owned_topic.select()).label("owned"),
+        topic_is_being_deleted(topic_id).label("deleting"),
+        exists(duplicate.select()).label("duplicate"),
+    ).subquery("flags")
+    stmt = (
+        select(flags.c.owned, flags.c.deleting, flags.c.duplicate, new_word)
+        .select_from(flags.outerjoin(new_word, true()))
+        .add_cte(new_association, touched_topic, touched_user, new_stats, new_card)
+    )
+
+    try:
+        result = (await session.execute(stmt)).mappings().one()
+    except IntegrityError as exc:
+        await session.rollback()
+        if _is_duplicate_word(exc):
+            raise word_duplicate_error(word.learnt_word)
+        if _is_missing_grammar_element(exc):
+            raise grammar_element_not_found_error(word.grammar_element_id)
+        raise
+
+    if not result["owned"]:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=[
+                {
+                    "type": "topic_id_taken",
+                    "loc": ["body"],
+                    "msg": f"You do not have permission to create a word in this topic.",
+                }
+            ],
+        )
+
+    if result["deleting"]:
+        await session.rollback()
+        raise topic_being_deleted_error()
+
+    if result["duplicate"]:
+        await session.rollback()
+        raise word_duplicate_error(word.learnt_word)
+
+    await session.commit()
+    return {"id": result["id"], **values}
+
+
+def import_too_large_error(msg: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=[{"type": "import_too_large", "loc": ["body"], "msg": msg}],
+    )
+
+
+async def read_import_body(request: Request) -> bytes:
+    # The upload is read only up to the configured size, so an oversized
+    # file is refused before it is held in memory as a whole.
+    max_bytes = settings.word_import_max_bytes
+    too_large = import_too_large_error(
+        f"The uploaded file is larger than {max_bytes} bytes."
+    )
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        raise too_large
+
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > max_bytes:
+            raise too_large
+    return bytes(body)
+
+
+def parse_word_rows(body: bytes, content_type: str) -> list[dict]:
+    if content_type.startswith("text/csv"):
+        reader = csv.DictReader(io.StringIO(body.decode("utf-8-sig")))
+        return [dict(row) for row in reader]
 
-    current_topic = await get_topic_by_id(session, topic_id)
+    if content_type.startswith(("application/x-ndjson", "application/jsonl")):
+        return [json.loads(line) for line in body.splitlines() if line.strip()]
 
-    new_word = Word(**word.model_dump())
+    rows = json.loads(body)
+    if not isinstance(rows, list):
+        raise ValueError("Expected a JSON array of words.")
+    return rows
 
-    new_word.topics_details.append(
-        TopicWordAssociation(topic=current_topic, word=new_word)
+
+async def _check_word_import(
+    session: AsyncSession,
+    topic_id: int,
+    words: list[tuple[int, WordCreate]],
+) -> tuple[list[tuple[int, WordCreate]], list[dict]]:
+    # One set-based lookup per batch for words already in the topic and for
+    # grammar elements that do not exist, instead of a query per row.
+    existing_words = set(
+        await session.scalars(
+            select(TopicWordAssociation.learnt_word).where(
+                TopicWordAssociation.topic_id == topic_id,
+                TopicWordAssociation.learnt_word
+                == any_text(list({word.learnt_word for _, word in words})),
+            )
+        )
+    )
+    known_grammar_elements = set(
+        await session.scalars(
+            select(GrammarElement.id).where(
+                GrammarElement.id
+                == any_id(list({word.grammar_element_id for _, word in words}))
+            )
+        )
     )
 
-    session.add(new_word)
+    accepted = []
+    errors = []
+    for number, word in words:
+        if word.learnt_word in existing_words:
+            msg = f'This word "{word.learnt_word}" is created in this topic now'
+        elif word.grammar_element_id not in known_grammar_elements:
+            msg = f"Speech part with id {word.grammar_element_id} not found!"
+        else:
+            existing_words.add(word.learnt_word)
+            accepted.append((number, word))
+            continue
+        errors.append({"row": number, "learnt_word": word.learnt_word, "msg": msg})
+    return accepted, errors
+
+
+async def _import_word_chunk(
+    session: AsyncSession,
+    topic_id: int,
+    user_id: int,
+    chunk: list[WordCreate],
+) -> None:
+    word_ids = list(
+        await session.scalars(
+            insert(Word).returning(Word.id, sort_by_parameter_order=True),
+            [word.model_dump() for word in chunk],
+        )
+    )
+    await session.execute(
+        insert(TopicWordAssociation),
+        [
+            {
+                "topic_id": topic_id,
+                "word_id": word_id,
+                "learnt_word": word.learnt_word,
+            }
+            for word_id, word in zip(word_ids, chunk)
+        ],
+    )
+    await session.execute(
+        create_review_cards(
+            [{"user_id": user_id, "word_id": word_id} for word_id in word_ids]
+        )
+    )
+    await touch_topics(session, [topic_id], word_delta=len(chunk))
+    await session.execute(
+        bump_grammar_element_stats(
+            [
+                {
+                    "user_id": user_id,
+                    "grammar_element_id": grammar_element_id,
+                    "word_count": word_count,
+                }
+                for grammar_element_id, word_count in Counter(
+                    word.grammar_element_id for word in chunk
+                ).items()
+            ]
+        )
+    )
     await session.commit()
 
-    return new_word
+
+async def import_words(
+    topic_id: int,
+    user_id: int,
+    rows: list[dict],
+    session: AsyncSession,
+) -> dict:
+    if len(rows) > settings.word_import_max_rows:
+        raise import_too_large_error(
+            f"At most {settings.word_import_max_rows} words can be imported at once."
+        )
+
+    errors = []
+    words: list[tuple[int, WordCreate]] = []
+
+    for number, row in enumerate(rows, start=1):
+        try:
+            words.append((number, WordCreate.model_validate(row)))
+        except ValidationError as exc:
+            learnt_word = row.get("learnt_word") if isinstance(row, dict) else None
+            if not isinstance(learnt_word, str):
+                # Echoed back as is; anything else would fail the response.
+                learnt_word = None
+            errors.append(
+                {
+                    "row": number,
+                    "learnt_word": learnt_word,
+                    "msg": exc.errors()[0]["msg"],
+                }
+            )
+
+    accepted, rejected = await _check_word_import(session, topic_id, words)
+    errors.extend(rejected)
+
+    created = 0
+    chunk_size = settings.word_import_chunk_size
+    for start in range(0, len(accepted), chunk_size):
+        chunk = accepted[start : start + chunk_size]
+        while chunk:
+            try:
+                await _import_word_chunk(
+                    session, topic_id, user_id, [word for _, word in chunk]
+                )
+            except IntegrityError as exc:
+                # A concurrent request added one of these words or deleted a
+                # grammar element after the lookup above. Earlier chunks stay
+                # committed; this one is checked again and retried without
+                # the rows that now fail.
+                await session.rollback()
+                if not (_is_duplicate_word(exc) or _is_missing_grammar_element(exc)):
+                    raise
+                chunk, rejected = await _check_word_import(session, topic_id, chunk)
+                if not rejected:
+                    raise
+                errors.extend(rejected)
+            else:
+                created += len(chunk)
+                break
+
+    errors.sort(key=lambda error: error["row"])
+    return {"created": created, "errors": errors}
+
+
+def _word_topics(word_id: int) -> Select:
+    return select(TopicWordAssociation.topic_id).where(
+        TopicWordAssociation.word_id == word_id
+    )
+
+
+def _word_grammar_element_stats(
+    word_id: int,
+    grammar_element_id: int,
+    sign: int,
+) -> Select:
+    # One stats row per owner of a topic the word is in.
+    return (
+        select(Topic.user_id, literal(grammar_element_id), func.count() * sign)
+        .join(TopicWordAssociation, TopicWordAssociation.topic_id == Topic.id)
+        .where(TopicWordAssociation.word_id == word_id)
+        .group_by(Topic.user_id)
+    )
+
+
+def word_not_found_error(word_id: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=[
+            {
+                "type": "word_id_taken",
+                "loc": ["body"],
+                "msg": f"Word with id {word_id} not found!",
+            }
+        ],
+    )
+
+
+def _changed_grammar_element_stats(
+    word: CTE,
+    other: CTE,
+    sign: int,
+) -> Select:
+    # One stats row per owner of a topic the word is in, for word's grammar
+    # element, if it differs from other's.
+    return (
+        select(Topic.user_id, word.c.grammar_element_id, func.count() * sign)
+        .select_from(word)
+        .join(other, other.c.id == word.c.id)
+        .join(TopicWordAssociation, TopicWordAssociation.word_id == word.c.id)
+        .join(Topic, Topic.id == TopicWordAssociation.topic_id)
+        .where(word.c.grammar_element_id != other.c.grammar_element_id)
+        .group_by(Topic.user_id, word.c.grammar_element_id)
+    )
 
 
 async def update_word(
-    word_update: WordUpdatePartial,
-    word: PydanticWord,
+    word_id: int,
+    word_update: WordCreate | WordUpdatePartial,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
     session: AsyncSession,
-    partial: bool = True,
-) -> Word:
-    for name, value in word_update.model_dump(exclude_unset=partial).items():
-        setattr(
-            word,
-            name,
-            value,
+) -> dict:
+    # As in create_word, the checks and every write run as one statement:
+    #
+    #   WITH word_topics AS (SELECT topic_id FROM topic_word_association WHERE word_id = :w),
+    #        old_word AS (SELECT id, grammar_element_id FROM words WHERE id = :w),
+    #        owned_topic AS (SELECT ... FROM topics WHERE id IN word_topics AND user_id = :u),
+    #        duplicate AS (SELECT ... FROM topic_word_association
+    #                      WHERE topic_id IN word_topics AND word_id != :w AND learnt_word = :l),
+    #        updated_word AS (UPDATE words SET ... WHERE id = :w AND EXISTS owned_topic
+    #                         AND NOT EXISTS duplicate RETURNING ...),
+    #        updated_association AS (UPDATE topic_word_association SET learnt_word = :l ...),
+    #        touched_topic AS (UPDATE topics SET revision = revision + 1 ...),
+    #        touched_user AS (UPDATE users SET vocabulary_revision = ...),
+    #        old_stats, new_stats AS (INSERT INTO user_grammar_element_stats ... ON CONFLICT ...)
+    #   SELECT found, owned, duplicate, updated_word.* FROM flags LEFT JOIN updated_word
+    #
+    # Every part sees the rows as they were before the statement, so old_word
+    # still has the previous grammar element. The duplicate check covers the
+    # topics the word is actually in.
+    values = word_update.model_dump(exclude_unset=True)
+    word_topics = (
+        select(TopicWordAssociation.topic_id)
+        .where(TopicWordAssociation.word_id == word_id)
+        .cte("word_topics")
+    )
+    old_word = (
+        select(Word.id, Word.grammar_element_id)
+        .where(Word.id == word_id)
+        .cte("old_word")
+    )
+    owned_topic = (
+        select(Topic.id)
+        .where(Topic.id.in_(select(word_topics.c.topic_id)), Topic.user_id == user.id)
+        .cte("owned_topic")
+    )
+    duplicate = None
+    if "learnt_word" in values:
+        duplicate = (
+            select(TopicWordAssociation.id)
+            .where(
+                TopicWordAssociation.topic_id.in_(select(word_topics.c.topic_id)),
+                TopicWordAssociation.word_id != word_id,
+                TopicWordAssociation.learnt_word == values["learnt_word"],
+            )
+            .cte("duplicate")
+        )
+
+    conditions = [Word.id == word_id, exists(owned_topic.select())]
+    if duplicate is not None:
+        conditions.append(~exists(duplicate.select()))
+    updated_word = (
+        update(Word)
+        .where(*conditions)
+        # An empty update still checks ownership and returns the word.
+        .values(values or {"id": Word.id})
+        .returning(*schema_columns(Word, PydanticWord))
+        .cte("updated_word")
+    )
+
+    updated_topics = select(word_topics.c.topic_id).where(exists(updated_word.select()))
+    writes = [
+        bump_topic_revisions(updated_topics).cte("touched_topic"),
+        bump_vocabulary_revisions(topic_owners(updated_topics)).cte("touched_user"),
+    ]
+    if "learnt_word" in values:
+        writes.append(
+            update(TopicWordAssociation)
+            .where(TopicWordAssociation.word_id.in_(select(updated_word.c.id)))
+            .values(learnt_word=values["learnt_word"])
+            .execution_options(synchronize_session=False)
+            .cte("updated_association")
+        )
+    if "grammar_element_id" in values:
+        writes += [
+            bump_grammar_element_stats(
+                _changed_grammar_element_stats(old_word, updated_word, -1)
+            ).cte("old_stats"),
+            bump_grammar_element_stats(
+                _changed_grammar_element_stats(updated_word, old_word, 1)
+            ).cte("new_stats"),
+        ]
+
+    flags = select(
+        exists(old_word.select()).label("found"),
+        exists(owned_topic.select()).label("owned"),
+        (exists(duplicate.select()) if duplicate is not None else false()).label(
+            "duplicate"
+        ),
+    ).subquery("flags")
+    stmt = (
+        select(flags.c.found, flags.c.owned, flags.c.duplicate, updated_word)
+        .select_from(flags.outerjoin(updated_word, true()))
+        .add_cte(*writes)
+    )
+
+    try:
+        result = (await session.execute(stmt)).mappings().one()
+    except IntegrityError as exc:
+        await session.rollback()
+        if _is_duplicate_word(exc):
+            raise word_duplicate_error(values["learnt_word"])
+        if _is_missing_grammar_element(exc):
+            raise grammar_element_not_found_error(values["grammar_element_id"])
+        raise
+
+    if not result["found"]:
+        await session.rollback()
+        raise word_not_found_error(word_id)
+
+    if not result["owned"]:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=[
+                {
+                    "type": "word_id_taken",
+                    "loc": ["body"],
+                    "msg": "You do not have permission to update this word.",
+                }
+            ],
         )
+
+    if result["duplicate"]:
+        await session.rollback()
+        raise word_duplicate_error(values["learnt_word"])
+
     await session.commit()
-    return word
+    return {name: result[name] for name in PydanticWord.model_fields}
 
 
 async def get_all_words(
     session: AsyncSession,
-) -> list[Word]:
-    stmt = select(Word).order_by(Word.id)
-    result: Result = await session.execute(stmt)
-    words = result.scalars().all()
-    return list(words)
+    page: PageParams,
+) -> dict:
+    return await paginate(session, select(Word), Word.id, page)
 
 
 async def get_all_words_for_specific_topic(
     topic_id: int,
     session: AsyncSession,
-    user: Annotated[dict, Depends(get_current_user)],
-) -> list[Word]:
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+) -> list[dict]:
 
-    stmt = select(Topic).where(Topic.id == topic_id, Topic.user_id == user["id"])
+    stmt = select(Topic).where(Topic.id == topic_id, Topic.user_id == user.id)
     result: Result = await session.execute(stmt)
     topic = result.scalars().first()
 
@@ -84,18 +654,102 @@ async def get_all_words_for_specific_topic(
         )
 
     stmt = (
-        select(Word)
+        select(*schema_columns(Word, PydanticWord))
         .join(TopicWordAssociation, TopicWordAssociation.word_id == Word.id)
         .where(TopicWordAssociation.topic_id == topic_id)
-        .order_by(Word.id)
+        # Same order as Word.id, but read off idx_unique_topic_word.
+        .order_by(TopicWordAssociation.word_id)
     )
-    result: Result = await session.execute(stmt)
-    words = result.scalars().all()
-    return list(words)
+    return await fetch_dicts(session, stmt)
+
+
+async def export_user_vocabulary(
+    user_id: int,
+    compress: bool = False,
+    primary: bool = False,
+) -> AsyncIterator[bytes]:
+    # The response outlives the request-scoped session, so the stream opens
+    # its own one and reads through a server-side cursor batch by batch.
+    stmt = (
+        select(
+            Topic.id.label("topic_id"),
+            Topic.name.label("topic_name"),
+            Topic.language_id,
+            Word.id,
+            Word.learnt_word,
+            Word.definition,
+            Word.example,
+            Word.grammar_element_id,
+        )
+        .join(TopicWordAssociation, TopicWordAssociation.topic_id == Topic.id)
+        .join(Word, Word.id == TopicWordAssociation.word_id)
+        .where(Topic.user_id == user_id)
+        .order_by(Topic.id, TopicWordAssociation.word_id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    compressor = zlib.compressobj(wbits=31) if compress else None
+
+    async with await db_helper.open_read_session(primary=primary) as session:
+        result = await session.stream(stmt)
+        async for rows in result.mappings().partitions():
+            chunk = "".join(
+                json.dumps(dict(row), ensure_ascii=False) + "\n" for row in rows
+            ).encode()
+            yield compressor.compress(chunk) if compressor else chunk
+
+    if compressor:
+        yield compressor.flush()
+
+
+async def search_user_words(
+    q: str,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    page: PageParams,
+    session: AsyncSession,
+) -> dict:
+    terms = SEARCH_TERM.findall(q.lower())
+    if not terms:
+        return {"items": [], "next_cursor": None}
+
+    # Every term is matched as a prefix against the GIN-indexed search_vector;
+    # the pg_trgm similarity on learnt_word catches typos in the word itself.
+    tsquery = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+    score = (
+        func.ts_rank(Word.search_vector, tsquery) + func.similarity(Word.learnt_word, q)
+    ).cast(Float)
+
+    stmt = (
+        select(Word, score.label("score"))
+        .where(
+            or_(
+                Word.search_vector.op("@@")(tsquery),
+                Word.learnt_word.op("%")(q),
+            ),
+            exists().where(
+                TopicWordAssociation.word_id == Word.id,
+                TopicWordAssociation.topic_id == Topic.id,
+                Topic.user_id == user.id,
+            ),
+        )
+        .order_by(score.desc(), Word.id.desc())
+        .limit(page.limit + 1)
+    )
+    if page.after is not None:
+        stmt = stmt.where(tuple_(score, Word.id) < tuple_(*page.after))
+
+    rows = (await session.execute(stmt)).all()
+
+    next_cursor = None
+    if len(rows) > page.limit:
+        rows = rows[: page.limit]
+        last_word, last_score = rows[-1]
+        next_cursor = encode_cursor([last_score, last_word.id])
+
+    return {"items": [word for word, _ in rows], "next_cursor": next_cursor}
 
 
 async def delete_the_word(
-    user: Annotated[dict, Depends(get_current_user)],
+    user: Annotated[CurrentUser, Depends(get_current_user)],
     word_id: int,
     session: AsyncSession,
 ) -> None:
@@ -110,7 +764,7 @@ async def delete_the_word(
         .join(TopicWordAssociation)
         .filter(
             TopicWordAssociation.word_id == word.id,
-            Topic.user_id == user["id"],
+            Topic.user_id == user.id,
         )
     )
     topic = result.scalars().first()
@@ -127,6 +781,12 @@ async def delete_the_word(
             ],
         )
 
+    await session.execute(
+        bump_grammar_element_stats(
+            _word_grammar_element_stats(word.id, word.grammar_element_id, -1)
+        )
+    )
+    await touch_topics(session, _word_topics(word.id), word_delta=-1)
     await session.execute(
         delete(TopicWordAssociation).filter(
             TopicWordAssociation.word_id == word.id,
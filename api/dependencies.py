@@ -1,25 +1,35 @@
 from typing import Annotated
 
 from fastapi import Path, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import select, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.crud.grammar_element_crud import get_grammar_element_by_id
 from api.crud.language_crud import get_language_by_id
-from api.crud.topic_crud import get_topic_by_id
+from api.crud.topic_crud import (
+    get_topic_by_id,
+    topic_being_deleted_error,
+    topic_is_being_deleted,
+)
 from api.crud.word_crud import get_word_by_id
-from api.schemas.grammar_element_schemas import GrammarElementCreate
-from api.schemas.language_schemas import LanguageCreate, LanguageUpdatePartial
+from api.reference_cache import reference_cache
+from api.schemas.grammar_element_schemas import (
+    GrammarElementCreate,
+    GrammarElement as PydanticGrammarElement,
+)
+from api.schemas.language_schemas import (
+    LanguageCreate,
+    LanguageUpdatePartial,
+    Language as PydanticLanguage,
+)
 from api.schemas.topic_schemas import TopicCreate, TopicUpdatePartial
-from api.schemas.word_schemas import WordCreate, WordUpdatePartial
-from auth.utils import get_current_user
+from auth.utils import CurrentUser, get_current_user
 from src.models import (
     db_helper,
     GrammarElement,
     Language,
     Topic,
     Word,
-    TopicWordAssociation,
 )
 
 
@@ -46,14 +56,31 @@ async def grammar_element_by_id(
     )
 
 
+async def cached_grammar_element_by_id(
+    grammar_element_id: Annotated[int, Path(ge=1)],
+) -> PydanticGrammarElement:
+    grammar_element = await reference_cache.grammar_elements.get(grammar_element_id)
+    if grammar_element is not None:
+        return grammar_element
+
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=[
+            {
+                "type": "grammar_element_id_taken",
+                "loc": ["body"],
+                "msg": f"Speech part with id {grammar_element_id} not found!",
+            }
+        ],
+    )
+
+
 async def if_grammar_element_exists(
     grammar_element: GrammarElementCreate,
-    session: AsyncSession = Depends(db_helper.session_dependency),
 ):
-    existing_name = await session.execute(
-        select(GrammarElement).filter(GrammarElement.name == grammar_element.name)
+    existing_name = await reference_cache.grammar_elements.get_by_name(
+        grammar_element.name
     )
-    existing_name = existing_name.scalar_one_or_none()
 
     if existing_name:
         raise HTTPException(
@@ -93,14 +120,29 @@ async def language_by_id(
     )
 
 
+async def cached_language_by_id(
+    language_id: Annotated[int, Path(ge=1)],
+) -> PydanticLanguage:
+    language = await reference_cache.languages.get(language_id)
+    if language is not None:
+        return language
+
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=[
+            {
+                "type": "language_id_taken",
+                "loc": ["body"],
+                "msg": f"Language with id {language_id} not found!",
+            }
+        ],
+    )
+
+
 async def if_language_exists(
     language: LanguageCreate | LanguageUpdatePartial,
-    session: AsyncSession = Depends(db_helper.session_dependency),
 ):
-    existing_name = await session.execute(
-        select(Language).filter(Language.name == language.name)
-    )
-    existing_name = existing_name.scalar_one_or_none()
+    existing_name = await reference_cache.languages.get_by_name(language.name)
 
     if existing_name:
         raise HTTPException(
@@ -142,11 +184,11 @@ async def topic_by_id(
 
 async def if_topic_exists_for_specific_user(
     topic: TopicCreate | TopicUpdatePartial,
-    user: Annotated[dict, Depends(get_current_user)],
+    user: Annotated[CurrentUser, Depends(get_current_user)],
     session: AsyncSession = Depends(db_helper.session_dependency),
 ):
     existing_name = await session.execute(
-        select(Topic).filter(Topic.name == topic.name, Topic.user_id == user["id"])
+        select(Topic).filter(Topic.name == topic.name, Topic.user_id == user.id)
     )
 
     existing_name = existing_name.scalar_one_or_none()
@@ -166,57 +208,6 @@ async def if_topic_exists_for_specific_user(
     return topic
 
 
-async def if_word_exists_and_auth_for_specific_topic(
-    topic_id: int,
-    user: Annotated[dict, Depends(get_current_user)],
-    word: WordCreate | WordUpdatePartial,
-    session: AsyncSession = Depends(db_helper.session_dependency),
-):
-    result = await session.execute(
-        select(Topic).filter(
-            Topic.id == topic_id,
-            Topic.user_id == user["id"],
-        )
-    )
-    topic = result.scalar_one_or_none()
-
-    existing_name = await session.execute(
-        select(Word)
-        .join(TopicWordAssociation)
-        .filter(
-            TopicWordAssociation.topic_id == topic_id,
-            Word.learnt_word == word.learnt_word,
-        )
-    )
-    existing_name = existing_name.scalar_one_or_none()
-
-    if topic is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=[
-                {
-                    "type": "topic_id_taken",
-                    "loc": ["body"],
-                    "msg": f"You do not have permission to create a word in this topic.",
-                }
-            ],
-        )
-
-    if existing_name:
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=[
-                {
-                    "type": "word_duplicate",
-                    "loc": ["body"],
-                    "msg": f'This word "{word.learnt_word}" is created in this topic now',
-                }
-            ],
-        )
-
-    return word
-
-
 async def word_by_id(
     word_id: Annotated[int, Path(ge=1)],
     session: AsyncSession = Depends(db_helper.session_dependency),
@@ -246,14 +237,14 @@ async def verify_topic_ownership(
     session: AsyncSession,
 ) -> None:
     result = await session.execute(
-        select(Topic).filter(
-            Topic.id == topic_id,
-            Topic.user_id == user_id,
+        select(
+            exists().where(Topic.id == topic_id, Topic.user_id == user_id),
+            topic_is_being_deleted(topic_id),
         )
     )
-    topic = result.scalar_one_or_none()
+    owned, deleting = result.one()
 
-    if topic is None:
+    if not owned:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=[
@@ -264,3 +255,6 @@ async def verify_topic_ownership(
                 }
             ],
         )
+
+    if deleting:
+        raise topic_being_deleted_error()
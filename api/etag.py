@@ -0,0 +1,41 @@
+import hashlib
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+# Clients must revalidate every time; the ETag keeps that down to a revision
+# lookup and an empty 304 when nothing changed.
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def content_etag(prefix: str, item: BaseModel) -> str:
+    digest = hashlib.blake2b(item.model_dump_json().encode(), digest_size=12)
+    return make_etag(prefix, digest.hexdigest())
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison, so W/"x" matches "x".
+    candidates = (tag.strip().removeprefix("W/") for tag in header.split(","))
+    return etag in candidates
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    etag: str,
+) -> Response | None:
+    """Return a 304 if the client already has ``etag``, otherwise tag ``response``."""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
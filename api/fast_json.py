@@ -0,0 +1,34 @@
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.models import Base
+
+
+def schema_columns(
+    model: type[Base],
+    schema: type[BaseModel],
+) -> list[InstrumentedAttribute]:
+    # Selecting exactly the schema's fields keeps the fast path's JSON in
+    # step with the response_model the route still declares.
+    return [getattr(model, name) for name in schema.model_fields]
+
+
+async def fetch_dicts(session: AsyncSession, stmt: Select) -> list[dict]:
+    result = await session.execute(stmt)
+    return [dict(row) for row in result.mappings()]
+
+
+def fast_json_response(content, response: Response | None = None) -> ORJSONResponse:
+    """Encode trusted rows with orjson, skipping response_model validation.
+
+    Only for routes whose content comes straight from ``schema_columns``;
+    headers set on the injected ``response`` are carried over, which FastAPI
+    does not do for responses returned directly. tests/test_fast_json.py
+    checks every route using it against its response_model.
+    """
+    headers = dict(response.headers) if response is not None else None
+    return ORJSONResponse(content, headers=headers)
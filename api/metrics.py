@@ -0,0 +1,78 @@
+import asyncio
+import logging
+
+from api.reference_cache import reference_cache
+from api.review_buffer import review_buffer
+from api.sampling_cache import distractor_word_ids, topic_word_ids
+from auth.utils import password_hasher, token_cache
+from src import metrics
+from src.config import settings
+from src.models import db_helper
+
+logger = logging.getLogger(__name__)
+
+
+def refresh() -> None:
+    """Copy this worker's pool, cache, hasher and buffer counters into gauges."""
+    pool = db_helper.pool_stats()
+    metrics.db_pool_size.set(pool["size"])
+    metrics.db_pool_checked_out.set(pool["checked_out"])
+    metrics.db_pool_overflow.set(max(pool["overflow"], 0))
+    metrics.db_pool_checkouts.set(pool["checkouts"])
+    metrics.db_pool_checkout_wait.set(pool["checkout_seconds_total"])
+
+    metrics.password_hash_queue_depth.set(password_hasher.waiting)
+
+    caches = {
+        **{
+            f"reference_{name}": stats
+            for name, stats in reference_cache.stats().items()
+        },
+        "token": token_cache.stats(),
+        "topic_word_ids": topic_word_ids.stats(),
+        "distractor_word_ids": distractor_word_ids.stats(),
+    }
+    for name, stats in caches.items():
+        metrics.cache_hits.labels(name).set(stats["hits"])
+        metrics.cache_misses.labels(name).set(stats["misses"])
+        metrics.cache_entries.labels(name).set(stats["size"])
+
+    buffer = review_buffer.stats()
+    metrics.review_buffer_depth.set(buffer["depth"])
+    metrics.review_buffer_written.set(buffer["written"])
+    metrics.review_buffer_failed_flushes.set(buffer["failed_flushes"])
+
+
+class MetricsRefresher:
+    """Refreshes the snapshot gauges every ``interval`` seconds.
+
+    In multiprocess mode a scrape is answered by one worker only, so each
+    worker keeps its own gauges current instead of relying on being scraped.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._task: asyncio.Task | None = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                refresh()
+            except Exception:
+                logger.exception("Refreshing metrics failed")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+metrics_refresher = MetricsRefresher(interval=settings.metrics.refresh_seconds)
@@ -0,0 +1,112 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger(f"{__name__}.slow")
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    seconds: float = 0.0
+
+    def server_timing(self, total_seconds: float) -> str:
+        return (
+            f'db;dur={self.seconds * 1000:.1f};desc="{self.count} queries", '
+            f"app;dur={(total_seconds - self.seconds) * 1000:.1f}"
+        )
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+# Every collector active in the current context; nested scopes (a test budget
+# around a request, the request itself) all see the same queries.
+_collectors: ContextVar[tuple[QueryStats, ...]] = ContextVar(
+    "query_stats_collectors", default=()
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._query_started
+    for stats in _collectors.get():
+        stats.count += 1
+        stats.seconds += elapsed
+
+    if elapsed * 1000 >= settings.query_stats.slow_query_ms:
+        # Only the statement text: bound values may hold user data.
+        slow_query_logger.warning(
+            "Slow query (%.1f ms): %s",
+            elapsed * 1000,
+            statement,
+            extra={"duration_ms": round(elapsed * 1000, 1), "statement": statement},
+        )
+
+
+def instrument() -> None:
+    # Listening on the Engine class covers the primary and replica engines,
+    # including ones created after this call (they are built lazily).
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def collect_queries():
+    stats = QueryStats()
+    token = _collectors.set(_collectors.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _collectors.reset(token)
+
+
+@contextmanager
+def query_budget(max_queries: int):
+    """Fail when the wrapped block runs more than ``max_queries`` statements.
+
+    Meant for tests driving the app in-process, e.g. around a
+    ``client.post("/api/v1/word/", ...)`` call.
+    """
+    with collect_queries() as stats:
+        yield stats
+    if stats.count > max_queries:
+        raise QueryBudgetExceeded(
+            f"{stats.count} queries run, the budget is {max_queries}"
+        )
+
+
+def log_request(request, status_code: int, stats: QueryStats, total: float) -> None:
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    route = request.scope.get("route")
+    logger.info(
+        "%s %s %s: %s queries, %.1f ms in the database, %.1f ms total",
+        request.method,
+        route.path if route is not None else request.url.path,
+        status_code,
+        stats.count,
+        stats.seconds * 1000,
+        total * 1000,
+        extra={
+            "method": request.method,
+            "route": route.path if route is not None else None,
+            "status_code": status_code,
+            "query_count": stats.count,
+            "db_ms": round(stats.seconds * 1000, 1),
+            "total_ms": round(total * 1000, 1),
+        },
+    )
@@ -0,0 +1,198 @@
+import asyncio
+import bisect
+import logging
+
+import asyncpg
+from pydantic import BaseModel
+from sqlalchemy import select
+
+from api.schemas.grammar_element_schemas import (
+    GrammarElement as PydanticGrammarElement,
+)
+from api.schemas.language_schemas import Language as PydanticLanguage
+from src.models import db_helper, Base, GrammarElement, Language
+from src.pagination import PageParams, encode_cursor
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "reference_cache"
+LISTENER_RETRY_SECONDS = 5
+
+
+class ReferenceTable:
+    """Read-through copy of a small, rarely changing table.
+
+    The rows are loaded once and served from memory until ``invalidate``;
+    ``version`` grows on every reload or invalidation so a load that raced
+    with a write is thrown away instead of installed.
+    """
+
+    def __init__(self, model: type[Base], schema: type[BaseModel]):
+        self.model = model
+        self.schema = schema
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = asyncio.Lock()
+        self._items: list[BaseModel] | None = None
+        self._ids: list[int] = []
+        self._by_id: dict[int, BaseModel] = {}
+        self._by_name: dict[str, BaseModel] = {}
+
+    async def load(self) -> None:
+        version = self.version
+        async with db_helper.session_factory() as session:
+            rows = await session.scalars(select(self.model).order_by(self.model.id))
+            # Rows are trusted as stored; re-validating would reject names
+            # written through the looser *UpdatePartial schemas.
+            items = [
+                self.schema.model_construct(
+                    **{field: getattr(row, field) for field in self.schema.model_fields}
+                )
+                for row in rows
+            ]
+
+        if version != self.version:
+            return
+        self._items = items
+        self._ids = [item.id for item in items]
+        self._by_id = {item.id: item for item in items}
+        self._by_name = {item.name: item for item in items}
+        self.version += 1
+
+    async def _ensure_loaded(self) -> None:
+        if self._items is not None:
+            self.hits += 1
+            return
+
+        self.misses += 1
+        async with self._lock:
+            while self._items is None:
+                await self.load()
+
+    def invalidate(self) -> None:
+        self._items = None
+        self.version += 1
+
+    async def get(self, item_id: int) -> BaseModel | None:
+        await self._ensure_loaded()
+        return self._by_id.get(item_id)
+
+    async def get_by_name(self, name: str) -> BaseModel | None:
+        await self._ensure_loaded()
+        return self._by_name.get(name)
+
+    async def page(self, page: PageParams) -> dict:
+        await self._ensure_loaded()
+        start = 0 if page.after is None else bisect.bisect_right(self._ids, page.after)
+        items = (self._items or [])[start : start + page.limit + 1]
+
+        next_cursor = None
+        if len(items) > page.limit:
+            items = items[: page.limit]
+            next_cursor = encode_cursor(items[-1].id)
+        return {"items": items, "next_cursor": next_cursor}
+
+    def stats(self) -> dict:
+        return {
+            "version": self.version,
+            "loaded": self._items is not None,
+            "size": len(self._ids) if self._items is not None else 0,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class ReferenceCache:
+    """Languages and grammar elements, kept in sync across workers.
+
+    Writers call ``changed`` after committing: the local copy is dropped at
+    once and a NOTIFY on ``reference_cache`` tells every other worker to do
+    the same. Each worker LISTENs on a dedicated asyncpg connection outside
+    the SQLAlchemy pool; if that connection is lost every table is
+    invalidated and the listener reconnects.
+    """
+
+    def __init__(self):
+        self.tables = {
+            "languages": ReferenceTable(Language, PydanticLanguage),
+            "grammar_elements": ReferenceTable(GrammarElement, PydanticGrammarElement),
+        }
+        self._connection: asyncpg.Connection | None = None
+        self._connection_lock = asyncio.Lock()
+        self._reconnect: asyncio.Task | None = None
+        self._stopping = False
+
+    @property
+    def languages(self) -> ReferenceTable:
+        return self.tables["languages"]
+
+    @property
+    def grammar_elements(self) -> ReferenceTable:
+        return self.tables["grammar_elements"]
+
+    async def start(self) -> None:
+        self._stopping = False
+        await self._listen()
+        for table in self.tables.values():
+            await table.load()
+
+    async def stop(self) -> None:
+        self._stopping = True
+        if self._reconnect is not None:
+            self._reconnect.cancel()
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+
+    async def changed(self, name: str) -> None:
+        self.tables[name].invalidate()
+        if self._connection is None:
+            return
+        async with self._connection_lock:
+            try:
+                await self._connection.execute(
+                    "SELECT pg_notify($1, $2)", CHANNEL, name
+                )
+            except (asyncpg.PostgresError, OSError) as exc:
+                logger.warning("Could not publish %s cache invalidation: %s", name, exc)
+
+    async def _listen(self) -> None:
+        dsn = db_helper.engine.url.set(drivername="postgresql").render_as_string(
+            hide_password=False
+        )
+        self._connection = await asyncpg.connect(dsn)
+        await self._connection.add_listener(CHANNEL, self._on_notify)
+        self._connection.add_termination_listener(self._on_terminate)
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        if pid == connection.get_server_pid():
+            return
+        table = self.tables.get(payload)
+        if table is not None:
+            table.invalidate()
+
+    def _on_terminate(self, connection) -> None:
+        self._connection = None
+        for table in self.tables.values():
+            table.invalidate()
+        if not self._stopping:
+            self._reconnect = asyncio.create_task(self._relisten())
+
+    async def _relisten(self) -> None:
+        while not self._stopping:
+            await asyncio.sleep(LISTENER_RETRY_SECONDS)
+            try:
+                await self._listen()
+            except (asyncpg.PostgresError, OSError) as exc:
+                logger.warning("Reference cache listener is down: %s", exc)
+                continue
+            for table in self.tables.values():
+                table.invalidate()
+            return
+
+    def stats(self) -> dict:
+        return {name: table.stats() for name, table in self.tables.items()}
+
+
+reference_cache = ReferenceCache()
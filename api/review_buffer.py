@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+
+from api.crud.review_crud import review_answers_update
+from api.schemas.review_schemas import ReviewAnswer
+from src import metrics
+from src.config import settings
+from src.models import db_helper
+
+logger = logging.getLogger(__name__)
+
+
+class ReviewBufferFull(Exception):
+    pass
+
+
+class ReviewBuffer:
+    """Write-behind buffer for review answers.
+
+    Answers are coalesced per (user, word), the last one received wins, and
+    written with the same one-statement SM-2 update as ``/review/answers/``
+    once ``flush_size`` cards are pending or ``flush_interval`` seconds have
+    passed, whichever comes first.
+
+    Durability: an accepted answer only lives in this process until its
+    flush commits. A flush that fails puts its answers back and is retried
+    on the next trigger; ``stop`` (called from the FastAPI lifespan) flushes
+    whatever is left, so a graceful shutdown or restart loses nothing. A
+    crash or SIGKILL loses at most the answers of the current window.
+    Clients that need the new schedule back should use ``/review/answers/``.
+    Past ``max_pending`` cards (e.g. while the database is down) new answers
+    are refused instead of growing the buffer without bound.
+    """
+
+    def __init__(self, flush_size: int, flush_interval: float, max_pending: int):
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: dict[tuple[int, int], dict] = {}
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+
+        self.accepted = 0
+        self.coalesced = 0
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.written = 0
+        self.unmatched = 0
+        self.flush_seconds_total = 0.0
+        self.flush_seconds_max = 0.0
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending)
+
+    def add(self, user_id: int, answers: list[ReviewAnswer]) -> None:
+        if self.depth + len(answers) > self.max_pending:
+            raise ReviewBufferFull()
+
+        reviewed_at = datetime.utcnow()
+        for answer in answers:
+            key = (user_id, answer.word_id)
+            if key in self._pending:
+                self.coalesced += 1
+            self._pending[key] = {
+                "user_id": user_id,
+                "word_id": answer.word_id,
+                "quality": answer.quality,
+                "reviewed_at": reviewed_at,
+            }
+        self.accepted += len(answers)
+
+        if self.depth >= self.flush_size:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            batch, self._pending = self._pending, {}
+            rows = list(batch.values())
+            for start in range(0, len(rows), self.flush_size):
+                chunk = rows[start : start + self.flush_size]
+                started = time.perf_counter()
+                try:
+                    async with db_helper.session_factory() as session:
+                        result = await session.execute(review_answers_update(chunk))
+                        updated = len(result.all())
+                        await session.commit()
+                except Exception:
+                    metrics.review_buffer_flush_duration.labels("failed").observe(
+                        time.perf_counter() - started
+                    )
+                    self.failed_flushes += 1
+                    logger.exception("Flushing %s review answers failed", len(chunk))
+                    # Answers received meanwhile are newer and take precedence.
+                    for row in rows[start:]:
+                        self._pending.setdefault((row["user_id"], row["word_id"]), row)
+                    return
+
+                elapsed = time.perf_counter() - started
+                metrics.review_buffer_flush_duration.labels("written").observe(elapsed)
+                self.flushes += 1
+                self.written += updated
+                self.unmatched += len(chunk) - updated
+                self.flush_seconds_total += elapsed
+                self.flush_seconds_max = max(self.flush_seconds_max, elapsed)
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if self._pending:
+                await self.flush()
+
+    def start(self) -> None:
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        # The loop is woken rather than cancelled so an in-flight flush is
+        # never interrupted halfway through its statement.
+        self._stopping = True
+        self._wakeup.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self.flush()
+
+    def stats(self) -> dict:
+        return {
+            "depth": self.depth,
+            "accepted": self.accepted,
+            "coalesced": self.coalesced,
+            "written": self.written,
+            "unmatched": self.unmatched,
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "flush_seconds_total": self.flush_seconds_total,
+            "flush_seconds_max": self.flush_seconds_max,
+        }
+
+
+review_buffer = ReviewBuffer(
+    flush_size=settings.review_buffer.flush_size,
+    flush_interval=settings.review_buffer.flush_interval_seconds,
+    max_pending=settings.review_buffer.max_pending,
+)
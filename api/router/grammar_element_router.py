@@ -5,14 +5,21 @@ from api.crud.grammar_element_crud import (
     create_grammar_element,
     get_all_speech_parts,
     update_grammar_element,
+    delete_the_grammar_element,
 )
+from src.pagination import PageParams, page_params
+from api.schemas.pagination_schemas import Page
 from api.schemas.grammar_element_schemas import (
     GrammarElement,
     GrammarElementCreate,
     GrammarElementUpdatePartial,
 )
 from src.models import db_helper
-from api.dependencies import grammar_element_by_id, if_grammar_element_exists
+from api.dependencies import (
+    grammar_element_by_id,
+    cached_grammar_element_by_id,
+    if_grammar_element_exists,
+)
 
 router = APIRouter(prefix="/grammar_element", tags=["GrammarElements"])
 
@@ -36,12 +43,12 @@ async def create_a_grammar_element(
 @router.get(
     "/all-speech-parts/",
     summary="Get all speech parts",
-    response_model=list[GrammarElement],
+    response_model=Page[GrammarElement],
 )
 async def get_all_speech_parts_list(
-    session: AsyncSession = Depends(db_helper.session_dependency),
+    page: PageParams = Depends(page_params),
 ):
-    return await get_all_speech_parts(session=session)
+    return await get_all_speech_parts(page=page)
 
 
 @router.get(
@@ -50,7 +57,7 @@ async def get_all_speech_parts_list(
     response_model=GrammarElement,
 )
 async def get_user_by_id(
-    grammar_element: GrammarElement = Depends(grammar_element_by_id),
+    grammar_element: GrammarElement = Depends(cached_grammar_element_by_id),
 ):
     return grammar_element
 
@@ -80,5 +87,7 @@ async def delete_grammar_element(
     session: AsyncSession = Depends(db_helper.session_dependency),
     grammar_element: GrammarElement = Depends(grammar_element_by_id),
 ) -> None:
-    await session.delete(grammar_element)
-    await session.commit()
+    await delete_the_grammar_element(
+        grammar_element=grammar_element,
+        session=session,
+    )
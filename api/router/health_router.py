@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends
+
+from api.review_buffer import review_buffer
+from auth.utils import get_current_user
+from src.models import db_helper
+
+# Pool and buffer internals are only shown to signed-in users.
+router = APIRouter(
+    prefix="/health",
+    tags=["Health"],
+    dependencies=[Depends(get_current_user)],
+)
+
+
+@router.get(
+    "/db-pool/",
+    summary="Get database connection pool usage",
+)
+async def get_db_pool_stats():
+    return db_helper.pool_stats()
+
+
+@router.get(
+    "/review-buffer/",
+    summary="Get review answer write-behind buffer depth and flush timings",
+)
+async def get_review_buffer_stats():
+    return review_buffer.stats()
@@ -5,8 +5,15 @@ from api.crud.language_crud import (
     create_language,
     update_language,
     get_all_languages,
+    delete_language as delete_the_language,
 )
-from api.dependencies import language_by_id, if_language_exists
+from api.dependencies import (
+    language_by_id,
+    cached_language_by_id,
+    if_language_exists,
+)
+from src.pagination import PageParams, page_params
+from api.schemas.pagination_schemas import Page
 from api.schemas.language_schemas import (
     Language,
     LanguageCreate,
@@ -36,12 +43,12 @@ async def create_a_language(
 @router.get(
     "/all-languages/",
     summary="Get all languages",
-    response_model=list[Language],
+    response_model=Page[Language],
 )
 async def get_all_languages_list(
-    session: AsyncSession = Depends(db_helper.session_dependency),
+    page: PageParams = Depends(page_params),
 ):
-    return await get_all_languages(session=session)
+    return await get_all_languages(page=page)
 
 
 @router.get(
@@ -50,7 +57,7 @@ async def get_all_languages_list(
     response_model=Language,
 )
 async def get_language_by_id(
-    language: Language = Depends(language_by_id),
+    language: Language = Depends(cached_language_by_id),
 ):
     return language
 
@@ -82,5 +89,4 @@ async def delete_language(
     session: AsyncSession = Depends(db_helper.session_dependency),
     language: Language = Depends(language_by_id),
 ) -> None:
-    await session.delete(language)
-    await session.commit()
+    await delete_the_language(language=language, session=session)
@@ -0,0 +1,22 @@
+import asyncio
+
+from fastapi import APIRouter, Response
+
+from api.metrics import refresh
+from src import metrics
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get(
+    "/metrics",
+    summary="Prometheus metrics of every worker",
+    include_in_schema=False,
+)
+async def get_metrics():
+    # The gauges are read from pool, cache and buffer state owned by the
+    # event loop, so the snapshot is taken here; only rendering, which reads
+    # every worker's files in multiprocess mode, goes to a thread.
+    refresh()
+    content, media_type = await asyncio.to_thread(metrics.render)
+    return Response(content=content, media_type=media_type)
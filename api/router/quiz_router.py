@@ -0,0 +1,50 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.crud.quiz_crud import build_quiz, check_quiz_answer
+from api.schemas.quiz_schemas import (
+    Quiz,
+    QuizAnswer,
+    QuizAnswerResult,
+    MAX_QUIZ_CHOICES,
+    MAX_QUIZ_SIZE,
+)
+from auth.utils import CurrentUser, get_current_user
+from src.models import db_helper
+
+router = APIRouter(prefix="/quiz", tags=["Quiz"])
+
+
+@router.get(
+    "/",
+    summary="Build a multiple-choice quiz from a topic of the auth user",
+    response_model=Quiz,
+)
+async def get_quiz_for_topic(
+    topic_id: int,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    size: Annotated[int, Query(ge=1, le=MAX_QUIZ_SIZE)] = 10,
+    choices: Annotated[int, Query(ge=2, le=MAX_QUIZ_CHOICES)] = 4,
+    session: AsyncSession = Depends(db_helper.read_session_dependency),
+):
+    return await build_quiz(
+        topic_id=topic_id,
+        user_id=user.id,
+        size=size,
+        choices=choices,
+        session=session,
+    )
+
+
+@router.post(
+    "/answer/",
+    summary="Check the answer to a quiz question",
+    response_model=QuizAnswerResult,
+)
+async def answer_quiz_question(
+    answer: QuizAnswer,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+):
+    return check_quiz_answer(user_id=user.id, answer=answer)
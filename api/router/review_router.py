@@ -0,0 +1,78 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.crud.review_crud import answer_reviews, get_due_cards
+from api.review_buffer import ReviewBufferFull, review_buffer
+from api.schemas.review_schemas import (
+    DueCard,
+    ReviewAnswer,
+    ReviewAnswerResult,
+    ReviewEventsAccepted,
+    MAX_ANSWERS_PER_BATCH,
+)
+from auth.utils import CurrentUser, get_current_user
+from src.models import db_helper
+from src.pagination import MAX_PAGE_SIZE
+
+router = APIRouter(prefix="/review", tags=["Review"])
+
+
+@router.get(
+    "/due/",
+    summary="Get the auth user's next due review cards",
+    response_model=list[DueCard],
+)
+async def get_due_review_cards(
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = 20,
+    session: AsyncSession = Depends(db_helper.read_session_dependency),
+):
+    return await get_due_cards(user_id=user.id, limit=limit, session=session)
+
+
+@router.post(
+    "/answers/",
+    summary="Submit a batch of review answers",
+    response_model=ReviewAnswerResult,
+)
+async def submit_review_answers(
+    answers: Annotated[
+        list[ReviewAnswer],
+        Body(min_length=1, max_length=MAX_ANSWERS_PER_BATCH),
+    ],
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    session: AsyncSession = Depends(db_helper.session_dependency),
+):
+    return await answer_reviews(user_id=user.id, answers=answers, session=session)
+
+
+@router.post(
+    "/events/",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Queue review answers to be written in the background",
+    response_model=ReviewEventsAccepted,
+)
+async def queue_review_events(
+    answers: Annotated[
+        list[ReviewAnswer],
+        Body(min_length=1, max_length=MAX_ANSWERS_PER_BATCH),
+    ],
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+):
+    try:
+        review_buffer.add(user_id=user.id, answers=answers)
+    except ReviewBufferFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=[
+                {
+                    "type": "review_buffer_full",
+                    "loc": ["body"],
+                    "msg": "Too many review answers are waiting to be saved, retry later.",
+                }
+            ],
+            headers={"Retry-After": "5"},
+        )
+    return {"accepted": len(answers)}
@@ -0,0 +1,33 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.crud.revision_crud import get_vocabulary_etag
+from api.crud.stats_crud import get_user_stats
+from api.etag import conditional_response
+from api.schemas.stats_schemas import VocabularyStats
+from auth.utils import CurrentUser, get_current_user
+from src.models import db_helper
+
+router = APIRouter(prefix="/stats", tags=["Stats"])
+
+
+@router.get(
+    "/",
+    summary="Word counts of the auth user per language and grammar element",
+    response_model=VocabularyStats,
+)
+async def get_stats_for_user(
+    request: Request,
+    response: Response,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    session: AsyncSession = Depends(db_helper.read_session_dependency),
+):
+    etag = await get_vocabulary_etag(kind="stats", user_id=user.id, session=session)
+    if etag is not None:
+        not_modified = conditional_response(request, response, etag)
+        if not_modified is not None:
+            return not_modified
+
+    return await get_user_stats(user_id=user.id, session=session)
@@ -1,22 +1,42 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    Path,
+    Request,
+    Response,
+    status,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.crud.revision_crud import get_vocabulary_etag
 from api.crud.topic_crud import (
     create_topic,
     update_topic,
     get_all_topics,
     delete_the_topic,
     get_all_topics_for_auth_user,
+    start_topic_delete_job,
+    run_topic_delete_job,
+    get_topic_delete_job,
+    get_user_topics_by_ids,
 )
 from api.dependencies import topic_by_id, if_topic_exists_for_specific_user
+from api.etag import conditional_response, make_etag
+from api.fast_json import fast_json_response
+from src.pagination import PageParams, page_params
+from api.schemas.batch_schemas import BatchIds
+from api.schemas.pagination_schemas import Page
 from api.schemas.topic_schemas import (
     Topic as TopicPydantic,
     TopicCreate,
     TopicUpdatePartial,
+    TopicDeleteJob,
+    TopicBatch,
 )
-from auth.utils import get_current_auth_user_model, get_current_user
+from auth.utils import CurrentUser, get_current_auth_user_model, get_current_user
 from src.models import db_helper, User, Topic
 
 router = APIRouter(prefix="/topic", tags=["Topics"])
@@ -27,7 +47,7 @@ router = APIRouter(prefix="/topic", tags=["Topics"])
     response_model=TopicPydantic,
 )
 async def create_topic_for_user(
-    user: Annotated[dict, Depends(get_current_user)],
+    user: Annotated[CurrentUser, Depends(get_current_user)],
     topic: TopicCreate = Depends(if_topic_exists_for_specific_user),
     session: AsyncSession = Depends(db_helper.session_dependency),
 ):
@@ -41,12 +61,13 @@ async def create_topic_for_user(
 @router.get(
     "/all-topics/",
     summary="Get all topics",
-    response_model=list[TopicPydantic],
+    response_model=Page[TopicPydantic],
 )
 async def get_all_topics_list(
-    session: AsyncSession = Depends(db_helper.session_dependency),
+    page: PageParams = Depends(page_params),
+    session: AsyncSession = Depends(db_helper.read_session_dependency),
 ):
-    return await get_all_topics(session=session)
+    return await get_all_topics(session=session, page=page)
 
 
 @router.get(
@@ -55,13 +76,49 @@ async def get_all_topics_list(
     response_model=list[TopicPydantic],
 )
 async def get_all_topics_list(
-    user: Annotated[dict, Depends(get_current_user)],
-    session: AsyncSession = Depends(db_helper.session_dependency),
+    request: Request,
+    response: Response,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    session: AsyncSession = Depends(db_helper.read_session_dependency),
 ):
-    return await get_all_topics_for_auth_user(
+    etag = await get_vocabulary_etag(kind="topics", user_id=user.id, session=session)
+    if etag is not None:
+        not_modified = conditional_response(request, response, etag)
+        if not_modified is not None:
+            return not_modified
+
+    topics = await get_all_topics_for_auth_user(
         user=user,
         session=session,
     )
+    return fast_json_response(topics, response)
+
+
+@router.get(
+    "/delete-job/{job_id}/",
+    summary="Get progress of a background topic deletion",
+    response_model=TopicDeleteJob,
+)
+async def get_delete_topic_job(
+    job_id: Annotated[int, Path(ge=1)],
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    session: AsyncSession = Depends(db_helper.session_dependency),
+):
+    return await get_topic_delete_job(user=user, job_id=job_id, session=session)
+
+
+@router.post(
+    "/batch/",
+    summary="Get the user's topics by ids",
+    response_model=TopicBatch,
+)
+async def get_topics_by_ids(
+    batch: BatchIds,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    session: AsyncSession = Depends(db_helper.read_session_dependency),
+):
+    topics = await get_user_topics_by_ids(ids=batch.ids, user=user, session=session)
+    return fast_json_response(topics)
 
 
 @router.get(
@@ -70,9 +127,12 @@ async def get_all_topics_list(
     response_model=TopicPydantic,
 )
 async def get_topic_by_id(
+    request: Request,
+    response: Response,
     topic: Topic = Depends(topic_by_id),
 ):
-    return topic
+    etag = make_etag("topic", topic.id, topic.revision)
+    return conditional_response(request, response, etag) or topic
 
 
 @router.delete(
@@ -81,7 +141,7 @@ async def get_topic_by_id(
     summary="Delete topic by id",
 )
 async def delete_topic(
-    user: Annotated[dict, Depends(get_current_user)],
+    user: Annotated[CurrentUser, Depends(get_current_user)],
     session: AsyncSession = Depends(db_helper.session_dependency),
     topic: Topic = Depends(topic_by_id),
 ) -> None:
@@ -89,6 +149,26 @@ async def delete_topic(
     return await delete_the_topic(user=user, session=session, topic_id=topic.id)
 
 
+@router.post(
+    "/{topic_id}/delete-job/",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Delete a large topic in the background",
+    response_model=TopicDeleteJob,
+)
+async def delete_topic_in_background(
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    background_tasks: BackgroundTasks,
+    session: AsyncSession = Depends(db_helper.session_dependency),
+    topic: Topic = Depends(topic_by_id),
+):
+    job, run = await start_topic_delete_job(
+        user=user, session=session, topic_id=topic.id
+    )
+    if run:
+        background_tasks.add_task(run_topic_delete_job, job["id"])
+    return job
+
+
 @router.patch(
     "/{topic_id}/",
     status_code=status.HTTP_202_ACCEPTED,
@@ -1,21 +1,49 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.crud.revision_crud import get_topic_words_etag
 from api.crud.word_crud import (
     create_word,
     get_all_words,
     update_word,
     delete_the_word,
     get_all_words_for_specific_topic,
+    export_user_vocabulary,
+    import_words,
+    read_import_body,
+    parse_word_rows,
+    search_user_words,
+    get_user_words_by_ids,
 )
 from api.dependencies import (
-    if_word_exists_and_auth_for_specific_topic,
+    verify_topic_ownership,
     word_by_id,
 )
-from api.schemas.word_schemas import WordCreate, Word, WordUpdatePartial
-from auth.utils import get_current_user
+from api.etag import conditional_response, content_etag
+from api.fast_json import fast_json_response
+from src.pagination import PageParams, page_params, ranked_page_params
+from api.schemas.batch_schemas import BatchIds
+from api.schemas.pagination_schemas import Page
+from api.schemas.word_schemas import (
+    WordCreate,
+    Word,
+    WordUpdatePartial,
+    WordImportResult,
+    WordBatch,
+)
+from auth.utils import CurrentUser, get_current_user
 from src.models import db_helper
 
 router = APIRouter(prefix="/word", tags=["Words"])
@@ -27,12 +55,57 @@ router = APIRouter(prefix="/word", tags=["Words"])
 )
 async def create_word_for_topic(
     topic_id: int,
-    word: WordCreate = Depends(if_word_exists_and_auth_for_specific_topic),
+    word: WordCreate,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
     session: AsyncSession = Depends(db_helper.session_dependency),
 ):
     return await create_word(
         topic_id=topic_id,
         word=word,
+        user=user,
+        session=session,
+    )
+
+
+@router.post(
+    "/import/",
+    status_code=status.HTTP_201_CREATED,
+    summary="Import many words into a topic (JSON array, NDJSON or CSV)",
+    response_model=WordImportResult,
+)
+async def import_words_for_topic(
+    topic_id: int,
+    request: Request,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    session: AsyncSession = Depends(db_helper.session_dependency),
+):
+    await verify_topic_ownership(
+        topic_id=topic_id,
+        user_id=user.id,
+        session=session,
+    )
+
+    try:
+        rows = parse_word_rows(
+            body=await read_import_body(request),
+            content_type=request.headers.get("content-type", "application/json"),
+        )
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=[
+                {
+                    "type": "import_malformed",
+                    "loc": ["body"],
+                    "msg": f"Could not parse the uploaded words: {exc}",
+                }
+            ],
+        )
+
+    return await import_words(
+        topic_id=topic_id,
+        user_id=user.id,
+        rows=rows,
         session=session,
     )
 
@@ -40,12 +113,13 @@ async def create_word_for_topic(
 @router.get(
     "/all-words/",
     summary="Get all words",
-    response_model=list[Word],
+    response_model=Page[Word],
 )
 async def get_all_words_list(
-    session: AsyncSession = Depends(db_helper.session_dependency),
+    page: PageParams = Depends(page_params),
+    session: AsyncSession = Depends(db_helper.read_session_dependency),
 ):
-    return await get_all_words(session=session)
+    return await get_all_words(session=session, page=page)
 
 
 @router.get(
@@ -55,14 +129,87 @@ async def get_all_words_list(
 )
 async def get_all_user_words_list(
     topic_id: int,
-    user: Annotated[dict, Depends(get_current_user)],
-    session: AsyncSession = Depends(db_helper.session_dependency),
+    request: Request,
+    response: Response,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    session: AsyncSession = Depends(db_helper.read_session_dependency),
 ):
-    return await get_all_words_for_specific_topic(
+    etag = await get_topic_words_etag(
+        topic_id=topic_id,
+        user_id=user.id,
+        session=session,
+    )
+    if etag is not None:
+        not_modified = conditional_response(request, response, etag)
+        if not_modified is not None:
+            return not_modified
+
+    words = await get_all_words_for_specific_topic(
         topic_id=topic_id,
         session=session,
         user=user,
     )
+    return fast_json_response(words, response)
+
+
+@router.get(
+    "/search/",
+    summary="Search the auth user's words",
+    response_model=Page[Word],
+)
+async def search_words(
+    q: Annotated[str, Query(min_length=1, max_length=100)],
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    page: PageParams = Depends(ranked_page_params),
+    session: AsyncSession = Depends(db_helper.read_session_dependency),
+):
+    return await search_user_words(
+        q=q,
+        user=user,
+        page=page,
+        session=session,
+    )
+
+
+@router.get(
+    "/export/",
+    summary="Export all words of the auth user as NDJSON",
+    response_class=StreamingResponse,
+)
+async def export_user_words(
+    request: Request,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    compress: bool = False,
+):
+    primary = db_helper.wants_primary(request)
+    if compress:
+        return StreamingResponse(
+            export_user_vocabulary(user_id=user.id, compress=True, primary=primary),
+            media_type="application/gzip",
+            headers={
+                "Content-Disposition": 'attachment; filename="vocabulary.ndjson.gz"'
+            },
+        )
+
+    return StreamingResponse(
+        export_user_vocabulary(user_id=user.id, primary=primary),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="vocabulary.ndjson"'},
+    )
+
+
+@router.post(
+    "/batch/",
+    summary="Get the user's words by ids",
+    response_model=WordBatch,
+)
+async def get_words_by_ids(
+    batch: BatchIds,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
+    session: AsyncSession = Depends(db_helper.read_session_dependency),
+):
+    words = await get_user_words_by_ids(ids=batch.ids, user=user, session=session)
+    return fast_json_response(words)
 
 
 @router.get(
@@ -71,9 +218,14 @@ async def get_all_user_words_list(
     response_model=Word,
 )
 async def get_word_by_id(
+    request: Request,
+    response: Response,
     word: Word = Depends(word_by_id),
 ):
-    return word
+    # Words carry no revision of their own, so the tag is a digest of the
+    # serialized word; it still saves the client the body on a match.
+    etag = content_etag(f"word-{word.id}", Word.model_validate(word))
+    return conditional_response(request, response, etag) or word
 
 
 @router.delete(
@@ -82,7 +234,7 @@ async def get_word_by_id(
     summary="Delete word by id",
 )
 async def delete_word(
-    user: Annotated[dict, Depends(get_current_user)],
+    user: Annotated[CurrentUser, Depends(get_current_user)],
     session: AsyncSession = Depends(db_helper.session_dependency),
     word: Word = Depends(word_by_id),
 ) -> None:
@@ -101,14 +253,14 @@ async def delete_word(
     response_model=Word,
 )
 async def update_the_topic(
-    word_update: WordCreate | WordUpdatePartial = Depends(
-        if_word_exists_and_auth_for_specific_topic
-    ),
-    word: Word = Depends(word_by_id),
+    word_id: Annotated[int, Path(ge=1)],
+    word_update: WordCreate | WordUpdatePartial,
+    user: Annotated[CurrentUser, Depends(get_current_user)],
     session: AsyncSession = Depends(db_helper.session_dependency),
 ):
     return await update_word(
-        word_update,
-        word,
-        session,
+        word_id=word_id,
+        word_update=word_update,
+        user=user,
+        session=session,
     )
@@ -0,0 +1,54 @@
+import random
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+MAX_ENTRIES = 1024
+
+
+class IdArrayCache:
+    """LRU of id arrays to sample from in O(k) instead of ORDER BY random().
+
+    Keys carry the revision counter of what the ids were read from, so a
+    write simply makes the next lookup miss; stale arrays age out of the LRU.
+    """
+
+    def __init__(self, maxsize: int = MAX_ENTRIES):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+
+    async def get(
+        self,
+        key: Hashable,
+        load: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        entry = await load()
+        self._entries[key] = entry
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return entry
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def sample_ids(ids: tuple[int, ...], k: int, exclude: int | None = None) -> list[int]:
+    # random.sample picks k positions without touching the rest of the array.
+    sample = random.sample(ids, min(len(ids), k + 1))
+    return [item for item in sample if item != exclude][:k]
+
+
+topic_word_ids = IdArrayCache()
+distractor_word_ids = IdArrayCache()
@@ -0,0 +1,10 @@
+from typing import Annotated
+
+from annotated_types import MinLen, MaxLen
+from pydantic import BaseModel, Field
+
+MAX_BATCH_IDS = 5000
+
+
+class BatchIds(BaseModel):
+    ids: Annotated[list[Annotated[int, Field(gt=0)]], MinLen(1), MaxLen(MAX_BATCH_IDS)]
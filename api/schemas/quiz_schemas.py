@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+
+MAX_QUIZ_SIZE = 100
+MAX_QUIZ_CHOICES = 8
+
+
+class QuizChoice(BaseModel):
+    id: int
+    definition: str
+
+
+class QuizQuestion(BaseModel):
+    # Opaque; send it back with a choice id to POST /quiz/answer/.
+    id: str
+    learnt_word: str
+    grammar_element_id: int
+    choices: list[QuizChoice]
+
+
+class Quiz(BaseModel):
+    topic_id: int
+    questions: list[QuizQuestion]
+
+
+class QuizAnswer(BaseModel):
+    question_id: str
+    choice_id: int
+
+
+class QuizAnswerResult(BaseModel):
+    correct: bool
+    answer_choice_id: int
@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from api.schemas.word_schemas import Word
+
+MAX_ANSWERS_PER_BATCH = 1000
+
+
+class ReviewAnswer(BaseModel):
+    word_id: Annotated[int, Field(gt=0)]
+    # SM-2 grade: 0-2 is a lapse, 3 hard, 4 good, 5 easy.
+    quality: Annotated[int, Field(ge=0, le=5)]
+
+
+class ReviewCard(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    word_id: int
+    due_at: datetime
+    interval_days: int
+    ease: int
+    repetitions: int
+    lapses: int
+    last_reviewed_at: datetime | None = None
+
+
+class DueCard(ReviewCard):
+    word: Word
+
+
+class ReviewAnswerResult(BaseModel):
+    cards: list[ReviewCard]
+    missing: list[int]
+
+
+class ReviewEventsAccepted(BaseModel):
+    accepted: int
@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+
+
+class LanguageStats(BaseModel):
+    language_id: int
+    topic_count: int
+    word_count: int
+
+
+class GrammarElementStats(BaseModel):
+    grammar_element_id: int
+    word_count: int
+
+
+class VocabularyStats(BaseModel):
+    total_words: int
+    languages: list[LanguageStats]
+    grammar_elements: list[GrammarElementStats]
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Annotated
 
 from annotated_types import MinLen, MaxLen
@@ -14,6 +15,8 @@ class Topic(TopicBase):
     model_config = ConfigDict(from_attributes=True)
     id: int
     user_id: int
+    word_count: int = 0
+    updated_at: datetime | None = None
 
 
 class TopicCreate(TopicBase):
@@ -24,3 +27,16 @@ class TopicUpdatePartial(TopicCreate):
     name: str | None = None
     language_id: int | None = None
     # user_id: int | None = None
+
+
+class TopicDeleteJob(BaseModel):
+    id: int
+    topic_id: int
+    status: str
+    total_words: int
+    deleted_words: int
+
+
+class TopicBatch(BaseModel):
+    items: list[Topic]
+    missing: list[int]
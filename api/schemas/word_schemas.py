@@ -8,7 +8,7 @@ class WordBase(BaseModel):
     learnt_word: Annotated[str, MaxLen(20)]
     definition: Annotated[str, MaxLen(100)]
     example: Annotated[str, MaxLen(512)]
-    grammar_element_id: Annotated[int, Field(gt=0)]
+    grammar_element_id: Annotated[int, Field(gt=0, le=2**31 - 1)]
 
 
 class Word(WordBase):
@@ -26,3 +26,18 @@ class WordUpdatePartial(WordCreate):
     example: str | None = None
     grammar_element_id: int | None = None
 
+
+class WordImportError(BaseModel):
+    row: int
+    learnt_word: str | None = None
+    msg: str
+
+
+class WordImportResult(BaseModel):
+    created: int
+    errors: list[WordImportError]
+
+
+class WordBatch(BaseModel):
+    items: list[Word]
+    missing: list[int]
@@ -1,9 +1,9 @@
 from fastapi import HTTPException, status
 from sqlalchemy import select
-from sqlalchemy.engine import Result
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from auth.schemas import User as PydanticUser, UserShow
+from src.pagination import PageParams, paginate
+from auth.schemas import User as PydanticUser
 from auth.schemas import UserCreate, UserUpdatePartial
 from src.models import User
 
@@ -16,7 +16,7 @@ async def create_users(
     user: UserCreate,
     session: AsyncSession,
 ) -> User:
-    from auth.utils import hash_pass
+    from auth.utils import password_hasher
     existing_user_username = await session.execute(
         select(User).filter(User.username == user.username)
     )
@@ -64,7 +64,7 @@ async def create_users(
             ],
         )
 
-    hashed_pass = hash_pass(user.hashed_password)
+    hashed_pass = await password_hasher.hash(user.hashed_password)
     user.hashed_password = hashed_pass
     new_user = User(**user.model_dump())
     session.add(new_user)
@@ -79,10 +79,10 @@ async def update_users(
     session: AsyncSession,
     partial: bool = True,
 ) -> PydanticUser:
-    from auth.utils import hash_pass
+    from auth.utils import password_hasher
     for name, value in user_update.model_dump(exclude_unset=partial).items():
         if name == "hashed_password" and value:
-            value = hash_pass(value)
+            value = await password_hasher.hash(value)
         setattr(
             user,
             name,
@@ -92,8 +92,8 @@ async def update_users(
     return user
 
 
-async def get_all_users(session: AsyncSession) -> list[UserShow]:
-    stmt = select(User).order_by(User.id)
-    result: Result = await session.execute(stmt)
-    users = result.scalars().all()
-    return list(users)
+async def get_all_users(
+    session: AsyncSession,
+    page: PageParams,
+) -> dict:
+    return await paginate(session, select(User), User.id, page)
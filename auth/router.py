@@ -4,6 +4,8 @@ from fastapi import APIRouter, Depends, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.pagination import PageParams, page_params
+from api.schemas.pagination_schemas import Page
 from auth.crud import create_users, update_users, get_all_users
 from auth.dependencies import user_by_id
 from auth.schemas import Token
@@ -12,6 +14,7 @@ from auth.utils import (
     login_for_access_token,
     get_current_auth_user,
     get_current_user,
+    CurrentUser,
     has_permission, refresh_access_token,
 )
 from src.models import db_helper
@@ -38,12 +41,13 @@ async def create_user(
 @router.get(
     "/all-users/",
     summary="Get all users",
-    response_model=list[UserShow],
+    response_model=Page[UserShow],
 )
 async def get_all_users_list(
-    session: AsyncSession = Depends(db_helper.session_dependency)
+    page: PageParams = Depends(page_params),
+    session: AsyncSession = Depends(db_helper.read_session_dependency),
 ):
-    return await get_all_users(session=session)
+    return await get_all_users(session=session, page=page)
 
 
 @router.get(
@@ -88,7 +92,7 @@ async def refresh_token(
     response_model=CurrentUserData,
 )
 async def get_current_user(
-    user: Annotated[dict, Depends(get_current_user)],
+    user: Annotated[CurrentUser, Depends(get_current_user)],
 ):
     return await get_current_auth_user(user)
 
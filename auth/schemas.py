@@ -47,6 +47,8 @@ class AllTokens(BaseModel):
 
 
 class CurrentUserData(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     username: str
     email: str
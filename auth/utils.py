@@ -1,3 +1,8 @@
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
@@ -9,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from auth.dependencies import user_by_id
+from src import metrics
 from src.models import User
 from src.config import settings
 from jose import jwt, JWTError
@@ -23,6 +29,84 @@ oauth2_bearer = OAuth2PasswordBearer(
 )
 
 
+class CurrentUser:
+    __slots__ = ("id", "username", "email")
+
+    def __init__(self, id: int, username: str, email: str | None):
+        object.__setattr__(self, "id", id)
+        object.__setattr__(self, "username", username)
+        object.__setattr__(self, "email", email)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(id={self.id}, username={self.username!r})"
+
+
+class TokenCache:
+    """Bounded LRU of already verified access tokens.
+
+    Entries are keyed by the token digest and dropped at the token's own
+    ``exp`` or after ``ttl`` seconds, whichever comes first.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, tuple[float, CurrentUser]] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> CurrentUser | None:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, user = entry
+        if expires_at <= time.time():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return user
+
+    def set(self, token: str, user: CurrentUser, exp: float | None) -> None:
+        expires_at = time.time() + self.ttl
+        if exp is not None:
+            expires_at = min(expires_at, exp)
+
+        key = self._key(token)
+        self._entries[key] = (expires_at, user)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+token_cache = TokenCache(
+    maxsize=settings.jwt.token_cache_size,
+    ttl=settings.jwt.token_cache_ttl_seconds,
+)
+
+
 def hash_pass(
     password: str,
 ):
@@ -36,6 +120,68 @@ def verify_password(
     return pwd_context.verify(password, hashed_pass)
 
 
+class PasswordHasher:
+    """Runs bcrypt on a dedicated thread pool so it never blocks the event loop.
+
+    bcrypt releases the GIL, so threads scale with cores. The semaphore keeps
+    at most ``workers`` calls inside the pool; everything else waits on it,
+    which is what ``waiting`` reports as queue depth.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="password-hash",
+        )
+        self._semaphore = asyncio.Semaphore(workers)
+        self.waiting = 0
+        self.running = 0
+        self.completed = 0
+        self.wait_seconds_total = 0.0
+
+    async def _run(self, func, *args):
+        queued_at = time.perf_counter()
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        waited = time.perf_counter() - queued_at
+        self.wait_seconds_total += waited
+        metrics.password_hash_wait.observe(waited)
+        self.running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self.running -= 1
+            self.completed += 1
+            self._semaphore.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_pass, password)
+
+    async def verify(self, password: str, hashed_pass: str) -> bool:
+        return await self._run(verify_password, password, hashed_pass)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "waiting": self.waiting,
+            "running": self.running,
+            "completed": self.completed,
+            "wait_seconds_total": self.wait_seconds_total,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+password_hasher = PasswordHasher(workers=settings.password_hash.workers)
+
+
 async def authenticate_user(
     username: str,
     password: str,
@@ -45,7 +191,7 @@ async def authenticate_user(
     user = user_query.scalar_one_or_none()
     if not user:
         raise False
-    if not verify_password(password, user.hashed_password):
+    if not await password_hasher.verify(password, user.hashed_password):
         return False
     return user
 
@@ -168,7 +314,11 @@ async def refresh_access_token(
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_bearer)],
-):
+) -> CurrentUser:
+    user = token_cache.get(token)
+    if user is not None:
+        return user
+
     try:
         payload = jwt.decode(
             token,
@@ -183,11 +333,9 @@ async def get_current_user(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Could not validate",
             )
-        return {
-            "id": user_id,
-            "username": username,
-            "email": email,
-        }
+        user = CurrentUser(id=user_id, username=username, email=email)
+        token_cache.set(token, user, payload.get("exp"))
+        return user
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -196,7 +344,7 @@ async def get_current_user(
 
 
 async def get_current_auth_user(
-    user: Annotated[dict, Depends(get_current_user)],
+    user: Annotated[CurrentUser, Depends(get_current_user)],
 ):
     if user is None:
         raise HTTPException(
@@ -208,9 +356,9 @@ async def get_current_auth_user(
 
 def has_permission(
     user: User = Depends(user_by_id),
-    current_user: dict = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
 ):
-    if current_user["id"] != user.id:
+    if current_user.id != user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=[
@@ -225,12 +373,12 @@ def has_permission(
 
 async def get_current_auth_user_model(
     session: AsyncSession,
-    user: Annotated[dict, Depends(get_current_user)],
+    user: Annotated[CurrentUser, Depends(get_current_user)],
 ):
 
     auth_user = await session.scalar(
         select(User)
-        .where(User.id == user["id"])
+        .where(User.id == user.id)
     )
 
     if auth_user is None:
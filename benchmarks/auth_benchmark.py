@@ -0,0 +1,105 @@
+"""Per-request auth overhead of ``get_current_user``, before and after the
+verified-token cache.
+
+    python benchmarks/auth_benchmark.py --users 200 --requests 50 --concurrency 100
+
+"before" decodes the JWT and builds a dict on every call, which is what the
+dependency did prior to the cache; "after" goes through the current
+``auth.utils.get_current_user``.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / "src")]
+
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("JWT_REFRESH_SECRET_KEY", "benchmark-refresh-secret")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_DAYS", "7")
+
+from jose import jwt  # noqa: E402
+
+from auth.utils import (  # noqa: E402
+    create_access_and_refresh_tokens,
+    get_current_user,
+    token_cache,
+)
+from src.config import settings  # noqa: E402
+
+
+async def decode_every_time(token: str) -> dict:
+    payload = jwt.decode(
+        token,
+        settings.jwt.secret_key,
+        algorithms=[settings.jwt.algorithm],
+    )
+    return {
+        "id": payload.get("id"),
+        "username": payload.get("username"),
+        "email": payload.get("email"),
+    }
+
+
+async def run(resolve, tokens: list[str], requests: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one_request(token: str) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await resolve(token)
+            latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(one_request(token) for token in tokens for _ in range(requests))
+    )
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / elapsed),
+        "mean_us": round(statistics.fmean(latencies) * 1e6, 2),
+        "p99_us": round(latencies[int(len(latencies) * 0.99) - 1] * 1e6, 2),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=100)
+    args = parser.parse_args()
+
+    tokens = [
+        create_access_and_refresh_tokens(
+            f"user{user_id}",
+            user_id,
+            f"user{user_id}@example.com",
+            timedelta(minutes=30),
+            timedelta(days=1),
+        )[0]
+        for user_id in range(1, args.users + 1)
+    ]
+
+    token_cache.clear()
+    before = await run(decode_every_time, tokens, args.requests, args.concurrency)
+    after = await run(get_current_user, tokens, args.requests, args.concurrency)
+
+    for name, result in (("before", before), ("after", after)):
+        print(f"{name:>6}: " + ", ".join(f"{k}={v}" for k, v in result.items()))
+    print(f"speedup: {before['mean_us'] / after['mean_us']:.1f}x mean latency")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,530 @@
+"""Load test of the whole API: seed synthetic data, drive a request mix, report latency.
+
+    alembic upgrade head
+    python benchmarks/load_test.py --users 100 --words 100000 --mix default \\
+        --concurrency 50 --duration 30 --output results.json
+    python benchmarks/load_test.py ... --compare results.json
+
+The app from ``src/main.py`` runs in this process (lifespan included) behind
+httpx's ASGI transport, against the database configured through the usual
+DB_* variables; pass ``--base-url`` to hit a running server instead, in
+which case queries per request are not reported. Seeded users, topics and
+words are spread evenly and removed again unless ``--keep`` is given.
+
+Operations: login, list_topics, list_words, create_word, delete_topic (a
+scratch topic with ``--scratch-words`` words is created untimed and its
+DELETE is timed). ``--mix`` is one of MIXES or ``op=weight,...``.
+"""
+
+import argparse
+import asyncio
+import contextvars
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / "src")]
+
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("JWT_REFRESH_SECRET_KEY", "benchmark-refresh-secret")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_DAYS", "7")
+
+import httpx  # noqa: E402
+from sqlalchemy import event, select, text  # noqa: E402
+from sqlalchemy.dialects.postgresql import insert as pg_insert  # noqa: E402
+
+from auth.utils import hash_pass  # noqa: E402
+from src.models import db_helper, GrammarElement, Language  # noqa: E402
+
+PASSWORD = "load-test-password"
+NAME = "loadtest"
+
+MIXES = {
+    "default": {
+        "login": 1,
+        "list_topics": 30,
+        "list_words": 40,
+        "create_word": 20,
+        "delete_topic": 2,
+    },
+    "read-heavy": {
+        "login": 1,
+        "list_topics": 45,
+        "list_words": 50,
+        "create_word": 3,
+        "delete_topic": 1,
+    },
+    "write-heavy": {
+        "login": 1,
+        "list_topics": 10,
+        "list_words": 15,
+        "create_word": 60,
+        "delete_topic": 14,
+    },
+}
+
+SEED_WORDS = text(
+    """
+    WITH seeded_topics AS (
+        SELECT id AS topic_id, user_id FROM topics WHERE id = ANY(:topic_ids)
+    ),
+    source AS (
+        SELECT topic_id, user_id, g, nextval('words_id_seq') AS word_id,
+               'w' || topic_id || 'x' || g AS learnt_word
+        FROM seeded_topics, generate_series(1, :words_per_topic) AS g
+    ),
+    new_words AS (
+        INSERT INTO words (id, learnt_word, definition, example, grammar_element_id)
+        SELECT word_id, learnt_word, 'definition number ' || g,
+               'an example for ' || learnt_word, :grammar_element_id
+        FROM source
+    ),
+    new_associations AS (
+        INSERT INTO topic_word_association (word_id, topic_id, learnt_word)
+        SELECT word_id, topic_id, learnt_word FROM source
+    )
+    INSERT INTO review_cards (user_id, word_id)
+    SELECT user_id, word_id FROM source
+    """
+)
+
+# Set around every in-process request; the engine listener counts into it.
+query_counter: contextvars.ContextVar[list[int] | None] = contextvars.ContextVar(
+    "query_counter", default=None
+)
+
+
+def count_query(*args) -> None:
+    counter = query_counter.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    if value in MIXES:
+        return MIXES[value]
+    mix = {}
+    for part in value.split(","):
+        op, _, weight = part.partition("=")
+        if op not in MIXES["default"]:
+            raise argparse.ArgumentTypeError(f"unknown operation {op!r}")
+        mix[op] = float(weight)
+    return mix
+
+
+async def get_or_create(session, model, name: str) -> int:
+    await session.execute(pg_insert(model).values(name=name).on_conflict_do_nothing())
+    return await session.scalar(select(model.id).where(model.name == name))
+
+
+async def seed(prefix: str, users: int, topics_per_user: int, words: int) -> dict:
+    words_per_topic = max(1, words // (users * topics_per_user))
+    hashed_password = hash_pass(PASSWORD)
+    now = datetime.utcnow()
+
+    async with db_helper.session_factory() as session:
+        language_id = await get_or_create(session, Language, NAME)
+        grammar_element_id = await get_or_create(session, GrammarElement, NAME)
+        user_ids = list(
+            await session.scalars(
+                text(
+                    """
+                    INSERT INTO users (username, email, hashed_password, created_at,
+                                       updated_at, is_active, is_superuser, is_verified)
+                    SELECT :prefix || '-' || n, NULL, :hashed_password, :now, :now,
+                           true, false, false
+                    FROM generate_series(1, :users) AS n
+                    RETURNING id
+                    """
+                ),
+                {
+                    "prefix": prefix,
+                    "hashed_password": hashed_password,
+                    "now": now,
+                    "users": users,
+                },
+            )
+        )
+        topics = (
+            await session.execute(
+                text(
+                    """
+                    INSERT INTO topics (name, language_id, user_id, word_count)
+                    SELECT 'topic ' || t, :language_id, u.id, :words_per_topic
+                    FROM unnest(CAST(:user_ids AS integer[])) AS u(id),
+                         generate_series(1, :topics_per_user) AS t
+                    RETURNING id, user_id
+                    """
+                ),
+                {
+                    "language_id": language_id,
+                    "words_per_topic": words_per_topic,
+                    "user_ids": user_ids,
+                    "topics_per_user": topics_per_user,
+                },
+            )
+        ).all()
+        await session.commit()
+
+        # Chunks of roughly 50k words keep each statement's memory bounded.
+        topic_ids = [topic_id for topic_id, _ in topics]
+        chunk = max(1, 50_000 // words_per_topic)
+        for start in range(0, len(topic_ids), chunk):
+            await session.execute(
+                SEED_WORDS,
+                {
+                    "topic_ids": topic_ids[start : start + chunk],
+                    "words_per_topic": words_per_topic,
+                    "grammar_element_id": grammar_element_id,
+                },
+            )
+            await session.commit()
+
+        await session.execute(
+            text(
+                """
+                INSERT INTO user_grammar_element_stats
+                    (user_id, grammar_element_id, word_count)
+                SELECT id, :grammar_element_id, :word_count
+                FROM unnest(CAST(:user_ids AS integer[])) AS u(id)
+                """
+            ),
+            {
+                "grammar_element_id": grammar_element_id,
+                "word_count": words_per_topic * topics_per_user,
+                "user_ids": user_ids,
+            },
+        )
+        await session.commit()
+        for table in ("users", "topics", "words", "topic_word_association"):
+            await session.execute(text(f"ANALYZE {table}"))
+
+    topics_by_user: dict[int, list[int]] = {user_id: [] for user_id in user_ids}
+    for topic_id, user_id in topics:
+        topics_by_user[user_id].append(topic_id)
+    return {
+        "language_id": language_id,
+        "grammar_element_id": grammar_element_id,
+        "user_ids": user_ids,
+        "users": [
+            {"username": f"{prefix}-{n}", "topic_ids": topics_by_user[user_id]}
+            for n, user_id in enumerate(user_ids, start=1)
+        ],
+        "words_per_topic": words_per_topic,
+    }
+
+
+async def cleanup(user_ids: list[int]) -> None:
+    async with db_helper.session_factory() as session:
+        params = {"user_ids": user_ids}
+        owned_topics = "SELECT id FROM topics WHERE user_id = ANY(:user_ids)"
+        await session.execute(
+            text(
+                "DELETE FROM words WHERE id IN (SELECT word_id FROM "
+                f"topic_word_association WHERE topic_id IN ({owned_topics}))"
+            ),
+            params,
+        )
+        await session.execute(
+            text("DELETE FROM topics WHERE user_id = ANY(:user_ids)"), params
+        )
+        await session.execute(
+            text("DELETE FROM users WHERE id = ANY(:user_ids)"), params
+        )
+        await session.commit()
+
+
+class VirtualUser:
+    def __init__(self, client: httpx.AsyncClient, username: str, topic_ids: list[int]):
+        self.client = client
+        self.username = username
+        self.topic_ids = topic_ids
+        self.headers: dict[str, str] = {}
+        self.language_id: int | None = None
+        self.grammar_element_id: int | None = None
+        self.scratch_words = 0
+        self._counter = 0
+
+    def _unique(self, prefix: str) -> str:
+        self._counter += 1
+        return f"{prefix}{uuid.uuid4().hex[:8]}{self._counter}"[:20]
+
+    async def login(self) -> httpx.Response:
+        response = await self.client.post(
+            "/auth/user/token/",
+            data={"username": self.username, "password": PASSWORD},
+        )
+        if response.status_code == 200:
+            token = response.json()["access_token"]
+            self.headers = {"Authorization": f"Bearer {token}"}
+        return response
+
+    async def list_topics(self) -> httpx.Response:
+        return await self.client.get("/topic/all-user-topics/", headers=self.headers)
+
+    async def list_words(self) -> httpx.Response:
+        return await self.client.get(
+            "/word/all-user-words/",
+            params={"topic_id": random.choice(self.topic_ids)},
+            headers=self.headers,
+        )
+
+    async def create_word(self) -> httpx.Response:
+        return await self.client.post(
+            "/word/",
+            params={"topic_id": random.choice(self.topic_ids)},
+            json={
+                "learnt_word": self._unique("n"),
+                "definition": "created by the load test",
+                "example": "",
+                "grammar_element_id": self.grammar_element_id,
+            },
+            headers=self.headers,
+        )
+
+    async def prepare_delete_topic(self) -> int | None:
+        response = await self.client.post(
+            "/topic/",
+            json={"name": self._unique("scratch"), "language_id": self.language_id},
+            headers=self.headers,
+        )
+        if response.status_code != 200:
+            return None
+        topic_id = response.json()["id"]
+        if self.scratch_words:
+            await self.client.post(
+                "/word/import/",
+                params={"topic_id": topic_id},
+                json=[
+                    {
+                        "learnt_word": f"s{number}",
+                        "definition": "scratch",
+                        "example": "",
+                        "grammar_element_id": self.grammar_element_id,
+                    }
+                    for number in range(self.scratch_words)
+                ],
+                headers=self.headers,
+            )
+        return topic_id
+
+    async def delete_topic(self, topic_id: int) -> httpx.Response:
+        return await self.client.delete(f"/topic/{topic_id}/", headers=self.headers)
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = {}
+        self.queries: dict[str, list[int]] = {}
+        self.errors: dict[str, int] = {}
+
+    async def timed(self, op: str, request) -> None:
+        counter = [0]
+        token = query_counter.set(counter)
+        started = time.perf_counter()
+        try:
+            response = await request()
+            ok = response.status_code < 400
+        except httpx.HTTPError:
+            ok = False
+        finally:
+            elapsed = time.perf_counter() - started
+            query_counter.reset(token)
+
+        self.latencies.setdefault(op, []).append(elapsed)
+        self.queries.setdefault(op, []).append(counter[0])
+        if not ok:
+            self.errors[op] = self.errors.get(op, 0) + 1
+
+    def summary(self, elapsed: float, count_queries: bool) -> dict:
+        def percentile(values: list[float], p: float) -> float:
+            return round(values[max(0, int(len(values) * p) - 1)] * 1000, 2)
+
+        operations = {}
+        for op, values in sorted(self.latencies.items()):
+            values = sorted(values)
+            operations[op] = {
+                "requests": len(values),
+                "errors": self.errors.get(op, 0),
+                "mean_ms": round(statistics.fmean(values) * 1000, 2),
+                "p50_ms": percentile(values, 0.50),
+                "p95_ms": percentile(values, 0.95),
+                "p99_ms": percentile(values, 0.99),
+                "max_ms": round(values[-1] * 1000, 2),
+                "queries_per_request": (
+                    round(statistics.fmean(self.queries[op]), 2)
+                    if count_queries
+                    else None
+                ),
+            }
+        total = sum(len(values) for values in self.latencies.values())
+        return {
+            "requests": total,
+            "errors": sum(self.errors.values()),
+            "throughput_rps": round(total / elapsed, 1),
+            "operations": operations,
+        }
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    seeded: dict,
+    mix: dict[str, float],
+    args: argparse.Namespace,
+) -> dict:
+    recorder = Recorder()
+    ops, weights = zip(*mix.items())
+    deadline = time.monotonic() + args.duration
+    remaining = args.requests
+
+    async def run_user(number: int) -> None:
+        nonlocal remaining
+        seeded_user = seeded["users"][number % len(seeded["users"])]
+        user = VirtualUser(client, seeded_user["username"], seeded_user["topic_ids"])
+        user.language_id = seeded["language_id"]
+        user.grammar_element_id = seeded["grammar_element_id"]
+        user.scratch_words = args.scratch_words
+        await user.login()
+
+        while time.monotonic() < deadline:
+            if args.requests:
+                if remaining <= 0:
+                    return
+                remaining -= 1
+            op = random.choices(ops, weights)[0]
+            if op == "delete_topic":
+                topic_id = await user.prepare_delete_topic()
+                if topic_id is None:
+                    continue
+                await recorder.timed(op, lambda: user.delete_topic(topic_id))
+            else:
+                await recorder.timed(op, getattr(user, op))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(run_user(number) for number in range(args.concurrency)))
+    return recorder.summary(time.perf_counter() - started, args.base_url is None)
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(result: dict, baseline: dict | None) -> None:
+    print(
+        f"{result['requests']} requests, {result['errors']} errors, "
+        f"{result['throughput_rps']} req/s"
+    )
+    header = (
+        f"{'operation':<14}{'n':>7}{'err':>5}{'p50':>9}{'p95':>9}{'p99':>9}{'q/req':>7}"
+    )
+    print(header + ("   p95 vs baseline" if baseline else ""))
+    for op, stats in result["operations"].items():
+        line = (
+            f"{op:<14}{stats['requests']:>7}{stats['errors']:>5}"
+            f"{stats['p50_ms']:>9}{stats['p95_ms']:>9}{stats['p99_ms']:>9}"
+            f"{stats['queries_per_request'] if stats['queries_per_request'] is not None else '-':>7}"
+        )
+        previous = (baseline or {}).get("operations", {}).get(op)
+        if previous and previous["p95_ms"]:
+            change = (stats["p95_ms"] / previous["p95_ms"] - 1) * 100
+            line += f"   {change:+.1f}% (was {previous['p95_ms']})"
+        print(line)
+    if baseline:
+        print(
+            f"throughput was {baseline['throughput_rps']} req/s "
+            f"at {baseline.get('meta', {}).get('commit')}"
+        )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--topics-per-user", type=int, default=10)
+    parser.add_argument("--words", type=int, default=10_000)
+    parser.add_argument("--mix", type=parse_mix, default="default")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--requests", type=int, default=0, help="stop after N")
+    parser.add_argument("--scratch-words", type=int, default=20)
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None)
+    parser.add_argument("--keep", action="store_true")
+    args = parser.parse_args()
+    if isinstance(args.mix, str):
+        args.mix = parse_mix(args.mix)
+    random.seed(args.seed)
+
+    prefix = f"{NAME}-{uuid.uuid4().hex[:6]}"
+    started = time.perf_counter()
+    seeded = await seed(prefix, args.users, args.topics_per_user, args.words)
+    print(
+        f"seeded {args.users} users, {args.users * args.topics_per_user} topics, "
+        f"{len(seeded['user_ids']) * args.topics_per_user * seeded['words_per_topic']}"
+        f" words in {time.perf_counter() - started:.1f}s"
+    )
+
+    try:
+        if args.base_url:
+            async with httpx.AsyncClient(base_url=args.base_url, timeout=60) as client:
+                result = await drive(client, seeded, args.mix, args)
+        else:
+            from main import create_app
+
+            app = create_app()
+
+            engines = [db_helper.engine, *db_helper.replica_engines]
+            for engine in engines:
+                event.listen(engine.sync_engine, "before_cursor_execute", count_query)
+            transport = httpx.ASGITransport(app=app)
+            async with app.router.lifespan_context(app):
+                async with httpx.AsyncClient(
+                    transport=transport,
+                    base_url="http://load-test/api/v1",
+                    timeout=60,
+                ) as client:
+                    result = await drive(client, seeded, args.mix, args)
+    finally:
+        if not args.keep:
+            await cleanup(seeded["user_ids"])
+        await db_helper.dispose()
+
+    result["meta"] = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "users": args.users,
+        "topics_per_user": args.topics_per_user,
+        "words": args.words,
+        "mix": args.mix,
+        "concurrency": args.concurrency,
+        "duration": args.duration,
+        "base_url": args.base_url,
+    }
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    print_report(result, baseline)
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,176 @@
+"""Load test of the review due-queue query for a user with many cards.
+
+    python benchmarks/review_queue_benchmark.py --cards 100000 --queries 2000 --concurrency 20
+
+Seeds one throwaway user with ``--cards`` words and review cards spread
+over +/- 30 days (plus ``--other-cards`` belonging to other throwaway users
+so the index is not all one user), runs ``get_due_cards`` concurrently,
+prints latency percentiles and the query plan, then deletes everything it
+created. Uses the database configured through the usual DB_* variables.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / "src")]
+
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("JWT_REFRESH_SECRET_KEY", "benchmark-refresh-secret")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_DAYS", "7")
+
+from sqlalchemy import delete, insert, text  # noqa: E402
+from sqlalchemy.dialects import postgresql  # noqa: E402
+
+from api.crud.review_crud import due_cards_stmt, get_due_cards  # noqa: E402
+from src.models import (  # noqa: E402
+    db_helper,
+    GrammarElement,
+    User,
+    Word,
+)
+
+SEED_CARDS = text(
+    """
+    WITH new_words AS (
+        INSERT INTO words (learnt_word, definition, example, grammar_element_id)
+        SELECT 'w' || g, 'benchmark', '', :grammar_element_id
+        FROM generate_series(1, :cards) AS g
+        RETURNING id
+    )
+    INSERT INTO review_cards (user_id, word_id, due_at)
+    SELECT :user_id, id,
+           timezone('utc', now()) + (random() * 60 - 30) * interval '1 day'
+    FROM new_words
+    """
+)
+
+
+async def seed(prefix: str, users: int, cards_per_user: list[int]) -> dict:
+    async with db_helper.session_factory() as session:
+        grammar_element_id = await session.scalar(
+            insert(GrammarElement).values(name=prefix[:20]).returning(GrammarElement.id)
+        )
+        user_ids = list(
+            await session.scalars(
+                insert(User).returning(User.id, sort_by_parameter_order=True),
+                [
+                    {
+                        "username": f"{prefix}-{number}",
+                        "hashed_password": "-",
+                        "created_at": datetime.utcnow(),
+                        "updated_at": datetime.utcnow(),
+                    }
+                    for number in range(users)
+                ],
+            )
+        )
+        for user_id, cards in zip(user_ids, cards_per_user):
+            if cards:
+                await session.execute(
+                    SEED_CARDS,
+                    {
+                        "grammar_element_id": grammar_element_id,
+                        "cards": cards,
+                        "user_id": user_id,
+                    },
+                )
+        await session.commit()
+        await session.execute(text("ANALYZE review_cards"))
+    return {"grammar_element_id": grammar_element_id, "user_ids": user_ids}
+
+
+async def cleanup(seeded: dict) -> None:
+    async with db_helper.session_factory() as session:
+        await session.execute(delete(User).where(User.id.in_(seeded["user_ids"])))
+        await session.execute(
+            delete(Word).where(Word.grammar_element_id == seeded["grammar_element_id"])
+        )
+        await session.execute(
+            delete(GrammarElement).where(
+                GrammarElement.id == seeded["grammar_element_id"]
+            )
+        )
+        await session.commit()
+
+
+async def explain(user_id: int, limit: int) -> str:
+    stmt = due_cards_stmt(user_id, datetime.utcnow(), limit).compile(
+        dialect=postgresql.dialect(),
+        compile_kwargs={"literal_binds": True},
+    )
+    async with db_helper.session_factory() as session:
+        rows = await session.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {stmt}"))
+        return "\n".join(row[0] for row in rows)
+
+
+async def run(user_id: int, limit: int, queries: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one_query() -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            async with db_helper.session_factory() as session:
+                await get_due_cards(user_id=user_id, limit=limit, session=session)
+            latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one_query() for _ in range(queries)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def percentile(p: float) -> float:
+        return round(latencies[max(0, int(len(latencies) * p) - 1)] * 1000, 2)
+
+    return {
+        "queries": len(latencies),
+        "throughput_qps": round(len(latencies) / elapsed),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2),
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=100_000)
+    parser.add_argument("--other-users", type=int, default=4)
+    parser.add_argument("--other-cards", type=int, default=25_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    prefix = f"bench-{uuid.uuid4().hex[:8]}"
+    started = time.perf_counter()
+    seeded = await seed(
+        prefix,
+        users=1 + args.other_users,
+        cards_per_user=[args.cards] + [args.other_cards] * args.other_users,
+    )
+    print(f"seeded in {time.perf_counter() - started:.1f}s")
+    user_id = seeded["user_ids"][0]
+
+    try:
+        print(await explain(user_id, args.limit))
+        result = await run(user_id, args.limit, args.queries, args.concurrency)
+        print(", ".join(f"{k}={v}" for k, v in result.items()))
+    finally:
+        await cleanup(seeded)
+        await db_helper.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,110 @@
+"""Cost of serializing word and topic lists: response_model vs the orjson fast path.
+
+    python benchmarks/serialization_benchmark.py --rows 10000 --repeat 20
+
+"response_model" runs FastAPI's own serialize_response (Pydantic validation
+with from_attributes, then jsonable_encoder) over ORM instances and renders
+a JSONResponse, which is what a route returning ORM objects does. "orjson"
+renders the column dicts produced by ``api.fast_json.fetch_dicts`` through
+``fast_json_response``. No database is involved; rows are built in memory.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / "src")]
+
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("JWT_REFRESH_SECRET_KEY", "benchmark-refresh-secret")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_DAYS", "7")
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+
+from api.fast_json import fast_json_response  # noqa: E402
+from api.schemas.topic_schemas import Topic as PydanticTopic  # noqa: E402
+from api.schemas.word_schemas import Word as PydanticWord  # noqa: E402
+from src.models import Topic, Word  # noqa: E402
+
+
+def make_words(count: int) -> list[dict]:
+    return [
+        {
+            "learnt_word": f"word{number}",
+            "definition": f"definition of word number {number}",
+            "example": f"an example sentence using word{number}",
+            "grammar_element_id": number % 7 + 1,
+            "id": number,
+        }
+        for number in range(1, count + 1)
+    ]
+
+
+def make_topics(count: int) -> list[dict]:
+    return [
+        {
+            "name": f"topic{number}",
+            "language_id": number % 5 + 1,
+            "id": number,
+            "user_id": 1,
+            "word_count": number % 500,
+            "updated_at": datetime(2024, 1, 1, 12, 0, number % 60),
+        }
+        for number in range(1, count + 1)
+    ]
+
+
+async def response_model_path(field, objects) -> bytes:
+    content = await serialize_response(field=field, response_content=objects)
+    return JSONResponse(content).body
+
+
+async def orjson_path(rows) -> bytes:
+    return fast_json_response(rows).body
+
+
+async def measure(func, *args, repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = await func(*args)
+        timings.append(time.perf_counter() - started)
+    return {"mean_ms": statistics.fmean(timings) * 1000, "bytes": len(body)}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    cases = (
+        ("words", Word, PydanticWord, make_words(args.rows)),
+        ("topics", Topic, PydanticTopic, make_topics(args.rows)),
+    )
+    for name, model, schema, rows in cases:
+        field = create_response_field(name=f"{name}_response", type_=list[schema])
+        objects = [model(**row) for row in rows]
+
+        before = await measure(response_model_path, field, objects, repeat=args.repeat)
+        after = await measure(orjson_path, rows, repeat=args.repeat)
+        print(
+            f"{name:>6} x{args.rows}: "
+            f"response_model {before['mean_ms']:.1f} ms ({before['bytes']} B), "
+            f"orjson {after['mean_ms']:.1f} ms ({after['bytes']} B), "
+            f"{before['mean_ms'] / after['mean_ms']:.1f}x faster"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
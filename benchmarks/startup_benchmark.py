@@ -0,0 +1,182 @@
+"""Cold start cost of a worker: importing the app, optionally running its startup.
+
+    python benchmarks/startup_benchmark.py --runs 5 --output startup.json
+    python benchmarks/startup_benchmark.py --compare startup.json
+
+Every run is a fresh interpreter importing ``main`` and building the app
+with ``create_app()`` under ``-X importtime`` (as uvicorn does from
+``src/``), so nothing is shared between runs except the OS file cache.
+Reported: wall time of the whole process, total import time, the slowest
+modules by their own import time and the heaviest imports made directly by
+``main`` or ``create_app()`` by cumulative time. ``--lifespan`` also runs the app's
+startup and shutdown, which needs the database configured through the
+usual DB_* variables. Results are plain JSON so runs from different
+commits or machines can be compared without any CI involved.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+ENV_DEFAULTS = {
+    "ALGORITHM": "HS256",
+    "JWT_SECRET_KEY": "benchmark-secret",
+    "JWT_REFRESH_SECRET_KEY": "benchmark-refresh-secret",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+    "REFRESH_TOKEN_EXPIRE_DAYS": "7",
+}
+
+IMPORT_ONLY = "import main; main.create_app()"
+WITH_LIFESPAN = """
+import asyncio, main
+
+app = main.create_app()
+
+async def start_and_stop():
+    async with app.router.lifespan_context(app):
+        pass
+
+asyncio.run(start_and_stop())
+"""
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int, int]]:
+    # "import time: self [us] | cumulative | imported package", indented by depth
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return modules
+
+
+def run_once(code: str) -> dict:
+    env = {
+        **ENV_DEFAULTS,
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(ROOT), str(ROOT / "src")]),
+    }
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT / "src",
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    wall = time.perf_counter() - started
+    modules = parse_importtime(result.stderr)
+    if result.returncode != 0:
+        errors = [
+            line for line in result.stderr.splitlines() if "import time" not in line
+        ]
+        raise SystemExit("\n".join(errors[-20:]))
+    return {"wall_ms": wall * 1000, "modules": modules}
+
+
+def summarize(runs: list[dict], top: int) -> dict:
+    self_ms = defaultdict(list)
+    direct_ms = defaultdict(list)
+    totals = []
+    for run in runs:
+        total = 0
+        main_imported = False
+        for name, self_us, cumulative_us, depth in run["modules"]:
+            self_ms[name].append(self_us / 1000)
+            if depth == 0:
+                total += cumulative_us
+            # A module is listed after its own imports, so top-level entries
+            # after ``main`` are the ones create_app() imports.
+            if depth == 1 or depth == 0 and main_imported:
+                direct_ms[name].append(cumulative_us / 1000)
+            main_imported = main_imported or name == "main"
+        totals.append(total / 1000)
+
+    def medians(values: dict) -> dict:
+        ranked = sorted(
+            ((name, statistics.median(ms)) for name, ms in values.items()),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        return {name: round(ms, 1) for name, ms in ranked[:top]}
+
+    return {
+        "runs": len(runs),
+        "wall_ms": round(statistics.median(run["wall_ms"] for run in runs), 1),
+        "import_ms": round(statistics.median(totals), 1),
+        "modules": len(runs[-1]["modules"]),
+        "slowest_self_ms": medians(self_ms),
+        "direct_imports_cumulative_ms": medians(direct_ms),
+    }
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(result: dict, baseline: dict | None) -> None:
+    def change(key: str) -> str:
+        if not baseline or not baseline.get(key):
+            return ""
+        return f" ({(result[key] / baseline[key] - 1) * 100:+.1f}% vs {baseline[key]})"
+
+    print(
+        f"median of {result['runs']} runs: wall {result['wall_ms']} ms"
+        f"{change('wall_ms')}, imports {result['import_ms']} ms"
+        f"{change('import_ms')}, {result['modules']} modules"
+    )
+    print("heaviest direct imports (cumulative ms):")
+    for name, ms in result["direct_imports_cumulative_ms"].items():
+        print(f"  {ms:>8}  {name}")
+    print("slowest modules (self ms):")
+    for name, ms in result["slowest_self_ms"].items():
+        print(f"  {ms:>8}  {name}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--lifespan", action="store_true")
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None)
+    args = parser.parse_args()
+
+    code = WITH_LIFESPAN if args.lifespan else IMPORT_ONLY
+    runs = [run_once(code) for _ in range(args.runs)]
+    result = summarize(runs, args.top)
+    result["meta"] = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "lifespan": args.lifespan,
+    }
+
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    print_report(result, baseline)
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,51 +1,172 @@
 import os
+from functools import lru_cache
 
 from dotenv import load_dotenv
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings
 
 
 class GetEnvValues(BaseSettings):
-    load_dotenv()  # Дозволяє забрати з .env змінні
-
     DB_HOST: str = os.environ.get("DB_HOST")
     DB_PORT: int = os.environ.get("DB_PORT")
     DB_NAME: str = os.environ.get("DB_NAME")
     DB_USER: str = os.environ.get("DB_USER")
     DB_PASS: str = os.environ.get("DB_PASS")
+    DB_REPLICA_URLS: str = ""
+    DB_REPLICA_RETRY_SECONDS: int = 30
+    DB_READ_YOUR_WRITES_SECONDS: int = 5
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_STATEMENT_TIMEOUT_MS: int = 30000
+    DB_APPLICATION_NAME: str = "vocabulary-app"
+    DB_POOL_WARM_CONNECTIONS: int = 5
     ACCESS_TOKEN_EXPIRE_MINUTES: int = os.environ.get("ACCESS_TOKEN_EXPIRE_MINUTES")
     REFRESH_TOKEN_EXPIRE_DAYS: int = os.environ.get("REFRESH_TOKEN_EXPIRE_DAYS")
     ALGORITHM: str = os.environ.get("ALGORITHM")
     JWT_SECRET_KEY: str = os.environ.get("JWT_SECRET_KEY")
     JWT_REFRESH_SECRET_KEY: str = os.environ.get("JWT_REFRESH_SECRET_KEY")
+    PASSWORD_HASH_WORKERS: int | None = None
+    REVIEW_FLUSH_SIZE: int = 500
+    REVIEW_FLUSH_INTERVAL_SECONDS: float = 2
+    REVIEW_MAX_PENDING: int = 50_000
+    SLOW_QUERY_MS: float = 200
+    METRICS_REFRESH_SECONDS: float = 5
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int | None = None
+    SERVER_KEEPALIVE_SECONDS: int = 5
+    SERVER_BACKLOG: int = 2048
+    SERVER_TIMEOUT_SECONDS: int = 60
+    SERVER_GRACEFUL_TIMEOUT_SECONDS: int = 30
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def blank_as_unset(cls, value, info: ValidationInfo):
+        # Keys left blank in .env fall back to their defaults instead of
+        # failing to parse as numbers; a blank string setting (DB_PASS) is
+        # kept as it is.
+        field = cls.model_fields[info.field_name]
+        if value == "" and field.annotation is not str:
+            return field.get_default()
+        return value
+
+
+@lru_cache
+def get_env_values() -> GetEnvValues:
+    load_dotenv()  # Дозволяє забрати з .env змінні
+    return GetEnvValues()
 
 
-class JWTSettings(BaseModel):
-    env_values: GetEnvValues = GetEnvValues()
+def _env(name: str):
+    # Read when the settings are built, not when this module is imported.
+    return Field(default_factory=lambda: getattr(get_env_values(), name))
 
-    access_token_expire_minutes: int = env_values.ACCESS_TOKEN_EXPIRE_MINUTES
-    refresh_token_expire_days: int = env_values.REFRESH_TOKEN_EXPIRE_DAYS
-    algorithm: str = env_values.ALGORITHM
-    secret_key: str = env_values.JWT_SECRET_KEY
-    refresh_secret_key: str = env_values.JWT_REFRESH_SECRET_KEY
 
+def _cpu_count_unless_set(name: str):
+    return Field(
+        default_factory=lambda: getattr(get_env_values(), name) or os.cpu_count() or 1
+    )
 
-class DbSettings(BaseModel):
-    env_values: GetEnvValues = GetEnvValues()
 
-    url: str = (
+def _db_url() -> str:
+    env_values = get_env_values()
+    return (
         f"postgresql+asyncpg://{env_values.DB_USER}:{env_values.DB_PASS}"
-        f"@{env_values.DB_HOST}:{env_values.DB_PORT}/{env_values.DB_NAME}?async_fallback=True"
+        f"@{env_values.DB_HOST}:{env_values.DB_PORT}/{env_values.DB_NAME}"
     )
 
-    echo: bool = False
 
+def _db_replica_urls() -> list[str]:
+    urls = get_env_values().DB_REPLICA_URLS.split(",")
+    return [url.strip() for url in urls if url.strip()]
+
+
+class JWTSettings(BaseModel):
+    access_token_expire_minutes: int = _env("ACCESS_TOKEN_EXPIRE_MINUTES")
+    refresh_token_expire_days: int = _env("REFRESH_TOKEN_EXPIRE_DAYS")
+    algorithm: str = _env("ALGORITHM")
+    secret_key: str = _env("JWT_SECRET_KEY")
+    refresh_secret_key: str = _env("JWT_REFRESH_SECRET_KEY")
+    token_cache_size: int = 10_000
+    token_cache_ttl_seconds: int = 300
+
+
+class PasswordHashSettings(BaseModel):
+    workers: int = _cpu_count_unless_set("PASSWORD_HASH_WORKERS")
 
-class Settings(BaseSettings):
-    api_v1_prefix: str = "/api/v1"
 
-    jwt: JWTSettings = JWTSettings()
-    db: DbSettings = DbSettings()
+class ReviewBufferSettings(BaseModel):
+    flush_size: int = _env("REVIEW_FLUSH_SIZE")
+    flush_interval_seconds: float = _env("REVIEW_FLUSH_INTERVAL_SECONDS")
+    max_pending: int = _env("REVIEW_MAX_PENDING")
 
 
-settings = Settings()
+class QueryStatsSettings(BaseModel):
+    slow_query_ms: float = _env("SLOW_QUERY_MS")
+
+
+class MetricsSettings(BaseModel):
+    refresh_seconds: float = _env("METRICS_REFRESH_SECONDS")
+
+
+class ServerSettings(BaseModel):
+    host: str = _env("SERVER_HOST")
+    port: int = _env("SERVER_PORT")
+    workers: int = _cpu_count_unless_set("SERVER_WORKERS")
+    keepalive_seconds: int = _env("SERVER_KEEPALIVE_SECONDS")
+    backlog: int = _env("SERVER_BACKLOG")
+    timeout_seconds: int = _env("SERVER_TIMEOUT_SECONDS")
+    graceful_timeout_seconds: int = _env("SERVER_GRACEFUL_TIMEOUT_SECONDS")
+
+
+class DbSettings(BaseModel):
+    url: str = Field(default_factory=_db_url)
+    replica_urls: list[str] = Field(default_factory=_db_replica_urls)
+    replica_retry_seconds: int = _env("DB_REPLICA_RETRY_SECONDS")
+    read_your_writes_seconds: int = _env("DB_READ_YOUR_WRITES_SECONDS")
+
+    echo: bool = False
+    pool_size: int = _env("DB_POOL_SIZE")
+    max_overflow: int = _env("DB_MAX_OVERFLOW")
+    pool_timeout: float = _env("DB_POOL_TIMEOUT")
+    pool_recycle: int = _env("DB_POOL_RECYCLE")
+    pool_pre_ping: bool = _env("DB_POOL_PRE_PING")
+    statement_cache_size: int = _env("DB_STATEMENT_CACHE_SIZE")
+    statement_timeout_ms: int = _env("DB_STATEMENT_TIMEOUT_MS")
+    application_name: str = _env("DB_APPLICATION_NAME")
+    pool_warm_connections: int = _env("DB_POOL_WARM_CONNECTIONS")
+
+
+class Settings(BaseSettings):
+    api_v1_prefix: str = "/api/v1"
+    word_import_chunk_size: int = 1000
+    word_import_max_rows: int = 10_000
+    word_import_max_bytes: int = 5 * 1024 * 1024
+    topic_delete_batch_size: int = 1000
+    topic_delete_stale_seconds: int = 300
+    quiz_question_ttl_seconds: int = 3600
+
+    jwt: JWTSettings = Field(default_factory=JWTSettings)
+    db: DbSettings = Field(default_factory=DbSettings)
+    password_hash: PasswordHashSettings = Field(default_factory=PasswordHashSettings)
+    review_buffer: ReviewBufferSettings = Field(default_factory=ReviewBufferSettings)
+    query_stats: QueryStatsSettings = Field(default_factory=QueryStatsSettings)
+    metrics: MetricsSettings = Field(default_factory=MetricsSettings)
+    server: ServerSettings = Field(default_factory=ServerSettings)
+
+
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
+
+
+def __getattr__(name: str):
+    # ``from src.config import settings`` keeps working, but the settings are
+    # only built (and .env read) by the first module that asks for them.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,28 +1,154 @@
-import uvicorn
+import time
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, status
 from fastapi.encoders import jsonable_encoder
+from fastapi.exception_handlers import (
+    http_exception_handler,
+    request_validation_exception_handler,
+)
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from api import main_api_router as api_router
-from config import settings
+from api import query_stats
+from api.metrics import metrics_refresher
+from api.reference_cache import reference_cache
+from api.review_buffer import review_buffer
+from auth.utils import password_hasher
+from src.config import get_settings
+from src import metrics
+from src.models import db_helper
+from src.models.db_helper import READ_PRIMARY_COOKIE
 
 
-app = FastAPI(
-    title="Vocabulary App",
-)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Everything a worker needs is ready before it starts taking requests.
+    await db_helper.warm_up(get_settings().db.pool_warm_connections)
+    await reference_cache.start()
+    review_buffer.start()
+    metrics_refresher.start()
+    yield
+    await metrics_refresher.stop()
+    # Buffered review answers are written before the process exits.
+    await review_buffer.stop()
+    await reference_cache.stop()
+    password_hasher.shutdown()
+    await db_helper.dispose()
 
 
-@app.exception_handler(ValidationError)
 async def validation_exception_handler(request: Request, exc: ValidationError):
+    metrics.exceptions.labels(type(exc).__name__).inc()
     return JSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content=jsonable_encoder({"details": exc.errors()}),
     )
 
 
-app.include_router(router=api_router, prefix=settings.api_v1_prefix)
+async def counted_http_exception_handler(request: Request, exc: StarletteHTTPException):
+    metrics.exceptions.labels(type(exc).__name__).inc()
+    return await http_exception_handler(request, exc)
+
+
+async def counted_request_validation_exception_handler(
+    request: Request, exc: RequestValidationError
+):
+    metrics.exceptions.labels(type(exc).__name__).inc()
+    return await request_validation_exception_handler(request, exc)
+
+
+async def read_your_writes(request: Request, call_next):
+    # After a successful write, pin this client's reads to the primary for a
+    # few seconds so replica lag cannot hide what it just committed.
+    response = await call_next(request)
+    if (
+        db_helper.replica_urls
+        and request.method not in ("GET", "HEAD", "OPTIONS")
+        and response.status_code < 400
+    ):
+        pinned_seconds = get_settings().db.read_your_writes_seconds
+        response.set_cookie(
+            READ_PRIMARY_COOKIE,
+            str(time.time() + pinned_seconds),
+            max_age=pinned_seconds,
+            httponly=True,
+        )
+    return response
+
+
+async def instrument_request(request: Request, call_next):
+    # One middleware for timing, query counts and metrics: every extra
+    # http middleware layer costs a task per request.
+    started = time.perf_counter()
+    metrics.http_requests_in_progress.inc()
+    try:
+        with query_stats.collect_queries() as stats:
+            response = await call_next(request)
+    except Exception as exc:
+        metrics.exceptions.labels(type(exc).__name__).inc()
+        metrics.http_requests_in_progress.dec()
+        raise
+
+    # A body without a Content-Length is streamed (the NDJSON export) and
+    # runs its queries after this point, so it gets no Server-Timing header;
+    # the histogram and the request log wait for the body to be sent.
+    if "content-length" in response.headers:
+        response.headers["Server-Timing"] = stats.server_timing(
+            time.perf_counter() - started
+        )
+    body_iterator = response.body_iterator
+
+    async def record_when_sent():
+        try:
+            async for chunk in body_iterator:
+                yield chunk
+        except Exception as exc:
+            metrics.exceptions.labels(type(exc).__name__).inc()
+            raise
+        finally:
+            metrics.http_requests_in_progress.dec()
+            total = time.perf_counter() - started
+            route = request.scope.get("route")
+            metrics.http_request_duration.labels(
+                request.method,
+                route.path if route is not None else "unmatched",
+                response.status_code,
+            ).observe(total)
+            query_stats.log_request(request, response.status_code, stats, total)
+
+    response.body_iterator = record_when_sent()
+    return response
+
+
+def create_app() -> FastAPI:
+    # The routers, and the crud and schema modules behind them, are imported
+    # when a worker builds its app rather than whenever main is imported.
+    from api import main_api_router
+    from api.router.metrics_router import router as metrics_router
+
+    app = FastAPI(
+        title="Vocabulary App",
+        lifespan=lifespan,
+    )
+
+    query_stats.instrument()
+
+    app.add_exception_handler(ValidationError, validation_exception_handler)
+    app.add_exception_handler(StarletteHTTPException, counted_http_exception_handler)
+    app.add_exception_handler(
+        RequestValidationError, counted_request_validation_exception_handler
+    )
+    app.middleware("http")(read_your_writes)
+    app.middleware("http")(instrument_request)
+
+    app.include_router(router=main_api_router, prefix=get_settings().api_v1_prefix)
+    app.include_router(router=metrics_router)
+    return app
 
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", reload=True)
+    import uvicorn
+
+    uvicorn.run("main:create_app", factory=True, reload=True)
@@ -0,0 +1,132 @@
+import os
+
+# prometheus_client picks its value storage at import by whether the
+# variable exists at all; a blank one (e.g. from .env) means single-process.
+if not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+    os.environ.pop("PROMETHEUS_MULTIPROC_DIR", None)
+
+from prometheus_client import (  # noqa: E402
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# With PROMETHEUS_MULTIPROC_DIR set (it must be, before this module is first
+# imported, in every worker) values live in per-process files in that
+# directory and /metrics aggregates all workers; without it this process'
+# own registry is exported.
+MULTIPROCESS = bool(os.environ.get("PROMETHEUS_MULTIPROC_DIR"))
+
+http_request_duration = Histogram(
+    "http_request_duration_seconds",
+    "Time spent handling HTTP requests, by route template.",
+    ["method", "route", "status"],
+)
+http_requests_in_progress = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being handled.",
+    multiprocess_mode="livesum",
+)
+exceptions = Counter(
+    "http_exceptions",
+    "Exceptions raised while handling requests, by exception type.",
+    ["type"],
+)
+
+password_hash_wait = Histogram(
+    "password_hash_wait_seconds",
+    "Time bcrypt calls spend queued for a hashing worker.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+review_buffer_flush_duration = Histogram(
+    "review_buffer_flush_duration_seconds",
+    "Time one review buffer chunk takes to be written and committed.",
+    ["outcome"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+# Snapshots of in-process state, refreshed periodically by every worker (see
+# api.metrics); the cumulative ones restart from zero with their worker.
+password_hash_queue_depth = Gauge(
+    "password_hash_queue_depth",
+    "bcrypt calls waiting for a hashing worker.",
+    multiprocess_mode="livesum",
+)
+db_pool_size = Gauge(
+    "db_pool_size",
+    "Connections kept by the primary database pool.",
+    multiprocess_mode="livesum",
+)
+db_pool_checked_out = Gauge(
+    "db_pool_checked_out",
+    "Primary database connections currently in use.",
+    multiprocess_mode="livesum",
+)
+db_pool_overflow = Gauge(
+    "db_pool_overflow",
+    "Primary database connections opened above pool_size.",
+    multiprocess_mode="livesum",
+)
+db_pool_checkouts = Gauge(
+    "db_pool_checkouts",
+    "Connections handed out by the primary pool since the worker started.",
+    multiprocess_mode="livesum",
+)
+db_pool_checkout_wait = Gauge(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a primary pool connection since the worker started.",
+    multiprocess_mode="livesum",
+)
+cache_hits = Gauge(
+    "cache_hits",
+    "Cache lookups answered from memory since the worker started.",
+    ["cache"],
+    multiprocess_mode="livesum",
+)
+cache_misses = Gauge(
+    "cache_misses",
+    "Cache lookups that had to load since the worker started.",
+    ["cache"],
+    multiprocess_mode="livesum",
+)
+cache_entries = Gauge(
+    "cache_entries",
+    "Entries currently held by a cache.",
+    ["cache"],
+    multiprocess_mode="livesum",
+)
+review_buffer_depth = Gauge(
+    "review_buffer_depth",
+    "Review answers waiting to be written.",
+    multiprocess_mode="livesum",
+)
+review_buffer_written = Gauge(
+    "review_buffer_written",
+    "Review answers written since the worker started.",
+    multiprocess_mode="livesum",
+)
+review_buffer_failed_flushes = Gauge(
+    "review_buffer_failed_flushes",
+    "Review buffer flushes that failed since the worker started.",
+    multiprocess_mode="livesum",
+)
+
+
+def render() -> tuple[bytes, str]:
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int) -> None:
+    # Drops the live gauges of a worker that exited (gunicorn child_exit).
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(pid)
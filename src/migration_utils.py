@@ -0,0 +1,116 @@
+"""Helpers for revisions that must not lock large tables.
+
+They step out of the revision's transaction with ``autocommit_block`` (see
+``transaction_per_migration`` in alembic/env.py), so call them after, not
+in the middle of, anything that must be atomic, and write revisions that
+use them so they can be re-run after a failure halfway.
+"""
+
+import logging
+
+import sqlalchemy as sa
+from alembic import op
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+DEFAULT_BATCH_SIZE = 10_000
+
+
+def _index_is_valid(index_name: str) -> bool | None:
+    # None when there is no such index, False when a failed build left it.
+    return op.get_bind().scalar(
+        sa.text(
+            "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"
+        ),
+        {"name": index_name},
+    )
+
+
+def create_index_concurrently(
+    index_name: str,
+    table_name: str,
+    columns: list[str],
+    **kw,
+) -> None:
+    # Builds without blocking writes. An index that is already there and
+    # valid is left alone, so re-running a revision does not rebuild it; an
+    # INVALID one left by a failed build is dropped and built again.
+    context = op.get_context()
+    with context.autocommit_block():
+        if context.as_sql:
+            # No database to ask when only generating SQL.
+            op.create_index(
+                index_name,
+                table_name,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **kw,
+            )
+            return
+
+        valid = _index_is_valid(index_name)
+        if valid:
+            return
+        if valid is not None:
+            logger.info("Rebuilding invalid index %s", index_name)
+            op.drop_index(
+                index_name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+            )
+        op.create_index(
+            index_name,
+            table_name,
+            columns,
+            postgresql_concurrently=True,
+            **kw,
+        )
+
+
+def drop_index_concurrently(index_name: str, table_name: str) -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            index_name,
+            table_name=table_name,
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def backfill_in_batches(
+    table_name: str,
+    assignments: str,
+    where: str = "true",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    key: str = "id",
+    **params,
+) -> int:
+    """Run ``UPDATE table SET assignments WHERE where`` in primary key ranges.
+
+    Every batch commits on its own, so row locks are held for one batch only
+    and replication never sees one huge transaction. Rows inserted after the
+    backfill starts are not visited: the application must already write the
+    new value itself by the time this runs. ``params`` are bound into
+    ``assignments`` and ``where``.
+    """
+    bind = op.get_bind()
+    update = sa.text(
+        f"UPDATE {table_name} SET {assignments} "
+        f"WHERE {key} > :batch_start AND {key} <= :batch_end AND ({where})"
+    )
+
+    with op.get_context().autocommit_block():
+        start, end = bind.execute(
+            sa.text(f"SELECT min({key}) - 1, max({key}) FROM {table_name}")
+        ).one()
+        updated = 0
+        while start is not None and start < end:
+            result = bind.execute(
+                update,
+                {"batch_start": start, "batch_end": start + batch_size, **params},
+            )
+            updated += result.rowcount
+            start += batch_size
+        logger.info("Backfilled %s rows of %s", updated, table_name)
+    return updated
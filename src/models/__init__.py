@@ -6,15 +6,21 @@ __all__ = (
     "Word",
     "TopicWordAssociation",
     "Topic",
+    "TopicDeleteJob",
     "Language",
+    "ReviewCard",
     "User",
+    "UserGrammarElementStats",
 )
 
 from .base import Base
 from .db_helper import DatabaseHelper, db_helper
 from .grammar_element import GrammarElement
 from .language import Language
+from .review_card import ReviewCard
 from .topic import Topic
+from .topic_delete_job import TopicDeleteJob
 from .topic_word_association import TopicWordAssociation
 from .user import User
+from .user_grammar_element_stats import UserGrammarElementStats
 from .word import Word
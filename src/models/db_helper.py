@@ -1,23 +1,127 @@
+import asyncio
+import itertools
+import logging
+import time
 from asyncio import current_task
 
+from fastapi import Request
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     create_async_engine,
     async_sessionmaker,
     async_scoped_session,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from ..config import settings
 
+logger = logging.getLogger(__name__)
+
+READ_PRIMARY_COOKIE = "read_primary_until"
+READ_PRIMARY_HEADER = "X-Read-Your-Writes"
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long callers wait for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.checkout_seconds_total = 0.0
+        self.checkout_seconds_max = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        connection = super()._do_get()
+        elapsed = time.perf_counter() - started
+
+        self.checkouts += 1
+        self.checkout_seconds_total += elapsed
+        self.checkout_seconds_max = max(self.checkout_seconds_max, elapsed)
+        return connection
+
 
 class DatabaseHelper:
-    def __init__(self, url: str, echo: bool = False):
-        self.engine = create_async_engine(
-            url=url,
+    def __init__(
+        self,
+        url: str,
+        echo: bool = False,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30,
+        pool_recycle: int = -1,
+        pool_pre_ping: bool = False,
+        statement_cache_size: int = 100,
+        server_settings: dict[str, str] | None = None,
+        replica_urls: list[str] | None = None,
+        replica_retry_seconds: float = 30,
+    ):
+        self.url = url
+        self.replica_urls = replica_urls or []
+        self.engine_options = dict(
             echo=echo,
+            poolclass=InstrumentedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            connect_args={
+                # SQLAlchemy keeps its own prepared statement cache on top of
+                # asyncpg's, both are sized together (0 disables them for
+                # pgbouncer in transaction mode).
+                "prepared_statement_cache_size": statement_cache_size,
+                "statement_cache_size": statement_cache_size,
+                "server_settings": server_settings or {},
+            },
         )
-        self.session_factory = async_sessionmaker(
-            bind=self.engine,
+        self.replica_retry_seconds = replica_retry_seconds
+        self._engine: AsyncEngine | None = None
+        self._replica_down_until = [0.0] * len(self.replica_urls)
+        self._replica_counter = itertools.count()
+
+    def connect(self) -> None:
+        # Engines are built on first use (normally the app lifespan) rather
+        # than at import, so importing the app for a CLI or a test is cheap.
+        if self._engine is not None:
+            return
+        engine = create_async_engine(url=self.url, **self.engine_options)
+        self._session_factory = self._make_session_factory(engine)
+        self._replica_engines = [
+            create_async_engine(url=replica_url, **self.engine_options)
+            for replica_url in self.replica_urls
+        ]
+        self._replica_session_factories = [
+            self._make_session_factory(replica) for replica in self._replica_engines
+        ]
+        self._engine = engine
+
+    @property
+    def engine(self) -> AsyncEngine:
+        self.connect()
+        return self._engine
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        self.connect()
+        return self._session_factory
+
+    @property
+    def replica_engines(self) -> list[AsyncEngine]:
+        self.connect()
+        return self._replica_engines
+
+    @property
+    def replica_session_factories(self) -> list[async_sessionmaker[AsyncSession]]:
+        self.connect()
+        return self._replica_session_factories
+
+    @staticmethod
+    def _make_session_factory(engine) -> async_sessionmaker[AsyncSession]:
+        return async_sessionmaker(
+            bind=engine,
             autoflush=False,
             autocommit=False,
             expire_on_commit=False,
@@ -40,8 +144,89 @@ class DatabaseHelper:
     #     yield session
     #     await session.close()
 
+    @staticmethod
+    def wants_primary(request: Request) -> bool:
+        if request.headers.get(READ_PRIMARY_HEADER, "").lower() in ("1", "true"):
+            return True
+        try:
+            return float(request.cookies.get(READ_PRIMARY_COOKIE, 0)) > time.time()
+        except ValueError:
+            return False
+
+    async def open_read_session(self, primary: bool = False) -> AsyncSession:
+        # Round-robin over replicas that are not marked down; a replica that
+        # fails to hand out a connection is skipped for replica_retry_seconds
+        # and the read falls back to the next one, then to the primary.
+        replicas = len(self.replica_session_factories)
+        if not primary and replicas:
+            start = next(self._replica_counter)
+            for offset in range(replicas):
+                index = (start + offset) % replicas
+                if self._replica_down_until[index] > time.monotonic():
+                    continue
+
+                session = self.replica_session_factories[index]()
+                try:
+                    await session.connection()
+                except (DBAPIError, OSError) as exc:
+                    await session.close()
+                    self._replica_down_until[index] = (
+                        time.monotonic() + self.replica_retry_seconds
+                    )
+                    logger.warning("Read replica %s is unavailable: %s", index, exc)
+                    continue
+                return session
+
+        return self.session_factory()
+
+    async def read_session_dependency(self, request: Request) -> AsyncSession:
+        session = await self.open_read_session(primary=self.wants_primary(request))
+        async with session:
+            yield session
+
+    async def warm_up(self, connections: int) -> None:
+        # Opens connections up front so the first requests of a new worker do
+        # not pay for connect, auth and asyncpg type introspection.
+        connections = min(connections, self.engine.pool.size())
+        opened = await asyncio.gather(
+            *(self.engine.connect() for _ in range(connections))
+        )
+        for connection in opened:
+            await connection.close()
+
+    async def dispose(self) -> None:
+        if self._engine is None:
+            return
+        await self.engine.dispose()
+        for engine in self.replica_engines:
+            await engine.dispose()
+
+    def pool_stats(self) -> dict:
+        pool: InstrumentedQueuePool = self.engine.pool
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "checkouts": pool.checkouts,
+            "checkout_seconds_total": pool.checkout_seconds_total,
+            "checkout_seconds_max": pool.checkout_seconds_max,
+        }
+
 
 db_helper = DatabaseHelper(
     url=settings.db.url,
     echo=settings.db.echo,
+    pool_size=settings.db.pool_size,
+    max_overflow=settings.db.max_overflow,
+    pool_timeout=settings.db.pool_timeout,
+    pool_recycle=settings.db.pool_recycle,
+    pool_pre_ping=settings.db.pool_pre_ping,
+    statement_cache_size=settings.db.statement_cache_size,
+    server_settings={
+        "application_name": settings.db.application_name,
+        "statement_timeout": str(settings.db.statement_timeout_ms),
+    },
+    replica_urls=settings.db.replica_urls,
+    replica_retry_seconds=settings.db.replica_retry_seconds,
 )
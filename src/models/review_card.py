@@ -0,0 +1,100 @@
+from typing import TYPE_CHECKING
+from datetime import datetime
+
+from sqlalchemy import (
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    TIMESTAMP,
+    UniqueConstraint,
+    func,
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from .base import Base
+
+if TYPE_CHECKING:
+    from .word import Word
+
+DEFAULT_EASE = 2500
+
+
+class ReviewCard(Base):
+    """SM-2 scheduling state of one word for one user.
+
+    Every word gets a card due immediately when it is created; the due queue
+    is read straight off the (user_id, due_at) index.
+    """
+
+    __tablename__ = "review_cards"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "word_id",
+            name="idx_unique_user_word_card",
+        ),
+        Index(
+            "ix_review_cards_user_id_due_at",
+            "user_id",
+            "due_at",
+        ),
+        # Lets deleting a word find its cards without scanning the table.
+        Index(
+            "ix_review_cards_word_id",
+            "word_id",
+        ),
+    )
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey(
+            "users.id",
+            ondelete="CASCADE",
+        )
+    )
+    word_id: Mapped[int] = mapped_column(
+        ForeignKey(
+            "words.id",
+            ondelete="CASCADE",
+        )
+    )
+    due_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=func.timezone("utc", func.now()),
+    )
+    interval_days: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+    )
+    # Ease factor in thousandths, so SM-2's starting 2.5 is stored as 2500.
+    ease: Mapped[int] = mapped_column(
+        SmallInteger,
+        nullable=False,
+        server_default=str(DEFAULT_EASE),
+    )
+    repetitions: Mapped[int] = mapped_column(
+        SmallInteger,
+        nullable=False,
+        server_default="0",
+    )
+    lapses: Mapped[int] = mapped_column(
+        SmallInteger,
+        nullable=False,
+        server_default="0",
+    )
+    last_reviewed_at: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP,
+        nullable=True,
+    )
+
+    word: Mapped["Word"] = relationship()
+
+    def __str__(self):
+        return (
+            f"{self.__class__.__name__}(word_id={self.word_id}, due_at={self.due_at})"
+        )
+
+    def __repr__(self):
+        return str(self)
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
+from datetime import datetime
 
-from sqlalchemy import String, ForeignKey
+from sqlalchemy import String, ForeignKey, Index, Integer, TIMESTAMP, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -12,6 +13,19 @@ if TYPE_CHECKING:
 
 
 class Topic(Base):
+    __table_args__ = (
+        # Every topic read is scoped to its owner; the name makes the
+        # duplicate-name check an index lookup too.
+        Index(
+            "ix_topics_user_id_name",
+            "user_id",
+            "name",
+        ),
+        Index(
+            "ix_topics_language_id",
+            "language_id",
+        ),
+    )
 
     name: Mapped[str] = mapped_column(
         String(50),
@@ -27,6 +41,28 @@ class Topic(Base):
         ForeignKey("users.id"),
     )
 
+    # Bumped by every write to the topic or its words; used as the ETag of
+    # the topic's word list.
+    revision: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+    # Maintained by the word write paths next to ``revision``.
+    word_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP,
+        nullable=False,
+        default=datetime.utcnow,
+        server_default=func.timezone("utc", func.now()),
+    )
+
     words_details: Mapped[list["TopicWordAssociation"]] = relationship(
         back_populates="topic",
         cascade="all, delete, delete-orphan",
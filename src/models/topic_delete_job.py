@@ -0,0 +1,73 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    TIMESTAMP,
+    func,
+    text,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+ACTIVE_STATUSES = ("pending", "running")
+
+
+class TopicDeleteJob(Base):
+    """Progress of a topic being deleted in the background.
+
+    Kept in the database so any worker can report on it, and so a job whose
+    worker died can be picked up again. The row outlives its topic, which is
+    why topic_id is not a foreign key.
+    """
+
+    __tablename__ = "topic_delete_jobs"
+    __table_args__ = (
+        # At most one active job per topic; also what word writes check to
+        # refuse new words in a topic being deleted.
+        Index(
+            "ix_topic_delete_jobs_active_topic_id",
+            "topic_id",
+            unique=True,
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+        Index(
+            "ix_topic_delete_jobs_user_id",
+            "user_id",
+        ),
+    )
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey(
+            "users.id",
+            ondelete="CASCADE",
+        )
+    )
+    topic_id: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+    )
+    status: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        server_default="pending",
+    )
+    total_words: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+    )
+    deleted_words: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+    )
+    # Moved on by every batch; a running job that stops moving is stale.
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=func.timezone("utc", func.now()),
+    )
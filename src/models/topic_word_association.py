@@ -1,5 +1,5 @@
 from typing import TYPE_CHECKING
-from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -17,6 +17,19 @@ class TopicWordAssociation(Base):
             "word_id",
             name="idx_unique_topic_word",
         ),
+        # Copy of words.learnt_word so "one spelling per topic" can be
+        # enforced by an index instead of a check-then-insert race.
+        UniqueConstraint(
+            "topic_id",
+            "learnt_word",
+            name="idx_unique_topic_learnt_word",
+        ),
+        # (topic_id, word_id) is served by idx_unique_topic_word; lookups
+        # from the word side (ownership checks, cascades) need their own.
+        Index(
+            "ix_topic_word_association_word_id",
+            "word_id",
+        ),
     )
 
     word_id: Mapped[int] = mapped_column(
@@ -31,6 +44,10 @@ class TopicWordAssociation(Base):
             ondelete="CASCADE",
         )
     )
+    learnt_word: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+    )
 
     # association between Assocation -> Word
     word: Mapped["Word"] = relationship(
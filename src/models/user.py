@@ -2,7 +2,7 @@ from typing import TYPE_CHECKING
 from datetime import datetime
 
 from pydantic import EmailStr
-from sqlalchemy import String, Boolean, TIMESTAMP
+from sqlalchemy import String, Boolean, Integer, TIMESTAMP
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from .base import Base
 
@@ -52,6 +52,14 @@ class User(Base):
         default=False,
         nullable=False,
     )
+    # Bumped whenever one of the user's topics is created, changed or
+    # deleted; used as the ETag of the user's topic list.
+    vocabulary_revision: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
 
     topics: Mapped[list["Topic"]] = relationship(
         # "Topic",
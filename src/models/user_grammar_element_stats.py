@@ -0,0 +1,40 @@
+from sqlalchemy import ForeignKey, Integer, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class UserGrammarElementStats(Base):
+    """Number of words a user has per grammar element.
+
+    Kept up to date by the word write paths so the stats endpoint never has
+    to count over ``topic_word_association``.
+    """
+
+    __tablename__ = "user_grammar_element_stats"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "grammar_element_id",
+            name="idx_unique_user_grammar_element",
+        ),
+    )
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey(
+            "users.id",
+            ondelete="CASCADE",
+        )
+    )
+    grammar_element_id: Mapped[int] = mapped_column(
+        ForeignKey(
+            "grammar_elements.id",
+            ondelete="CASCADE",
+        )
+    )
+    word_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
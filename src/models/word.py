@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING
-from sqlalchemy import String, Text, ForeignKey
+from sqlalchemy import String, Text, ForeignKey, Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -11,6 +12,23 @@ if TYPE_CHECKING:
 
 
 class Word(Base):
+    __table_args__ = (
+        Index(
+            "ix_words_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+        Index(
+            "ix_words_learnt_word_trgm",
+            "learnt_word",
+            postgresql_using="gin",
+            postgresql_ops={"learnt_word": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_words_grammar_element_id",
+            "grammar_element_id",
+        ),
+    )
 
     learnt_word: Mapped[str] = mapped_column(
         String(20),
@@ -36,6 +54,16 @@ class Word(Base):
         ForeignKey("grammar_elements.id"),
     )
 
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple', learnt_word || ' ' || definition"
+            " || ' ' || coalesce(example, ''))",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
     grammar_element: Mapped["GrammarElement"] = relationship(
         back_populates="words",
     )
@@ -0,0 +1,117 @@
+import base64
+import binascii
+import json
+import math
+from typing import Annotated, Any, NamedTuple
+
+from fastapi import HTTPException, Query, status
+from sqlalchemy import Select, Result
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Range of the Integer primary keys, anything outside it can't be bound.
+MIN_ID = -(2**31)
+MAX_ID = 2**31 - 1
+
+
+class PageParams(NamedTuple):
+    after: Any
+    limit: int
+
+
+def invalid_cursor_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        detail=[
+            {
+                "type": "invalid_cursor",
+                "loc": ["query", "cursor"],
+                "msg": "This cursor is invalid.",
+            }
+        ],
+    )
+
+
+def encode_cursor(value: Any) -> str:
+    raw = json.dumps(value, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Any:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        return json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError):
+        raise invalid_cursor_error()
+
+
+def _is_id(value: Any) -> bool:
+    # bool is an int subclass, but true/false is never a valid key.
+    return (
+        isinstance(value, int)
+        and not isinstance(value, bool)
+        and MIN_ID <= value <= MAX_ID
+    )
+
+
+def _is_score(value: Any) -> bool:
+    # Scores are finite reals; huge ints overflow float and NaN/Infinity
+    # parse from JSON but never come out of ts_rank.
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        return False
+    try:
+        return math.isfinite(value)
+    except OverflowError:
+        return False
+
+
+async def page_params(
+    cursor: Annotated[str | None, Query()] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+) -> PageParams:
+    after = decode_cursor(cursor) if cursor is not None else None
+    if after is not None and not _is_id(after):
+        raise invalid_cursor_error()
+    return PageParams(after=after, limit=limit)
+
+
+async def ranked_page_params(
+    cursor: Annotated[str | None, Query()] = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+) -> PageParams:
+    # Cursor for results ordered by (score DESC, id DESC): [score, id].
+    after = decode_cursor(cursor) if cursor is not None else None
+    if after is not None and not (
+        isinstance(after, list)
+        and len(after) == 2
+        and _is_score(after[0])
+        and _is_id(after[1])
+    ):
+        raise invalid_cursor_error()
+    return PageParams(after=after, limit=limit)
+
+
+async def paginate(
+    session: AsyncSession,
+    stmt: Select,
+    key: InstrumentedAttribute,
+    page: PageParams,
+) -> dict:
+    # WHERE key > :after ORDER BY key LIMIT :n + 1, the extra row only tells
+    # whether another page exists.
+    if page.after is not None:
+        stmt = stmt.where(key > page.after)
+    stmt = stmt.order_by(key).limit(page.limit + 1)
+
+    result: Result = await session.execute(stmt)
+    items = list(result.scalars().all())
+
+    next_cursor = None
+    if len(items) > page.limit:
+        items = items[: page.limit]
+        next_cursor = encode_cursor(getattr(items[-1], key.key))
+
+    return {"items": items, "next_cursor": next_cursor}
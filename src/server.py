@@ -0,0 +1,96 @@
+"""Production entry point: gunicorn managing uvicorn workers.
+
+    python src/server.py
+
+Settings come from the SERVER_* variables (see ServerSettings). The app is
+built once in the master and forked into the workers, so its modules are
+shared copy-on-write; nothing at import time opens connections, each worker
+builds its own engine and warms it in the lifespan before it is ready to
+serve. On SIGTERM the master stops accepting connections and gives workers
+up to ``graceful_timeout_seconds`` to finish in-flight requests and run the
+lifespan shutdown (which flushes buffered review answers). For development
+``python src/main.py`` still runs a single reloading uvicorn.
+"""
+
+import glob
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent
+sys.path[:0] = [str(SRC.parent), str(SRC)]
+
+from gunicorn.app.base import BaseApplication  # noqa: E402
+from uvicorn.workers import UvicornWorker  # noqa: E402
+
+from src.config import settings  # noqa: E402
+
+# Left to the worker to shut down gracefully before gunicorn kills it.
+SHUTDOWN_MARGIN_SECONDS = 5
+
+
+class Worker(UvicornWorker):
+    CONFIG_KWARGS = {
+        "loop": "uvloop",
+        "http": "httptools",
+        "lifespan": "on",
+        "timeout_graceful_shutdown": max(
+            settings.server.graceful_timeout_seconds - SHUTDOWN_MARGIN_SECONDS, 1
+        ),
+    }
+
+
+def prepare_metrics_dir() -> None:
+    # Must happen before the app (and prometheus_client) is imported; values
+    # left over from a previous run of the server are dropped. A blank value
+    # counts as unset.
+    metrics_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR") or tempfile.mkdtemp(
+        prefix="vocabulary-metrics-"
+    )
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = metrics_dir
+    os.makedirs(metrics_dir, exist_ok=True)
+    for path in glob.glob(os.path.join(metrics_dir, "*.db")):
+        os.remove(path)
+
+
+def child_exit(server, worker) -> None:
+    from src import metrics
+
+    metrics.mark_process_dead(worker.pid)
+
+
+class Server(BaseApplication):
+    def __init__(self, options: dict):
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        from main import create_app
+
+        return create_app()
+
+
+def main() -> None:
+    prepare_metrics_dir()
+    Server(
+        {
+            "bind": f"{settings.server.host}:{settings.server.port}",
+            "workers": settings.server.workers,
+            "worker_class": "src.server.Worker",
+            "preload_app": True,
+            "keepalive": settings.server.keepalive_seconds,
+            "backlog": settings.server.backlog,
+            "timeout": settings.server.timeout_seconds,
+            "graceful_timeout": settings.server.graceful_timeout_seconds,
+            "child_exit": child_exit,
+        }
+    ).run()
+
+
+if __name__ == "__main__":
+    main()
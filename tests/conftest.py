@@ -0,0 +1,155 @@
+import os
+import sys
+import uuid
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import httpx
+import pytest
+from dotenv import load_dotenv
+
+ROOT = Path(__file__).resolve().parent.parent
+# The app is imported as ``main`` from src/, the way uvicorn runs it.
+sys.path[:0] = [str(ROOT), str(ROOT / "src")]
+
+# Only what importing src.config needs; a real .env or environment wins.
+load_dotenv()
+for name, value in {
+    "DB_HOST": "localhost",
+    "DB_PORT": "5432",
+    "DB_NAME": "postgres",
+    "DB_USER": "postgres",
+    "DB_PASS": "postgres",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+    "REFRESH_TOKEN_EXPIRE_DAYS": "7",
+    "ALGORITHM": "HS256",
+    "JWT_SECRET_KEY": "test-secret",
+    "JWT_REFRESH_SECRET_KEY": "test-refresh-secret",
+}.items():
+    os.environ.setdefault(name, value)
+
+PASSWORD = "password1"
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def db():
+    """The configured database, migrated with ``alembic upgrade head``.
+
+    Tests that need it are skipped when it cannot be reached. Each test gets
+    fresh connections: asyncpg ties them to the event loop they opened on.
+    """
+    from sqlalchemy import text
+
+    from src.models import db_helper
+
+    try:
+        async with db_helper.engine.connect() as connection:
+            await connection.execute(text("SELECT 1 FROM alembic_version"))
+    except Exception as exc:
+        await db_helper.dispose()
+        pytest.skip(f"No migrated database available: {exc}")
+    yield db_helper
+    await db_helper.dispose()
+
+
+@pytest.fixture
+async def client(db):
+    from main import create_app
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=create_app()),
+        base_url="http://test/api/v1",
+    ) as client:
+        yield client
+
+
+@asynccontextmanager
+async def new_vocabulary(db, client: httpx.AsyncClient):
+    """A logged-in user with one topic, and the reference rows it needs.
+
+    Everything is created under unique names and removed afterwards, so the
+    tests can share a database with other data.
+    """
+    from sqlalchemy import text
+
+    suffix = uuid.uuid4().hex[:8]
+    username = f"test-{suffix}"
+    response = await client.post(
+        "/auth/user/",
+        json={
+            "username": username,
+            "hashed_password": PASSWORD,
+            "email": f"{username}@example.com",
+        },
+    )
+    assert response.status_code == 201, response.text
+    user_id = response.json()["id"]
+    response = await client.post(
+        "/auth/user/token/", data={"username": username, "password": PASSWORD}
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    language = await client.post("/language/", json={"name": f"lang-{suffix}"})
+    grammar_element_ids = []
+    for name in ("noun", "verb"):
+        response = await client.post(
+            "/grammar_element/", json={"name": f"{name}-{suffix}"}
+        )
+        grammar_element_ids.append(response.json()["id"])
+    topic = await client.post(
+        "/topic/",
+        json={"name": f"topic-{suffix}", "language_id": language.json()["id"]},
+        headers=headers,
+    )
+    assert topic.status_code == 200, topic.text
+
+    yield {
+        "user_id": user_id,
+        "headers": headers,
+        "language_id": language.json()["id"],
+        "grammar_element_id": grammar_element_ids[0],
+        "other_grammar_element_id": grammar_element_ids[1],
+        "topic_id": topic.json()["id"],
+    }
+
+    async with db.session_factory() as session:
+        params = {"user_id": user_id}
+        await session.execute(
+            text(
+                "DELETE FROM words WHERE id IN (SELECT word_id FROM "
+                "topic_word_association JOIN topics ON topics.id = topic_id "
+                "WHERE topics.user_id = :user_id)"
+            ),
+            params,
+        )
+        await session.execute(
+            text("DELETE FROM topics WHERE user_id = :user_id"), params
+        )
+        await session.execute(text("DELETE FROM users WHERE id = :user_id"), params)
+        await session.execute(
+            text("DELETE FROM grammar_elements WHERE id = ANY(:ids)"),
+            {"ids": grammar_element_ids},
+        )
+        await session.execute(
+            text("DELETE FROM languages WHERE id = :id"),
+            {"id": language.json()["id"]},
+        )
+        await session.commit()
+
+
+@pytest.fixture
+async def vocabulary(db, client):
+    async with new_vocabulary(db, client) as vocabulary:
+        yield vocabulary
+
+
+@pytest.fixture
+async def other_vocabulary(db, client):
+    # A second user, for checks that one user cannot touch another's words.
+    async with new_vocabulary(db, client) as vocabulary:
+        yield vocabulary
@@ -0,0 +1,33 @@
+from sqlalchemy import column, select
+from sqlalchemy.dialects import postgresql
+
+from api.batch import any_id, in_request_order
+
+
+def rows(*ids: int) -> list[dict]:
+    return [{"id": id_, "name": f"item {id_}"} for id_ in ids]
+
+
+def test_items_follow_the_requested_order():
+    result = in_request_order(rows(1, 2, 3), [3, 1, 2])
+    assert [item["id"] for item in result["items"]] == [3, 1, 2]
+    assert result["missing"] == []
+
+
+def test_ids_without_a_row_are_missing():
+    result = in_request_order(rows(2), [5, 2, 7])
+    assert [item["id"] for item in result["items"]] == [2]
+    assert result["missing"] == [5, 7]
+
+
+def test_repeated_ids_are_returned_once():
+    result = in_request_order(rows(1, 2), [2, 1, 2, 9, 9])
+    assert [item["id"] for item in result["items"]] == [2, 1]
+    assert result["missing"] == [9]
+
+
+def test_any_id_binds_one_parameter():
+    stmt = select(column("id")).where(column("id") == any_id([1, 2, 3]))
+    compiled = stmt.compile(dialect=postgresql.asyncpg.dialect())
+    assert len(compiled.params) == 1
+    assert list(compiled.params.values()) == [[1, 2, 3]]
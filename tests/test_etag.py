@@ -0,0 +1,56 @@
+import pytest
+from fastapi import Response
+from pydantic import BaseModel
+from starlette.requests import Request
+
+from api.etag import conditional_response, content_etag, etag_matches, make_etag
+
+
+def request_with(if_none_match: str | None = None) -> Request:
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+def test_make_etag():
+    assert make_etag("topics", 3, 7) == '"topics-3-7"'
+
+
+def test_content_etag_follows_the_content():
+    etag = content_etag("word", Item(id=1, name="apple"))
+    assert etag == content_etag("word", Item(id=1, name="apple"))
+    assert etag != content_etag("word", Item(id=1, name="pear"))
+
+
+@pytest.mark.parametrize(
+    "header, matches",
+    [
+        (None, False),
+        ('"topics-1-2"', True),
+        ('W/"topics-1-2"', True),
+        ('"other", "topics-1-2"', True),
+        (' "other" ,W/"topics-1-2" ', True),
+        ("*", True),
+        ('"topics-1-3"', False),
+        ("topics-1-2", False),
+        ("", False),
+    ],
+)
+def test_etag_matches(header, matches):
+    assert etag_matches(request_with(header), '"topics-1-2"') is matches
+
+
+def test_conditional_response():
+    response = Response()
+    assert conditional_response(request_with(), response, '"a"') is None
+    assert response.headers["etag"] == '"a"'
+
+    not_modified = conditional_response(request_with('"a"'), Response(), '"a"')
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == '"a"'
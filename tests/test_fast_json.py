@@ -0,0 +1,73 @@
+import inspect
+
+import pytest
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
+
+from main import create_app
+from src.config import settings
+
+pytestmark = pytest.mark.anyio
+
+# Routes that return fast_json_response and so skip response_model
+# validation; their output is checked against the response_model below.
+FAST_ROUTES = {
+    ("GET", "/topic/all-user-topics/"),
+    ("POST", "/topic/batch/"),
+    ("GET", "/word/all-user-words/"),
+    ("POST", "/word/batch/"),
+}
+
+
+def api_routes() -> dict[tuple[str, str], APIRoute]:
+    routes = {}
+    for route in create_app().routes:
+        if isinstance(route, APIRoute):
+            path = route.path.removeprefix(settings.api_v1_prefix)
+            for method in route.methods:
+                routes[method, path] = route
+    return routes
+
+
+def test_every_fast_route_is_covered():
+    fast = {
+        key
+        for key, route in api_routes().items()
+        if "fast_json_response" in inspect.getsource(route.endpoint)
+    }
+    assert fast == FAST_ROUTES
+
+
+async def test_fast_output_matches_the_response_model(client, vocabulary):
+    topic_id = vocabulary["topic_id"]
+    headers = vocabulary["headers"]
+    word_ids = []
+    for learnt_word in ("apple", "pear"):
+        response = await client.post(
+            f"/word/?topic_id={topic_id}",
+            json={
+                "learnt_word": learnt_word,
+                "definition": "definition",
+                "example": "example",
+                "grammar_element_id": vocabulary["grammar_element_id"],
+            },
+            headers=headers,
+        )
+        word_ids.append(response.json()["id"])
+
+    requests = {
+        ("GET", "/topic/all-user-topics/"): {},
+        ("POST", "/topic/batch/"): {"json": {"ids": [topic_id, 2**31 - 1]}},
+        ("GET", "/word/all-user-words/"): {"params": {"topic_id": topic_id}},
+        ("POST", "/word/batch/"): {"json": {"ids": [*word_ids, 2**31 - 1]}},
+    }
+    routes = api_routes()
+    for (method, path), kwargs in requests.items():
+        response = await client.request(method, path, headers=headers, **kwargs)
+        assert response.status_code == 200, response.text
+        body = response.json()
+        assert body, path
+
+        adapter = TypeAdapter(routes[method, path].response_model)
+        validated = adapter.dump_python(adapter.validate_python(body), mode="json")
+        assert body == validated, path
@@ -0,0 +1,12 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("path", ["/health/db-pool/", "/health/review-buffer/"])
+async def test_health_requires_a_user(client, vocabulary, path):
+    response = await client.get(path)
+    assert response.status_code == 401
+
+    response = await client.get(path, headers=vocabulary["headers"])
+    assert response.status_code == 200, response.text
@@ -0,0 +1,16 @@
+import httpx
+import pytest
+
+from main import create_app
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_metrics_are_rendered():
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=create_app()), base_url="http://test"
+    ) as client:
+        response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert "review_buffer_depth" in response.text
+    assert "review_buffer_flush_duration_seconds" in response.text
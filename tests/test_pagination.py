@@ -0,0 +1,73 @@
+import pytest
+from fastapi import HTTPException
+
+from src.pagination import (
+    MAX_ID,
+    MIN_ID,
+    decode_cursor,
+    encode_cursor,
+    page_params,
+    ranked_page_params,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("value", [0, 42, MAX_ID, [0.5, 7], None])
+def test_cursor_round_trip(value):
+    cursor = encode_cursor(value)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == value
+
+
+@pytest.mark.parametrize("cursor", ["!!!", "a", encode_cursor(1)[:-1] + "~"])
+def test_decode_rejects_garbage(cursor):
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor)
+    assert exc.value.status_code == 422
+    assert exc.value.detail[0]["type"] == "invalid_cursor"
+
+
+async def test_page_params_without_cursor():
+    page = await page_params(cursor=None, limit=10)
+    assert page.after is None
+    assert page.limit == 10
+
+
+async def test_page_params_accepts_an_id():
+    page = await page_params(cursor=encode_cursor(MAX_ID), limit=10)
+    assert page.after == MAX_ID
+
+
+@pytest.mark.parametrize(
+    "value", [True, False, 1.5, "1", [1], MAX_ID + 1, MIN_ID - 1, 10**30]
+)
+async def test_page_params_rejects_non_ids(value):
+    with pytest.raises(HTTPException) as exc:
+        await page_params(cursor=encode_cursor(value), limit=10)
+    assert exc.value.detail[0]["type"] == "invalid_cursor"
+
+
+async def test_ranked_page_params_accepts_score_and_id():
+    page = await ranked_page_params(cursor=encode_cursor([0.25, 7]), limit=10)
+    assert page.after == [0.25, 7]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        7,
+        [0.25],
+        [True, 7],
+        [0.25, True],
+        [0.25, 7.0],
+        [0.25, MAX_ID + 1],
+        [10**400, 7],
+        [float("nan"), 7],
+        [float("inf"), 7],
+    ],
+)
+async def test_ranked_page_params_rejects_bad_cursors(value):
+    with pytest.raises(HTTPException) as exc:
+        await ranked_page_params(cursor=encode_cursor(value), limit=10)
+    assert exc.value.detail[0]["type"] == "invalid_cursor"
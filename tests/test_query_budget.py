@@ -0,0 +1,54 @@
+import pytest
+
+from api.query_stats import QueryBudgetExceeded, query_budget
+
+pytestmark = pytest.mark.anyio
+
+
+def new_word(vocabulary: dict, learnt_word: str) -> dict:
+    return {
+        "learnt_word": learnt_word,
+        "definition": "definition",
+        "example": "example",
+        "grammar_element_id": vocabulary["grammar_element_id"],
+    }
+
+
+async def test_create_word_is_one_statement(client, vocabulary):
+    with query_budget(1):
+        response = await client.post(
+            f"/word/?topic_id={vocabulary['topic_id']}",
+            json=new_word(vocabulary, "apple"),
+            headers=vocabulary["headers"],
+        )
+    assert response.status_code == 200, response.text
+
+
+async def test_word_list_does_not_grow_with_the_topic(client, vocabulary):
+    for learnt_word in ("apple", "pear", "plum"):
+        await client.post(
+            f"/word/?topic_id={vocabulary['topic_id']}",
+            json=new_word(vocabulary, learnt_word),
+            headers=vocabulary["headers"],
+        )
+
+    with query_budget(3):
+        response = await client.get(
+            f"/word/all-user-words/?topic_id={vocabulary['topic_id']}",
+            headers=vocabulary["headers"],
+        )
+    assert len(response.json()) == 3
+
+
+async def test_topic_list(client, vocabulary):
+    with query_budget(2):
+        response = await client.get(
+            "/topic/all-user-topics/", headers=vocabulary["headers"]
+        )
+    assert response.status_code == 200
+
+
+async def test_budget_exceeded(client, vocabulary):
+    with pytest.raises(QueryBudgetExceeded):
+        with query_budget(0):
+            await client.get("/topic/all-user-topics/", headers=vocabulary["headers"])
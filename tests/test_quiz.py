@@ -0,0 +1,50 @@
+import pytest
+from fastapi import HTTPException
+
+from api.crud.quiz_crud import _question_id, check_quiz_answer
+from api.schemas.quiz_schemas import QuizAnswer
+from src.config import settings
+
+
+def error_type(exc: pytest.ExceptionInfo) -> str:
+    return exc.value.detail[0]["type"]
+
+
+def test_answer_is_checked_against_the_signed_choice():
+    question_id = _question_id(user_id=1, answer_choice_id=2)
+
+    right = check_quiz_answer(1, QuizAnswer(question_id=question_id, choice_id=2))
+    wrong = check_quiz_answer(1, QuizAnswer(question_id=question_id, choice_id=0))
+
+    assert right == {"correct": True, "answer_choice_id": 2}
+    assert wrong == {"correct": False, "answer_choice_id": 2}
+
+
+@pytest.mark.parametrize("question_id", ["garbage", "a.b.c", "a..", ""])
+def test_unknown_question_ids_are_rejected(question_id):
+    with pytest.raises(HTTPException) as exc:
+        check_quiz_answer(1, QuizAnswer(question_id=question_id, choice_id=0))
+    assert error_type(exc) == "quiz_question_unknown"
+
+
+def test_question_ids_are_bound_to_the_user():
+    question_id = _question_id(user_id=1, answer_choice_id=0)
+    with pytest.raises(HTTPException) as exc:
+        check_quiz_answer(2, QuizAnswer(question_id=question_id, choice_id=0))
+    assert error_type(exc) == "quiz_question_unknown"
+
+
+def test_issue_time_cannot_be_changed():
+    nonce, issued_at, mac = _question_id(user_id=1, answer_choice_id=0).split(".")
+    question_id = f"{nonce}.{int(issued_at) + 60}.{mac}"
+    with pytest.raises(HTTPException) as exc:
+        check_quiz_answer(1, QuizAnswer(question_id=question_id, choice_id=0))
+    assert error_type(exc) == "quiz_question_unknown"
+
+
+def test_old_question_ids_expire(monkeypatch):
+    question_id = _question_id(user_id=1, answer_choice_id=0)
+    monkeypatch.setattr(settings, "quiz_question_ttl_seconds", -1)
+    with pytest.raises(HTTPException) as exc:
+        check_quiz_answer(1, QuizAnswer(question_id=question_id, choice_id=0))
+    assert error_type(exc) == "quiz_question_expired"
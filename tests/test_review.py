@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from api.crud.review_crud import review_answers_update
+from src.models import ReviewCard
+
+pytestmark = pytest.mark.anyio
+
+REVIEWED_AT = datetime(2026, 1, 1, 12)
+
+
+@pytest.mark.parametrize(
+    "card, quality, expected",
+    [
+        # (interval_days, ease, repetitions, lapses) before and after.
+        ((0, 2500, 0, 0), 4, (1, 2500, 1, 0)),
+        ((1, 2500, 1, 0), 5, (6, 2600, 2, 0)),
+        ((6, 2500, 2, 0), 3, (15, 2360, 3, 0)),
+        ((15, 2360, 3, 0), 1, (1, 2360, 0, 1)),
+        ((10, 1300, 2, 4), 3, (13, 1300, 3, 4)),
+        ((6, 9990, 2, 0), 5, (60, 10000, 3, 0)),
+        ((30000, 2500, 5, 0), 4, (36500, 2500, 6, 0)),
+    ],
+)
+async def test_sm2_update(client, vocabulary, db, card, quality, expected):
+    response = await client.post(
+        f"/word/?topic_id={vocabulary['topic_id']}",
+        json={
+            "learnt_word": "apple",
+            "definition": "definition",
+            "example": "example",
+            "grammar_element_id": vocabulary["grammar_element_id"],
+        },
+        headers=vocabulary["headers"],
+    )
+    word_id = response.json()["id"]
+    user_id = vocabulary["user_id"]
+    interval_days, ease, repetitions, lapses = card
+
+    async with db.session_factory() as session:
+        await session.execute(
+            update(ReviewCard)
+            .where(ReviewCard.user_id == user_id, ReviewCard.word_id == word_id)
+            .values(
+                interval_days=interval_days,
+                ease=ease,
+                repetitions=repetitions,
+                lapses=lapses,
+            )
+        )
+        result = await session.execute(
+            review_answers_update(
+                [
+                    {
+                        "user_id": user_id,
+                        "word_id": word_id,
+                        "quality": quality,
+                        "reviewed_at": REVIEWED_AT,
+                    }
+                ]
+            )
+        )
+        row = result.one()
+        await session.rollback()
+
+    assert (row.interval_days, row.ease, row.repetitions, row.lapses) == expected
+    assert row.due_at == REVIEWED_AT + timedelta(days=expected[0])
+    assert row.last_reviewed_at == REVIEWED_AT
+
+
+async def test_answers_for_unknown_cards_update_nothing(vocabulary, db):
+    async with db.session_factory() as session:
+        result = await session.execute(
+            review_answers_update(
+                [
+                    {
+                        "user_id": vocabulary["user_id"],
+                        "word_id": 2**31 - 1,
+                        "quality": 5,
+                        "reviewed_at": REVIEWED_AT,
+                    }
+                ]
+            )
+        )
+        assert result.all() == []
@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+
+import pytest
+from prometheus_client import REGISTRY
+
+from api import review_buffer as review_buffer_module
+from api.review_buffer import ReviewBuffer, ReviewBufferFull
+from api.schemas.review_schemas import ReviewAnswer
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeSession:
+    def __init__(self, fail: bool):
+        self.fail = fail
+        self.statements = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, stmt):
+        if self.fail:
+            raise ConnectionError("database is down")
+        self.statements.append(stmt)
+        return SimpleNamespace(all=list)
+
+    async def commit(self):
+        pass
+
+
+@pytest.fixture
+def session(monkeypatch):
+    fake = FakeSession(fail=False)
+    monkeypatch.setattr(
+        review_buffer_module, "db_helper", SimpleNamespace(session_factory=lambda: fake)
+    )
+    return fake
+
+
+def answer(word_id: int, quality: int) -> ReviewAnswer:
+    return ReviewAnswer(word_id=word_id, quality=quality)
+
+
+def flush_count(outcome: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "review_buffer_flush_duration_seconds_count", {"outcome": outcome}
+        )
+        or 0
+    )
+
+
+def test_answers_are_coalesced_per_card():
+    buffer = ReviewBuffer(flush_size=10, flush_interval=1, max_pending=10)
+    buffer.add(1, [answer(5, 2), answer(6, 4)])
+    buffer.add(1, [answer(5, 5)])
+    buffer.add(2, [answer(5, 3)])
+
+    assert buffer.depth == 3
+    assert buffer.accepted == 4
+    assert buffer.coalesced == 1
+    assert buffer._pending[(1, 5)]["quality"] == 5
+
+
+def test_max_pending_refuses_new_answers():
+    buffer = ReviewBuffer(flush_size=10, flush_interval=1, max_pending=2)
+    buffer.add(1, [answer(5, 2), answer(6, 4)])
+
+    with pytest.raises(ReviewBufferFull):
+        buffer.add(1, [answer(7, 4)])
+    assert buffer.depth == 2
+
+
+async def test_flush_writes_in_chunks(session):
+    buffer = ReviewBuffer(flush_size=2, flush_interval=1, max_pending=10)
+    buffer.add(1, [answer(word_id, 4) for word_id in range(1, 6)])
+    written = flush_count("written")
+
+    await buffer.flush()
+
+    assert len(session.statements) == 3
+    assert buffer.depth == 0
+    assert buffer.flushes == 3
+    assert flush_count("written") == written + 3
+
+
+async def test_failed_flush_puts_answers_back(session):
+    buffer = ReviewBuffer(flush_size=10, flush_interval=1, max_pending=10)
+    buffer.add(1, [answer(5, 2), answer(6, 4)])
+    failed = flush_count("failed")
+
+    session.fail = True
+    await buffer.flush()
+
+    assert buffer.depth == 2
+    assert buffer.failed_flushes == 1
+    assert flush_count("failed") == failed + 1
+
+    # A newer answer received before the retry is the one written.
+    buffer.add(1, [answer(5, 5)])
+    assert buffer._pending[(1, 5)]["quality"] == 5
+
+    session.fail = False
+    await buffer.flush()
+    assert buffer.depth == 0
+    assert len(session.statements) == 1
@@ -0,0 +1,126 @@
+import pytest
+from sqlalchemy import text
+
+from src.config import settings
+
+pytestmark = pytest.mark.anyio
+
+
+async def add_words(client, vocabulary: dict, *learnt_words: str) -> None:
+    for learnt_word in learnt_words:
+        response = await client.post(
+            f"/word/?topic_id={vocabulary['topic_id']}",
+            json={
+                "learnt_word": learnt_word,
+                "definition": "definition",
+                "example": "example",
+                "grammar_element_id": vocabulary["grammar_element_id"],
+            },
+            headers=vocabulary["headers"],
+        )
+        assert response.status_code == 200, response.text
+
+
+async def insert_active_job(db, vocabulary: dict, minutes_ago: int = 0) -> int:
+    async with db.session_factory() as session:
+        job_id = await session.scalar(
+            text(
+                "INSERT INTO topic_delete_jobs (user_id, topic_id, updated_at) "
+                "VALUES (:user_id, :topic_id, "
+                "timezone('utc', now()) - make_interval(mins => :minutes)) "
+                "RETURNING id"
+            ),
+            {
+                "user_id": vocabulary["user_id"],
+                "topic_id": vocabulary["topic_id"],
+                "minutes": minutes_ago,
+            },
+        )
+        await session.commit()
+    return job_id
+
+
+async def test_job_deletes_the_topic_in_batches(client, vocabulary, monkeypatch):
+    monkeypatch.setattr(settings, "topic_delete_batch_size", 2)
+    await add_words(client, vocabulary, "apple", "pear", "plum", "kiwi", "fig")
+    headers = vocabulary["headers"]
+
+    # The background task has run by the time the in-process client returns.
+    response = await client.post(
+        f"/topic/{vocabulary['topic_id']}/delete-job/", headers=headers
+    )
+    assert response.status_code == 202, response.text
+    job = response.json()
+    assert job["total_words"] == 5
+
+    response = await client.get(f"/topic/delete-job/{job['id']}/", headers=headers)
+    assert response.json() == {
+        **job,
+        "status": "done",
+        "deleted_words": 5,
+    }
+    response = await client.get(f"/topic/{vocabulary['topic_id']}/", headers=headers)
+    assert response.status_code == 404
+    response = await client.get("/stats/", headers=headers)
+    assert response.json()["total_words"] == 0
+    assert all(row["word_count"] == 0 for row in response.json()["grammar_elements"])
+
+
+async def test_words_cannot_be_added_while_deleting(client, vocabulary, db):
+    await insert_active_job(db, vocabulary)
+
+    response = await client.post(
+        f"/word/?topic_id={vocabulary['topic_id']}",
+        json={
+            "learnt_word": "apple",
+            "definition": "definition",
+            "example": "example",
+            "grammar_element_id": vocabulary["grammar_element_id"],
+        },
+        headers=vocabulary["headers"],
+    )
+    assert response.status_code == 409
+    assert response.json()["detail"][0]["type"] == "topic_being_deleted"
+
+    response = await client.post(
+        f"/word/import/?topic_id={vocabulary['topic_id']}",
+        json=[],
+        headers=vocabulary["headers"],
+    )
+    assert response.status_code == 409
+
+
+async def test_active_job_is_returned_not_restarted(client, vocabulary, db):
+    job_id = await insert_active_job(db, vocabulary)
+
+    response = await client.post(
+        f"/topic/{vocabulary['topic_id']}/delete-job/", headers=vocabulary["headers"]
+    )
+    assert response.status_code == 202
+    assert response.json()["id"] == job_id
+    assert response.json()["status"] == "pending"
+
+
+async def test_stale_job_is_taken_over(client, vocabulary, db):
+    await add_words(client, vocabulary, "apple")
+    job_id = await insert_active_job(db, vocabulary, minutes_ago=60)
+
+    response = await client.post(
+        f"/topic/{vocabulary['topic_id']}/delete-job/", headers=vocabulary["headers"]
+    )
+    assert response.json()["id"] == job_id
+
+    response = await client.get(
+        f"/topic/delete-job/{job_id}/", headers=vocabulary["headers"]
+    )
+    assert response.json()["status"] == "done"
+    assert response.json()["deleted_words"] == 1
+
+
+async def test_jobs_are_private(client, vocabulary, other_vocabulary, db):
+    job_id = await insert_active_job(db, vocabulary)
+
+    response = await client.get(
+        f"/topic/delete-job/{job_id}/", headers=other_vocabulary["headers"]
+    )
+    assert response.status_code == 404
@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from api.crud.word_crud import parse_word_rows
+from src.config import settings
+
+pytestmark = pytest.mark.anyio
+
+
+def test_parse_json_array():
+    body = json.dumps([{"learnt_word": "apple"}, {"learnt_word": "pear"}])
+    rows = parse_word_rows(body.encode(), "application/json")
+    assert rows == [{"learnt_word": "apple"}, {"learnt_word": "pear"}]
+
+
+def test_parse_json_requires_an_array():
+    with pytest.raises(ValueError):
+        parse_word_rows(b'{"learnt_word": "apple"}', "application/json")
+
+
+def test_parse_ndjson_skips_blank_lines():
+    body = b'{"learnt_word": "apple"}\n\n{"learnt_word": "pear"}\n'
+    rows = parse_word_rows(body, "application/x-ndjson")
+    assert [row["learnt_word"] for row in rows] == ["apple", "pear"]
+
+
+def test_parse_csv_with_bom():
+    body = "﻿learnt_word,definition\napple,a fruit\n".encode()
+    rows = parse_word_rows(body, "text/csv; charset=utf-8")
+    assert rows == [{"learnt_word": "apple", "definition": "a fruit"}]
+
+
+def test_parse_malformed_json():
+    with pytest.raises(ValueError):
+        parse_word_rows(b"[{", "application/json")
+
+
+def import_row(vocabulary: dict, learnt_word: str) -> dict:
+    return {
+        "learnt_word": learnt_word,
+        "definition": "definition",
+        "example": "example",
+        "grammar_element_id": vocabulary["grammar_element_id"],
+    }
+
+
+async def test_import_reports_rows(client, vocabulary):
+    rows = [
+        import_row(vocabulary, "apple"),
+        import_row(vocabulary, "apple"),
+        {**import_row(vocabulary, "pear"), "grammar_element_id": 2**31 - 1},
+        {**import_row(vocabulary, "plum"), "grammar_element_id": 2**31},
+        {"learnt_word": 1},
+    ]
+    response = await client.post(
+        f"/word/import/?topic_id={vocabulary['topic_id']}",
+        json=rows,
+        headers=vocabulary["headers"],
+    )
+    assert response.status_code == 201, response.text
+    result = response.json()
+    assert result["created"] == 1
+    assert [error["row"] for error in result["errors"]] == [2, 3, 4, 5]
+
+
+async def test_import_row_limit(client, vocabulary, monkeypatch):
+    monkeypatch.setattr(settings, "word_import_max_rows", 2)
+    response = await client.post(
+        f"/word/import/?topic_id={vocabulary['topic_id']}",
+        json=[import_row(vocabulary, word) for word in ("a", "b", "c")],
+        headers=vocabulary["headers"],
+    )
+    assert response.status_code == 413
+    assert response.json()["detail"][0]["type"] == "import_too_large"
+
+
+async def test_import_size_limit(client, vocabulary, monkeypatch):
+    monkeypatch.setattr(settings, "word_import_max_bytes", 64)
+    response = await client.post(
+        f"/word/import/?topic_id={vocabulary['topic_id']}",
+        json=[import_row(vocabulary, "apple")] * 5,
+        headers=vocabulary["headers"],
+    )
+    assert response.status_code == 413
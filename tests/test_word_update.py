@@ -0,0 +1,153 @@
+import pytest
+from sqlalchemy import text
+
+from api.query_stats import query_budget
+
+pytestmark = pytest.mark.anyio
+
+
+async def create_word(client, vocabulary: dict, learnt_word: str, topic_id=None):
+    response = await client.post(
+        f"/word/?topic_id={topic_id or vocabulary['topic_id']}",
+        json={
+            "learnt_word": learnt_word,
+            "definition": "definition",
+            "example": "example",
+            "grammar_element_id": vocabulary["grammar_element_id"],
+        },
+        headers=vocabulary["headers"],
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["id"]
+
+
+async def new_topic(client, vocabulary: dict, name: str) -> int:
+    response = await client.post(
+        "/topic/",
+        json={
+            "name": f"{name}-{vocabulary['user_id']}",
+            "language_id": vocabulary["language_id"],
+        },
+        headers=vocabulary["headers"],
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["id"]
+
+
+async def test_update_is_one_statement(client, vocabulary):
+    word_id = await create_word(client, vocabulary, "apple")
+
+    with query_budget(1):
+        response = await client.patch(
+            f"/word/{word_id}/",
+            json={"learnt_word": "apples", "definition": "fruit"},
+            headers=vocabulary["headers"],
+        )
+    assert response.status_code == 202, response.text
+    assert response.json() == {
+        "id": word_id,
+        "learnt_word": "apples",
+        "definition": "fruit",
+        "example": "example",
+        "grammar_element_id": vocabulary["grammar_element_id"],
+    }
+
+    response = await client.get(
+        f"/word/all-user-words/?topic_id={vocabulary['topic_id']}",
+        headers=vocabulary["headers"],
+    )
+    assert [word["learnt_word"] for word in response.json()] == ["apples"]
+
+
+async def test_duplicates_are_checked_in_the_word_topics(client, vocabulary):
+    await create_word(client, vocabulary, "apple")
+    word_id = await create_word(client, vocabulary, "pear")
+    other_topic_id = await new_topic(client, vocabulary, "other")
+    await create_word(client, vocabulary, "plum", topic_id=other_topic_id)
+
+    # topic_id is no longer what the check looks at.
+    response = await client.patch(
+        f"/word/{word_id}/?topic_id={other_topic_id}",
+        json={"learnt_word": "apple"},
+        headers=vocabulary["headers"],
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "word_duplicate"
+
+    # A spelling used only in another topic is fine, and so is the word's own.
+    for learnt_word in ("plum", "plum"):
+        response = await client.patch(
+            f"/word/{word_id}/",
+            json={"learnt_word": learnt_word},
+            headers=vocabulary["headers"],
+        )
+        assert response.status_code == 202, response.text
+
+
+async def test_grammar_element_change_moves_stats(client, vocabulary):
+    word_id = await create_word(client, vocabulary, "apple")
+    await create_word(client, vocabulary, "pear")
+
+    response = await client.patch(
+        f"/word/{word_id}/",
+        json={"grammar_element_id": vocabulary["other_grammar_element_id"]},
+        headers=vocabulary["headers"],
+    )
+    assert response.status_code == 202, response.text
+
+    response = await client.get("/stats/", headers=vocabulary["headers"])
+    counts = {
+        row["grammar_element_id"]: row["word_count"]
+        for row in response.json()["grammar_elements"]
+    }
+    assert counts == {
+        vocabulary["grammar_element_id"]: 1,
+        vocabulary["other_grammar_element_id"]: 1,
+    }
+
+
+async def test_missing_grammar_element(client, vocabulary):
+    word_id = await create_word(client, vocabulary, "apple")
+    response = await client.patch(
+        f"/word/{word_id}/",
+        json={"grammar_element_id": 2**31 - 1},
+        headers=vocabulary["headers"],
+    )
+    assert response.status_code == 404
+    assert response.json()["detail"][0]["type"] == "grammar_element_id_taken"
+
+
+async def test_update_bumps_the_topic_revision(client, vocabulary, db):
+    word_id = await create_word(client, vocabulary, "apple")
+    query = text("SELECT revision FROM topics WHERE id = :id")
+    async with db.session_factory() as session:
+        before = await session.scalar(query, {"id": vocabulary["topic_id"]})
+
+    await client.patch(
+        f"/word/{word_id}/",
+        json={"definition": "fruit"},
+        headers=vocabulary["headers"],
+    )
+    async with db.session_factory() as session:
+        after = await session.scalar(query, {"id": vocabulary["topic_id"]})
+    assert after == before + 1
+
+
+async def test_other_users_words_cannot_be_updated(
+    client, vocabulary, other_vocabulary
+):
+    word_id = await create_word(client, other_vocabulary, "apple")
+
+    response = await client.patch(
+        f"/word/{word_id}/",
+        json={"definition": "mine now"},
+        headers=vocabulary["headers"],
+    )
+    assert response.status_code == 401
+
+    response = await client.patch(
+        f"/word/{2**31 - 1}/",
+        json={"definition": "nothing"},
+        headers=vocabulary["headers"],
+    )
+    assert response.status_code == 404